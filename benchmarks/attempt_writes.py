@@ -0,0 +1,110 @@
+"""
+Compare writing attempts from many concurrent players, a transaction per attempt against grouped transactions.
+
+Run it with `python -m benchmarks.attempt_writes`.
+"""
+
+import statistics
+import threading
+import time
+from typing import Callable, Dict, List
+
+from benchmarks.utils import report, temp_database
+from palabros import business
+from palabros.database import db_transaction
+from palabros.queries import Query
+from palabros.schemas import Game
+from palabros.writer import get_writer
+
+PLAYERS = 32
+ATTEMPTS = 100
+
+
+def _write_directly(game: Game, word: str) -> None:
+
+    """
+    Write an attempt the way it used to be done: in its own transaction.
+
+    Args:
+        game: The game the attempt belongs to.
+        word: The attempt word.
+    """
+
+    with db_transaction() as cur:
+        cur.execute(Query.CreateAttempt, (game.id, word, False, 0))
+
+
+def _write_behind(game: Game, word: str) -> None:
+
+    """
+    Write an attempt through the write-behind queue.
+
+    Args:
+        game: The game the attempt belongs to.
+        word: The attempt word.
+    """
+
+    get_writer().write(game, word, False, 0, False)
+
+
+def _run(write: Callable[[Game, str], None]) -> Dict[str, float]:
+
+    """
+    Write attempts from many players at once, each one from its own thread.
+
+    Args:
+        write: The function writing an attempt.
+
+    Returns:
+        The latency stats of every attempt, given in milliseconds, along with the attempts written per second.
+    """
+
+    games = [business.get_current_game(player_id=f"player-{i}") for i in range(PLAYERS)]
+    timings: List[float] = []
+
+    def play(game: Game) -> None:
+        for _ in range(ATTEMPTS):
+            start = time.perf_counter()
+            write(game, "leche")
+            timings.append((time.perf_counter() - start) * 1000)
+
+    threads = [threading.Thread(target=play, args=(game,)) for game in games]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    timings.sort()
+    print(f"{write.__name__:<32}{len(timings) / elapsed:>12.1f} attempts/s")
+    return {
+        "mean": statistics.mean(timings),
+        "p50": timings[len(timings) // 2],
+        "p99": timings[int(len(timings) * 0.99)],
+    }
+
+
+def main() -> None:
+
+    """
+    Run the benchmark.
+    """
+
+    print()
+    with temp_database():
+        direct = _run(_write_directly)
+    with temp_database():
+        grouped = _run(_write_behind)
+
+    report(
+        f"Attempt writes ({PLAYERS} concurrent players x {ATTEMPTS} attempts)",
+        {
+            "transaction per attempt": direct,
+            "write-behind queue": grouped,
+        },
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Measure how fast the hints revealed by a game are checked: guesses one by one, as hard mode does, and whole
+dictionaries at once, as hints do.
+
+Run it with `python -m benchmarks.constraints`.
+"""
+
+import json
+import random
+import time
+from typing import Callable, List, Sequence
+
+from palabros import constraints
+from palabros.business import WORD_LENGTH
+from palabros.database import _WORDS_JSON_PATH
+from palabros.normalization import normalize_batch
+from palabros.schemas import Attempt
+from palabros.scoring import score
+
+GAMES = 200
+
+
+def _rescore(words: Sequence[str], attempts: Sequence[Attempt]) -> List[str]:
+
+    """
+    Keep the words which would have got the same patterns as the attempts, scoring every word against them.
+
+    Args:
+        words: The words.
+        attempts: The attempts.
+
+    Returns:
+        The words left.
+    """
+
+    return [word for word in words if all(score(word, attempt.word) == attempt.pattern for attempt in attempts)]
+
+
+def _rate(func: Callable[[], object], total: int) -> float:
+
+    """
+    Measure how many words per second the given function checks.
+
+    Args:
+        func: The function checking all the words.
+        total: The number of words.
+
+    Returns:
+        The words checked per second.
+    """
+
+    start = time.perf_counter()
+    func()
+    return total / (time.perf_counter() - start)
+
+
+def main() -> None:
+
+    """
+    Run the benchmark.
+    """
+
+    with open(_WORDS_JSON_PATH) as f:
+        words = sorted({word for word in normalize_batch(list(json.load(f))) if len(word) == WORD_LENGTH})
+
+    rnd = random.Random(0)
+    games = []
+    for _ in range(GAMES):
+        seed = rnd.choice(words)
+        attempts = [
+            Attempt(i, guess, False, pattern=score(seed, guess)) for i, guess in enumerate(rnd.sample(words, 2))
+        ]
+        games.append((attempts, constraints.from_attempts(attempts, WORD_LENGTH)))
+    guesses = rnd.choices(words, k=len(words))
+    total = GAMES * len(words)
+
+    def compiled_once() -> None:
+        for _, compiled in games:
+            for guess in guesses:
+                compiled.find_violation(guess)
+
+    def matches() -> None:
+        for _, compiled in games:
+            for word in words:
+                compiled.matches(word)
+
+    def filter_words() -> None:
+        for _, compiled in games:
+            constraints.filter_words(words, compiled)
+
+    def rescore() -> None:
+        for attempts, _ in games:
+            _rescore(words, attempts)
+
+    print(f"\nChecking {len(words)} words against {GAMES} games of 2 attempts\n")
+    print(f"{'case':<32}{'words/s':>12}")
+    print(f"{'hard mode (find_violation)':<32}{_rate(compiled_once, total):>12.0f}")
+    print(f"{'candidates (rescoring)':<32}{_rate(rescore, total):>12.0f}")
+    print(f"{'candidates (matches)':<32}{_rate(matches, total):>12.0f}")
+    print(f"{'candidates (filter_words)':<32}{_rate(filter_words, total):>12.0f}\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Compare the latency of loading the current game against the former multi-connection path.
+
+Run it with `python -m benchmarks.current_game`.
+"""
+
+import sqlite3
+from datetime import datetime
+
+from benchmarks.utils import measure, report, temp_database
+from palabros import business
+from palabros.schemas import DEFAULT_PLAYER
+
+# The queries the former path ran, a game and then its attempts
+_LEGACY_GET_GAME_BY_DATE = """
+    SELECT g.id, g.word, g.date FROM games AS g WHERE g.player_id = ? AND g.date = ? AND g.length = ?;
+"""
+_LEGACY_GET_ATTEMPTS_BY_GAME = """
+    SELECT a.id, a.word, a.match FROM attempts AS a WHERE a.game_id = ?;
+"""
+
+
+def _legacy_get_current_game(db_path: str) -> None:
+
+    """
+    Load the current game the way it used to be done: a new connection per query.
+
+    Args:
+        db_path: The database path.
+    """
+
+    today = datetime.now().strftime("%Y%m%d")
+
+    with sqlite3.connect(db_path, isolation_level=None) as conn:
+        conn.row_factory = sqlite3.Row
+        game = conn.execute(_LEGACY_GET_GAME_BY_DATE, (DEFAULT_PLAYER, today, business.WORD_LENGTH)).fetchone()
+    conn.close()
+
+    with sqlite3.connect(db_path, isolation_level=None) as conn:
+        conn.row_factory = sqlite3.Row
+        attempts = conn.execute(_LEGACY_GET_ATTEMPTS_BY_GAME, (game["id"],)).fetchall()
+    conn.close()
+
+    for attempt in attempts:
+        business._inspect_attempt(game["word"], attempt["word"])
+
+
+def main() -> None:
+
+    """
+    Run the benchmark.
+    """
+
+    with temp_database() as db_path:
+        game = business.get_current_game()
+        for word in ("leche", "mundo", "mayor"):
+            business.play_game(game, word)
+
+        report(
+            "get_current_game (ongoing game, 3 attempts)",
+            {
+                "legacy (connection per query)": measure(lambda: _legacy_get_current_game(db_path)),
+                "single round trip": measure(business.get_current_game),
+            },
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Compare loading a long game history with stored attempt patterns against scoring every attempt again.
+
+Run it with `python -m benchmarks.game_history`.
+"""
+
+from datetime import date, timedelta
+from typing import List
+
+from benchmarks.utils import measure, report, temp_database
+from palabros import business, storage
+from palabros.database import db_cursor, db_transaction
+from palabros.queries import Query
+from palabros.schemas import DEFAULT_PLAYER, MAX_ATTEMPTS
+from palabros.scoring import score
+
+DAYS = 365
+ATTEMPTS = ("leche", "mundo", "mayor", "huevo", "coche", "perro")
+
+
+def _load_history(dates: List[str]) -> None:
+
+    """
+    Load every game of the history, as the results view or a history replay does.
+
+    Args:
+        dates: The date of every game.
+    """
+
+    for day in dates:
+        business.get_game(day)
+
+
+def _load_history_cold(dates: List[str]) -> None:
+
+    """
+    Load every game of the history, with the memo of the attempts without pattern emptied beforehand.
+
+    Args:
+        dates: The date of every game.
+    """
+
+    storage._score_stored_attempt.cache_clear()
+    _load_history(dates)
+
+
+def main() -> None:
+
+    """
+    Run the benchmark.
+    """
+
+    with temp_database():
+        with db_cursor() as cur:
+            cur.execute("SELECT word FROM words ORDER BY frequency DESC LIMIT ?;", (DAYS,))
+            seeds = [row["word"] for row in cur.fetchall()]
+
+        start = date.today() - timedelta(days=DAYS)
+        dates = [(start + timedelta(days=i)).strftime("%Y%m%d") for i in range(DAYS)]
+
+        with db_transaction() as cur:
+            for seed, day in zip(seeds, dates):
+                cur.execute(Query.CreateGameIfNotExists, (DEFAULT_PLAYER, seed, day, MAX_ATTEMPTS, False))
+                game_id = cur.lastrowid
+                for word in ATTEMPTS:
+                    cur.execute(Query.CreateAttempt, (game_id, word, False, score(seed.upper(), word.upper())))
+
+        stored = measure(lambda: _load_history(dates), rounds=20, warmup=2)
+
+        with db_transaction() as cur:
+            cur.execute("UPDATE attempts SET pattern = NULL;")
+
+        report(
+            f"Load {DAYS} games x {len(ATTEMPTS)} attempts",
+            {
+                "scored again (cold memo)": measure(lambda: _load_history_cold(dates), rounds=20, warmup=2),
+                "scored again (warm memo)": measure(lambda: _load_history(dates), rounds=20, warmup=2),
+                "stored patterns": stored,
+            },
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""
+Compare replaying a game history through `business.play_game` against importing it in chunked transactions, and
+check the memory used by the import doesn't grow with the history size.
+
+Run it with `python -m benchmarks.history_import`.
+"""
+
+import json
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+from datetime import date, timedelta
+from pathlib import Path
+from typing import List, Tuple
+
+from benchmarks.utils import temp_database
+from palabros import business, history
+from palabros.database import db_cursor
+from palabros.queries import Query
+from palabros.schemas import Game
+
+PLAYERS = 20
+DAYS = (100, 1000)
+REPLAYED_GAMES = 200
+
+
+def _get_words() -> List[str]:
+
+    """
+    Get the most frequent words of the dictionary.
+
+    Returns:
+        The words.
+    """
+
+    with db_cursor() as cur:
+        cur.execute(Query.GetWords)
+        return [row["word"] for row in cur.fetchall()[:500]]
+
+
+def _write_history(path: Path, words: List[str], days: int) -> int:
+
+    """
+    Write a random game history, a game per player and day.
+
+    Args:
+        path: The history file path.
+        words: The words to play with.
+        days: The number of days.
+
+    Returns:
+        The number of attempts written.
+    """
+
+    rng = random.Random(0)
+    start = date.today() - timedelta(days=days + 1)
+    total = 0
+
+    with open(path, "w", encoding="utf-8") as f:
+        for player in range(PLAYERS):
+            for day in range(days):
+                seed = rng.choice(words)
+                attempts = rng.sample(words, rng.randint(1, 5)) + [seed]
+                attempts = attempts[: attempts.index(seed) + 1]
+                game = {
+                    "player": f"player-{player}",
+                    "date": (start + timedelta(days=day)).strftime("%Y%m%d"),
+                    "word": seed,
+                    "attempts": attempts,
+                }
+                f.write(json.dumps(game) + "\n")
+                total += len(attempts)
+
+    return total
+
+
+def _replay(path: Path) -> Tuple[int, float]:
+
+    """
+    Replay the first games of a history file one attempt at a time, the only way before imports existed.
+
+    Args:
+        path: The history file path.
+
+    Returns:
+        The number of attempts written, and the attempts written per second.
+    """
+
+    with open(path, encoding="utf-8") as f:
+        games = [game for game, _ in zip(history.read_games(f), range(REPLAYED_GAMES))]
+
+    total = 0
+    start = time.perf_counter()
+
+    for record in games:
+        with db_cursor() as cur:
+            cur.execute(
+                Query.CreateGameIfNotExists,
+                (record.player_id, record.word, record.date, record.max_attempts, record.hard),
+            )
+            game = Game(cur.lastrowid, record.word, record.date, [], player_id=record.player_id)
+        for word in record.attempts:
+            game.attempts.append(business.play_game(game, word))
+            total += 1
+
+    return total, total / (time.perf_counter() - start)
+
+
+def main() -> None:
+
+    """
+    Run the benchmark.
+    """
+
+    print(f"\nHistory import ({PLAYERS} players)\n")
+    print(f"{'case':<32}{'attempts':>12}{'attempts/s':>12}{'peak (KB)':>12}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for days in DAYS:
+            path = Path(os.path.join(tmp, f"history-{days}.jsonl"))
+
+            with temp_database():
+                attempts = _write_history(path, _get_words(), days)
+                if days == DAYS[0]:
+                    replayed, throughput = _replay(path)
+                    print(f"{'play_game per attempt':<32}{replayed:>12}{throughput:>12.0f}{'':>12}")
+
+            with temp_database():
+                report = history.import_file(path)
+                assert report.attempts == attempts
+
+            # Tracing allocations slows everything down, so memory is measured on its own run
+            with temp_database():
+                tracemalloc.start()
+                history.import_file(path)
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+                print(
+                    f"{f'import ({days} days)':<32}{report.attempts:>12}"
+                    f"{report.get_attempts_per_second():>12.0f}{peak / 1024:>12.0f}"
+                )
+
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Measure the import time of the CLI entry point, failing when it goes over budget.
+
+Run it with `python -m benchmarks.import_time [BUDGET_MS]`.
+"""
+
+import re
+import statistics
+import subprocess
+import sys
+from typing import Dict, List
+
+MODULE = "palabros.main"
+BUDGET_MS = 150.0
+ROUNDS = 7
+
+# Modules which must never be imported just by loading the CLI
+FORBIDDEN = ("rich",)
+
+_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|(\s+)(\S+)$")
+
+
+def _import_times() -> Dict[str, float]:
+
+    """
+    Import the entry point in a fresh interpreter with `-X importtime`.
+
+    Returns:
+        The cumulative import time of every imported module, given in milliseconds.
+    """
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {MODULE}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    times: Dict[str, float] = {}
+    for line in result.stderr.splitlines():
+        match = _LINE.match(line)
+        if match is not None:
+            times[match.group(4)] = int(match.group(2)) / 1000
+
+    return times
+
+
+def main() -> None:
+
+    """
+    Run the benchmark.
+    """
+
+    budget = float(sys.argv[1]) if len(sys.argv) > 1 else BUDGET_MS
+    rounds: List[Dict[str, float]] = [_import_times() for _ in range(ROUNDS)]
+    total = statistics.median(times[MODULE] for times in rounds)
+    forbidden = sorted({m for times in rounds for m in times if m.split(".")[0] in FORBIDDEN})
+    slowest = sorted(rounds[-1].items(), key=lambda x: x[1], reverse=True)[1:6]
+
+    print(f"\nImport time of {MODULE} (median of {ROUNDS} rounds)\n")
+    print(f"{'total':<32}{total:>12.2f} ms")
+    for name, elapsed in slowest:
+        print(f"{name:<32}{elapsed:>12.2f} ms")
+    print(f"{'budget':<32}{budget:>12.2f} ms\n")
+
+    if forbidden:
+        sys.exit(f"Forbidden modules imported at startup: {', '.join(forbidden)}")
+
+    if total > budget:
+        sys.exit(f"Import time over budget: {total:.2f} ms > {budget:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Measure the normalization of guesses, one by one, and of whole dictionaries, in batches.
+
+Run it with `python -m benchmarks.normalization`.
+"""
+
+import json
+import random
+import time
+import tracemalloc
+from typing import Callable, List
+
+from palabros import normalization
+from palabros.database import _WORDS_JSON_PATH
+
+GUESSES = 200_000
+ROUNDS = 10
+
+
+def _legacy(words: List[str]) -> None:
+
+    """
+    Normalize the words the way `_normalize_word` used to do it, building the table on every call.
+
+    Args:
+        words: The words to normalize.
+    """
+
+    for word in words:
+        word.translate(str.maketrans("áéíóúü", "aeiouu"))
+
+
+def _one_by_one(words: List[str]) -> None:
+
+    """
+    Normalize the words one by one, as guesses are.
+
+    Args:
+        words: The words to normalize.
+    """
+
+    normalize = normalization.normalize
+    for word in words:
+        normalize(word)
+
+
+def _rate(func: Callable[[], object], total: int) -> float:
+
+    """
+    Measure how many words per second the given function normalizes.
+
+    Args:
+        func: The function normalizing all the words.
+        total: The number of words.
+
+    Returns:
+        The words normalized per second.
+    """
+
+    start = time.perf_counter()
+    func()
+    return total / (time.perf_counter() - start)
+
+
+def _peak(func: Callable[[], object]) -> float:
+
+    """
+    Measure the peak memory allocated while running the given function, which stays flat unless it keeps something
+    alive for every word.
+
+    Args:
+        func: The function normalizing all the words.
+
+    Returns:
+        The peak memory, given in bytes.
+    """
+
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main() -> None:
+
+    """
+    Run the benchmark.
+    """
+
+    with open(_WORDS_JSON_PATH) as f:
+        dictionary = list(json.load(f))
+
+    rnd = random.Random(0)
+    # Guesses as players type them: mostly plain, some accented and some uppercase
+    variants = [str, str, str.upper, lambda word: word.replace("a", "á").replace("e", "é")]
+    guesses = [rnd.choice(variants)(word) for word in rnd.choices(dictionary, k=GUESSES)]
+    words = dictionary * ROUNDS
+
+    print(f"\nNormalizing {GUESSES} guesses\n")
+    print(f"{'case':<32}{'words/s':>12}{'peak (B)':>12}")
+    for name, func in (("legacy (table per call)", _legacy), ("normalize", _one_by_one)):
+        rate = _rate(lambda: func(guesses), GUESSES)
+        print(f"{name:<32}{rate:>12.0f}{_peak(lambda: func(guesses)):>12.0f}")
+
+    print(f"\nNormalizing the bundled dictionary {ROUNDS} times ({len(words)} words)\n")
+    print(f"{'case':<32}{'words/s':>12}")
+    print(f"{'normalize (one by one)':<32}{_rate(lambda: _one_by_one(words), len(words)):>12.0f}")
+    print(f"{'normalize_batch':<32}{_rate(lambda: normalization.normalize_batch(words), len(words)):>12.0f}\n")
+
+
+if __name__ == "__main__":
+    main()
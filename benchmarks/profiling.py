@@ -0,0 +1,39 @@
+"""
+Measure the cost of the profiling instrumentation on the hot path, both disabled and enabled.
+
+Run it with `python -m benchmarks.profiling`.
+"""
+
+from benchmarks.utils import measure, report, temp_database
+from palabros import business, profiling
+
+
+def main() -> None:
+
+    """
+    Run the benchmark.
+    """
+
+    with temp_database():
+        business.get_current_game()
+        word = business.get_current_game().word
+        check_word = business.check_word.__wrapped__  # type: ignore[attr-defined]
+
+        results = {
+            "check_word (bare)": measure(lambda: check_word(word), rounds=100_000),
+            "check_word (disabled)": measure(lambda: business.check_word(word), rounds=100_000),
+            "get_current_game (disabled)": measure(business.get_current_game, rounds=2000),
+        }
+
+        unsubscribe = profiling.subscribe(profiling.Summary())
+        try:
+            results["check_word (enabled)"] = measure(lambda: business.check_word(word), rounds=100_000)
+            results["get_current_game (enabled)"] = measure(business.get_current_game, rounds=2000)
+        finally:
+            unsubscribe()
+
+    report("Profiling instrumentation", results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Compare rendering game boards the former way, a console and a table built from scratch every time, against the
+shared console with cached boards, and against the plain text renderer.
+
+Run it with `python -m benchmarks.rendering`.
+"""
+
+import io
+import json
+import random
+import time
+from typing import Callable, Dict, List
+
+from rich.console import Console
+from rich.padding import Padding
+from rich.table import Table, box
+
+from palabros import rendering
+from palabros.schemas import Attempt, Game
+from palabros.scoring import score
+
+BOARDS = 365
+ROUNDS = 3
+
+
+def _legacy_print(game: Game, file: io.StringIO) -> None:
+
+    """
+    Print a board the way `console.print_result` used to do it.
+
+    Args:
+        game: The game to show.
+        file: The file to print to.
+    """
+
+    table = Table(show_header=False, show_footer=False, show_lines=True, box=box.HEAVY)
+    for _ in range(5):
+        table.add_column(width=5, justify="center")
+
+    for attempt in game.attempts:
+        table.add_row(
+            *[
+                Padding(
+                    char.char,
+                    1,
+                    style="bold black on green"
+                    if char.valid
+                    else "bold black on yellow"
+                    if char.missplaced
+                    else "bold white on black",
+                )
+                for char in sorted(attempt.chars, key=lambda x: x.position)
+            ]
+        )
+
+    for _ in range(game.get_attempts_left()):
+        table.add_row(*[Padding("", 1) for _ in range(5)])
+
+    Console(file=file, force_terminal=True, width=80).print(table)
+
+
+def _rate(func: Callable[[Game], None], games: List[Game]) -> Dict[str, float]:
+
+    """
+    Measure how many boards per second the given function renders, rendering every board several times.
+
+    Args:
+        func: The function rendering a board.
+        games: The games to show.
+
+    Returns:
+        The boards rendered per second, and the mean latency in milliseconds.
+    """
+
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        for game in games:
+            func(game)
+    elapsed = time.perf_counter() - start
+    return {"boards/s": ROUNDS * len(games) / elapsed, "mean (ms)": elapsed * 1000 / (ROUNDS * len(games))}
+
+
+def main() -> None:
+
+    """
+    Run the benchmark.
+    """
+
+    with open(rendering.__file__.replace("rendering.py", "words.json")) as f:
+        words = list(json.load(f))
+
+    rnd = random.Random(0)
+    games = []
+    for i in range(BOARDS):
+        seed = rnd.choice(words)
+        game = Game(i, seed, "20220214")
+        for j, word in enumerate(rnd.sample(words, rnd.randint(1, 6))):
+            game.attempts.append(Attempt(j, word, False, pattern=score(seed.upper(), word.upper())))
+        games.append(game)
+
+    file = io.StringIO()
+    rendering._console = Console(file=file, force_terminal=True, width=80)
+
+    results = {
+        "new console and table": _rate(lambda game: _legacy_print(game, file), games),
+        "shared console, cold cache": _rate(
+            lambda game: (rendering._render.cache_clear(), rendering.print_board(game)), games
+        ),
+    }
+
+    for game in games:
+        rendering.print_board(game)
+
+    results = {
+        **results,
+        "shared console, warm cache": _rate(rendering.print_board, games),
+        "plain text": _rate(lambda game: file.write(rendering.render_plain(game)), games),
+        "plain text, ANSI colors": _rate(lambda game: file.write(rendering.render_plain(game, ansi=True)), games),
+    }
+
+    print(f"\nRendering {BOARDS} boards, {ROUNDS} times each\n")
+    print(f"{'case':<32}{'boards/s':>12}{'mean (ms)':>12}")
+    for name, values in results.items():
+        print(f"{name:<32}{values['boards/s']:>12.1f}{values['mean (ms)']:>12.4f}")
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+"""
+Compare the memory and allocations of in-memory games, the former plain dataclasses against the slotted schemas.
+
+Run it with `python -m benchmarks.schemas_memory`.
+"""
+
+import json
+import random
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List
+
+from palabros import schemas
+from palabros.database import _WORDS_JSON_PATH
+from palabros.scoring import MISSPLACED, VALID, decode, score
+
+GAMES = 10_000
+ATTEMPTS = 6
+
+
+@dataclass
+class _LegacyCharInspection:
+
+    """
+    The former `CharInspection` schema.
+    """
+
+    char: str
+    position: int
+    valid: bool = False
+    missplaced: bool = False
+
+
+@dataclass
+class _LegacyAttempt:
+
+    """
+    The former `Attempt` schema, holding a list of inspections.
+    """
+
+    id: int
+    word: str
+    match: bool
+    chars: List[_LegacyCharInspection] = field(default_factory=list)
+
+
+@dataclass
+class _LegacyGame:
+
+    """
+    The former `Game` schema.
+    """
+
+    id: int
+    word: str
+    date: str
+    attempts: List[_LegacyAttempt] = field(default_factory=list)
+    max_attempts: int = schemas.MAX_ATTEMPTS
+
+    def any_match(self) -> bool:
+
+        """
+        Check if any of the attempts did a match, the former way.
+
+        Returns:
+            True if a match is found; otherwise False.
+        """
+
+        return any([attempt.match for attempt in self.attempts])
+
+
+def _build_legacy(seeds: List[str], words: List[List[str]]) -> List[_LegacyGame]:
+
+    """
+    Build the games with the former schemas, inspecting every attempt eagerly.
+
+    Args:
+        seeds: The seed word of every game.
+        words: The attempt words of every game.
+
+    Returns:
+        The games.
+    """
+
+    games = []
+    for i, (seed, attempts) in enumerate(zip(seeds, words)):
+        game = _LegacyGame(i, seed, "20220214")
+        for j, word in enumerate(attempts):
+            states = decode(score(seed, word), len(word))
+            chars = [
+                _LegacyCharInspection(char.upper(), k, state == VALID, state == MISSPLACED)
+                for k, (char, state) in enumerate(zip(word, states))
+            ]
+            game.attempts.append(_LegacyAttempt(j, word, word == seed, chars))
+        games.append(game)
+    return games
+
+
+def _build_slotted(seeds: List[str], words: List[List[str]]) -> List[schemas.Game]:
+
+    """
+    Build the games with the slotted schemas, keeping every attempt packed.
+
+    Args:
+        seeds: The seed word of every game.
+        words: The attempt words of every game.
+
+    Returns:
+        The games.
+    """
+
+    games = []
+    for i, (seed, attempts) in enumerate(zip(seeds, words)):
+        game = schemas.Game(i, seed, "20220214")
+        for j, word in enumerate(attempts):
+            game.attempts.append(schemas.Attempt(j, word, word == seed, pattern=score(seed, word)))
+        games.append(game)
+    return games
+
+
+def _measure(build: Callable[[], List[object]]) -> Dict[str, float]:
+
+    """
+    Measure the memory held by the built games and the allocations done building them.
+
+    Args:
+        build: The function building the games.
+
+    Returns:
+        The memory and allocation stats, along with the time taken to build the games and check them for a match.
+    """
+
+    tracemalloc.start()
+    games = build()
+    snapshot = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    stats = snapshot.statistics("filename")
+    memory = sum(stat.size for stat in stats)
+    blocks = sum(stat.count for stat in stats)
+    del games
+
+    start = time.perf_counter()
+    games = build()
+    built = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for game in games:
+        game.any_match()
+    matched = time.perf_counter() - start
+
+    return {
+        "bytes/game": memory / GAMES,
+        "blocks/game": blocks / GAMES,
+        "build (ms)": built * 1000,
+        "any_match (ms)": matched * 1000,
+    }
+
+
+def main() -> None:
+
+    """
+    Run the benchmark.
+    """
+
+    with open(_WORDS_JSON_PATH) as f:
+        dictionary = list(json.load(f))
+
+    rnd = random.Random(0)
+    seeds = [rnd.choice(dictionary) for _ in range(GAMES)]
+    words = [rnd.sample(dictionary, ATTEMPTS) for _ in range(GAMES)]
+
+    results = {
+        "plain dataclasses": _measure(lambda: _build_legacy(seeds, words)),
+        "slotted, packed": _measure(lambda: _build_slotted(seeds, words)),
+    }
+
+    columns = list(next(iter(results.values())))
+    print(f"\nIn-memory games ({GAMES} games x {ATTEMPTS} attempts)\n")
+    print(f"{'case':<24}" + "".join(f"{column:>16}" for column in columns))
+    for name, values in results.items():
+        print(f"{name:<24}" + "".join(f"{values[column]:>16.1f}" for column in columns))
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Compare the batch scoring engine against scoring every attempt through `CharInspection` instances.
+
+Run it with `python -m benchmarks.scoring`.
+"""
+
+import json
+import random
+import time
+from collections import Counter
+from typing import Callable, List
+
+from palabros import scoring
+from palabros.database import _WORDS_JSON_PATH
+from palabros.schemas import CharInspection
+
+PAIRS = 200_000
+
+
+def _legacy(seeds: List[str], words: List[str]) -> None:
+
+    """
+    Score the pairs the way `_inspect_attempt` used to do it.
+
+    Args:
+        seeds: The seed words.
+        words: The words to score.
+    """
+
+    for seed, word in zip(seeds, words):
+        word = word.translate(str.maketrans("áéíóúü", "aeiouu"))
+        upper_seed = seed.upper()
+        occurrences = Counter(char[0] for char in upper_seed)
+        for i in range(5):
+            inspection = CharInspection(char=word[i].upper(), position=i)
+            if inspection.char in upper_seed and occurrences[inspection.char] > 0:
+                if upper_seed[i] == inspection.char:
+                    inspection.valid = True
+                else:
+                    inspection.missplaced = True
+                occurrences[inspection.char] -= 1
+
+
+def _rate(func: Callable[[], object]) -> float:
+
+    """
+    Measure how many pairs per second the given function scores.
+
+    Args:
+        func: The function scoring all the pairs.
+
+    Returns:
+        The pairs scored per second.
+    """
+
+    start = time.perf_counter()
+    func()
+    return PAIRS / (time.perf_counter() - start)
+
+
+def main() -> None:
+
+    """
+    Run the benchmark.
+    """
+
+    with open(_WORDS_JSON_PATH) as f:
+        dictionary = list(json.load(f))
+
+    rnd = random.Random(0)
+    seeds = [rnd.choice(dictionary[:50]) for _ in range(PAIRS)]
+    words = rnd.choices(dictionary, k=PAIRS)
+
+    print(f"\nScoring {PAIRS} (seed, word) pairs\n")
+    print(f"{'case':<32}{'pairs/s':>12}")
+    print(f"{'legacy (CharInspection)':<32}{_rate(lambda: _legacy(seeds, words)):>12.0f}")
+    print(f"{'score (one by one)':<32}{_rate(lambda: [scoring.score(s, w) for s, w in zip(seeds, words)]):>12.0f}")
+    print(f"{'score_batch':<32}{_rate(lambda: scoring.score_batch(seeds, words)):>12.0f}\n")
+
+
+if __name__ == "__main__":
+    main()
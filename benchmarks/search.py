@@ -0,0 +1,100 @@
+"""
+Compare searching the dictionary through the positional index against `LIKE` scans over the `words` table, for the
+bundled dictionary and for a synthetic one many times bigger.
+
+Run it with `python -m benchmarks.search`.
+"""
+
+import random
+import time
+from collections import Counter
+from typing import Dict, Tuple
+
+from benchmarks.utils import measure, report, temp_database
+from palabros import dictionary, search
+from palabros.constraints import ALPHABET
+from palabros.database import db_cursor
+from palabros.storage import get_storage
+
+SYNTHETIC_WORDS = 100_000
+
+# Search pattern, required letters and excluded letters
+QUERIES = (("c?c?e", "", ""), ("?????", "r", "ato"), ("??e??", "ss", "i"))
+
+
+def _scan(pattern: str, has: str, excluded: str) -> None:
+
+    """
+    Search the dictionary the naive way: a `LIKE` scan over the `words` table.
+
+    Args:
+        pattern: The search pattern.
+        has: The letters the words must have.
+        excluded: The letters the words must not have.
+    """
+
+    required = Counter(has)
+    conditions = ["word LIKE ?"] + ["word LIKE ?"] * len(required) + ["word NOT LIKE ?"] * len(excluded)
+    parameters = (
+        [pattern.replace("?", "_")]
+        + [f"%{'%'.join(char * total)}%" for char, total in required.items()]
+        + [f"%{char}%" for char in excluded]
+    )
+
+    with db_cursor() as cur:
+        cur.execute(f"SELECT word FROM words WHERE {' AND '.join(conditions)} ORDER BY frequency DESC;", parameters)
+        cur.fetchall()
+
+
+def _measure_corpus(name: str, results: Dict[str, Dict[str, float]]) -> Tuple[int, float]:
+
+    """
+    Measure every query against the dictionary in use, through both paths.
+
+    Args:
+        name: The name of the dictionary.
+        results: The latency stats of every case, which the new ones are added to.
+
+    Returns:
+        The number of 5-letter words, and the time spent building their index, given in milliseconds.
+    """
+
+    total = len(dictionary.get_dictionary(5))
+    start = time.perf_counter()
+    search.get_index(5)
+    elapsed = (time.perf_counter() - start) * 1000
+
+    for pattern, has, excluded in QUERIES:
+        case = f"{pattern} +{has or '-'} -{excluded or '-'}"
+        results[f"{name}: {case} (LIKE)"] = measure(lambda: _scan(pattern, has, excluded), rounds=50)
+        results[f"{name}: {case} (index)"] = measure(lambda: search.search(pattern, has, excluded), rounds=50)
+
+    return total, elapsed
+
+
+def main() -> None:
+
+    """
+    Run the benchmark.
+    """
+
+    results: Dict[str, Dict[str, float]] = {}
+    built = []
+
+    with temp_database():
+        built.append(("bundled", *_measure_corpus("bundled", results)))
+
+        rnd = random.Random(0)
+        letters = ALPHABET.replace("ñ", "")
+        get_storage().add_words(("".join(rnd.choices(letters, k=5)), rnd.random()) for _ in range(SYNTHETIC_WORDS))
+        dictionary.invalidate()
+        built.append(("synthetic", *_measure_corpus("synthetic", results)))
+
+    report("Dictionary search", results)
+    for name, total, elapsed in built:
+        print(f"{name} index: {total} words built in {elapsed:.1f} ms")
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Compare the seed word selection against the former scanning query, with a 100k-word dictionary and 10 years of games.
+
+Run it with `python -m benchmarks.seed_selection`.
+"""
+
+import random
+import string
+from datetime import date, timedelta
+
+from benchmarks.utils import measure, report, temp_database
+from palabros import business
+from palabros.database import db_cursor
+from palabros.queries import Query
+from palabros.schemas import DEFAULT_PLAYER, MAX_ATTEMPTS
+
+WORDS = 100_000
+DAYS = 3650
+
+_LEGACY_QUERY = """
+    SELECT
+        w.word
+    FROM (
+        SELECT
+            w.word
+        FROM
+            words AS w
+            LEFT OUTER JOIN
+                games AS g ON w.word = g.word
+        WHERE
+            g.id IS NULL
+        ORDER BY
+            w.frequency DESC
+        LIMIT
+            50
+    ) as w
+    ORDER BY
+        RANDOM()
+    LIMIT
+        1;
+"""
+
+
+def _populate() -> None:
+
+    """
+    Fill the database with synthetic words and a game per day, which always take the most frequent words.
+    """
+
+    rnd = random.Random(0)
+    words = {"".join(rnd.choices(string.ascii_lowercase, k=5)): rnd.random() for _ in range(WORDS)}
+
+    with db_cursor() as cur:
+        cur.execute(Query.BeginImmediate)
+        cur.executemany(
+            "INSERT OR IGNORE INTO words (word, frequency, length, difficulty) VALUES (?, ?, LENGTH(?1), ?);",
+            ((word, frequency, rnd.randint(1, 8)) for word, frequency in words.items()),
+        )
+        cur.execute("SELECT word FROM words ORDER BY frequency DESC LIMIT ?;", (DAYS,))
+        played = [row["word"] for row in cur.fetchall()]
+        start = date.today() - timedelta(days=DAYS)
+        cur.executemany(
+            Query.CreateGameIfNotExists,
+            (
+                (DEFAULT_PLAYER, word, (start + timedelta(days=i)).strftime("%Y%m%d"), MAX_ATTEMPTS, False)
+                for i, word in enumerate(played)
+            ),
+        )
+        cur.execute(Query.Commit)
+
+
+def _legacy() -> None:
+
+    """
+    Pick a word with the former query.
+    """
+
+    with db_cursor() as cur:
+        cur.execute(_LEGACY_QUERY)
+        cur.fetchone()
+
+
+def main() -> None:
+
+    """
+    Run the benchmark.
+    """
+
+    with temp_database():
+        _populate()
+        results = {
+            "indexed, random": measure(business._get_random_word, rounds=200),
+            "indexed, seeded": measure(lambda: business._get_random_word("20220214"), rounds=200),
+            "indexed, difficulty 3-4": measure(lambda: business._get_random_word(difficulty=(3, 4)), rounds=200),
+        }
+        with db_cursor() as cur:
+            cur.execute("DROP INDEX idx_games_word;")
+            cur.execute("DROP INDEX idx_words_frequency;")
+        results = {"legacy (scan and sort)": measure(_legacy, rounds=20, warmup=1), **results}
+
+    report(f"Seed word selection ({WORDS} words, {DAYS} games)", results)
+
+
+if __name__ == "__main__":
+    main()
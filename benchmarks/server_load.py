@@ -0,0 +1,172 @@
+"""
+Load-test the game server, reporting latency percentiles and throughput.
+
+Run it with `python -m benchmarks.server_load [CLIENTS] [REQUESTS_PER_CLIENT]`.
+"""
+
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from typing import List, Tuple
+
+from palabros.database import _WORDS_JSON_PATH
+
+CLIENTS = 50
+REQUESTS = 200
+PLAYERS = 100
+WRITE_RATIO = 0.2
+
+
+def _get_free_port() -> int:
+
+    """
+    Find a free local port.
+
+    Returns:
+        The port number.
+    """
+
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def _request(
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+    method: str,
+    path: str,
+    body: bytes = b"",
+) -> int:
+
+    """
+    Send a request over a kept-alive connection and read the whole response.
+
+    Args:
+        reader: The connection reader.
+        writer: The connection writer.
+        method: The HTTP method.
+        path: The request path.
+        body: The request body.
+
+    Returns:
+        The HTTP status.
+    """
+
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body)
+    await writer.drain()
+
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line == b"\r\n":
+            break
+        name, _, value = line.decode().partition(":")
+        if name.lower() == "content-length":
+            length = int(value)
+    await reader.readexactly(length)
+
+    return status
+
+
+async def _client(port: int, requests: int, words: List[str], rnd: random.Random) -> List[Tuple[float, int]]:
+
+    """
+    Run a client sending requests one after another.
+
+    Args:
+        port: The server port.
+        requests: The number of requests to send.
+        words: The words to play.
+        rnd: The random generator.
+
+    Returns:
+        The latency, in milliseconds, and the status of every request.
+    """
+
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    results = []
+
+    for _ in range(requests):
+        player = f"player-{rnd.randrange(PLAYERS)}"
+        start = time.perf_counter()
+        if rnd.random() < WRITE_RATIO:
+            body = json.dumps({"word": rnd.choice(words)}).encode()
+            status = await _request(reader, writer, "POST", f"/players/{player}/attempts", body)
+        else:
+            status = await _request(reader, writer, "GET", f"/players/{player}/game")
+        results.append(((time.perf_counter() - start) * 1000, status))
+
+    writer.close()
+    return results
+
+
+async def _run(port: int, clients: int, requests: int) -> None:
+
+    """
+    Run all the clients concurrently and report the results.
+
+    Args:
+        port: The server port.
+        clients: The number of concurrent clients.
+        requests: The number of requests per client.
+    """
+
+    with open(_WORDS_JSON_PATH) as f:
+        words = list(json.load(f))
+
+    start = time.perf_counter()
+    results = await asyncio.gather(
+        *(_client(port, requests, words, random.Random(i)) for i in range(clients)),
+    )
+    elapsed = time.perf_counter() - start
+
+    timings = sorted(latency for result in results for latency, _ in result)
+    errors = sum(1 for result in results for _, status in result if status >= 500)
+
+    print(f"\nServer load test ({clients} clients x {requests} requests, {WRITE_RATIO:.0%} attempts)\n")
+    print(f"{'requests/s':<16}{len(timings) / elapsed:>12.1f}")
+    print(f"{'p50 (ms)':<16}{timings[len(timings) // 2]:>12.3f}")
+    print(f"{'p99 (ms)':<16}{timings[int(len(timings) * 0.99)]:>12.3f}")
+    print(f"{'server errors':<16}{errors:>12}\n")
+
+
+def main() -> None:
+
+    """
+    Run the benchmark against a server running on a temporary database.
+    """
+
+    clients = int(sys.argv[1]) if len(sys.argv) > 1 else CLIENTS
+    requests = int(sys.argv[2]) if len(sys.argv) > 2 else REQUESTS
+    port = _get_free_port()
+
+    with tempfile.TemporaryDirectory() as path:
+        env = {**os.environ, "PALABROS_DB_PATH": os.path.join(path, "games.db")}
+        server = subprocess.Popen(
+            [sys.executable, "-m", "palabros.main", "serve", "--port", str(port)],
+            env=env,
+            stdout=subprocess.DEVNULL,
+        )
+        try:
+            for _ in range(100):
+                try:
+                    socket.create_connection(("127.0.0.1", port), timeout=0.1).close()
+                    break
+                except OSError:
+                    time.sleep(0.1)
+            asyncio.run(_run(port, clients, requests))
+        finally:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == "__main__":
+    main()
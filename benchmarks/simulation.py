@@ -0,0 +1,51 @@
+"""
+Play every strategy against the bundled dictionary, as a regression benchmark of scoring and candidate filtering, and
+check the results don't depend on the number of workers.
+
+Run it with `python -m benchmarks.simulation`.
+"""
+
+import os
+
+from benchmarks.utils import temp_database
+from palabros import simulation
+from palabros.business import WORD_LENGTH
+from palabros.patterns import get_matrix
+
+# The entropy strategy ranks the whole dictionary on every new candidate set, so it plays a sample only
+CASES = (("frequency", None), ("random", None), ("entropy", 300))
+
+
+def main() -> None:
+
+    """
+    Run the benchmark.
+    """
+
+    cores = os.cpu_count() or 1
+
+    print(f"\nSimulation against the bundled dictionary ({cores} cores)\n")
+    print(f"{'case':<32}{'words':>8}{'guesses':>10}{'failed':>10}{'words/s':>12}{'per core':>12}")
+
+    with temp_database():
+        # Built once up front, so it's not measured
+        get_matrix(WORD_LENGTH)
+
+        for strategy, limit in CASES:
+            reports = [
+                simulation.simulate(WORD_LENGTH, strategy, workers=workers, limit=limit)
+                for workers in sorted({1, cores})
+            ]
+            for report in reports:
+                assert report.distribution == reports[0].distribution and report.failed == reports[0].failed
+                print(
+                    f"{f'{strategy} ({report.workers} workers)':<32}{report.words:>8}"
+                    f"{report.get_mean_guesses():>10.3f}{report.get_failure_rate():>10.2%}"
+                    f"{report.get_words_per_second():>12.0f}{report.get_words_per_second_per_core():>12.0f}"
+                )
+
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Compare the latency of the game operations against the SQLite and the in-memory storage backends.
+
+Run it with `python -m benchmarks.storage`.
+"""
+
+import os
+from itertools import count
+from typing import Dict
+
+from benchmarks.utils import measure, report, temp_database
+from palabros import business, storage
+
+ATTEMPTS = ("leche", "mundo", "mayor")
+
+
+def _play_new_game(players: "count[int]") -> None:
+
+    """
+    Start the game of a new player, and play a few attempts, as a server does for every new player.
+
+    Args:
+        players: The player id generator.
+    """
+
+    game = business.get_current_game(seeded=True, player_id=f"player-{next(players)}")
+    for word in ATTEMPTS:
+        game.attempts.append(business.play_game(game, word))
+
+
+def main() -> None:
+
+    """
+    Run the benchmark.
+    """
+
+    results: Dict[str, Dict[str, float]] = {}
+
+    for backend in storage.BACKENDS:
+        os.environ[storage.ENV_VAR] = backend
+        with temp_database():
+            storage.init()
+            game = business.get_current_game(seeded=True)
+            for word in ATTEMPTS:
+                business.play_game(game, word)
+
+            players = count()
+            results[f"{backend}: get_current_game"] = measure(business.get_current_game)
+            results[f"{backend}: get_stats"] = measure(business.get_stats)
+            results[f"{backend}: new game, 3 attempts"] = measure(lambda: _play_new_game(players), rounds=300)
+            storage.close()
+
+    del os.environ[storage.ENV_VAR]
+    report("Game operations per storage backend", results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+import os
+import statistics
+import tempfile
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Generator, List
+
+from palabros import database
+
+
+@contextmanager
+def temp_database() -> Generator[str, None, None]:
+
+    """
+    Point palabros to a brand new database, living in a temporary directory.
+
+    Yields:
+        The path of the temporary database.
+    """
+
+    previous = os.environ.get("PALABROS_DB_PATH")
+
+    with tempfile.TemporaryDirectory() as path:
+        db_path = os.path.join(path, "games.db")
+        os.environ["PALABROS_DB_PATH"] = db_path
+        try:
+            database.init()
+            yield db_path
+        finally:
+            database.close()
+            if previous is None:
+                del os.environ["PALABROS_DB_PATH"]
+            else:
+                os.environ["PALABROS_DB_PATH"] = previous
+
+
+def measure(func: Callable[[], object], rounds: int = 1000, warmup: int = 10) -> Dict[str, float]:
+
+    """
+    Measure the latency of the given function.
+
+    Args:
+        func: The function to measure.
+        rounds: The number of measured calls.
+        warmup: The number of calls to run before measuring.
+
+    Returns:
+        The latency stats, given in milliseconds.
+    """
+
+    for _ in range(warmup):
+        func()
+
+    timings: List[float] = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+
+    timings.sort()
+    return {
+        "mean": statistics.mean(timings),
+        "p50": timings[len(timings) // 2],
+        "p99": timings[min(len(timings) - 1, int(len(timings) * 0.99))],
+    }
+
+
+def report(title: str, results: Dict[str, Dict[str, float]]) -> None:
+
+    """
+    Print the given benchmark results as a plain table.
+
+    Args:
+        title: The benchmark title.
+        results: The latency stats of every measured case.
+    """
+
+    print(f"\n{title}\n")
+    print(f"{'case':<32}{'mean (ms)':>12}{'p50 (ms)':>12}{'p99 (ms)':>12}")
+    for name, stats in results.items():
+        print(f"{name:<32}{stats['mean']:>12.4f}{stats['p50']:>12.4f}{stats['p99']:>12.4f}")
+    print()
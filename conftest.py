@@ -1,26 +1,60 @@
 import os
-import sqlite3
-from typing import Generator
+import time
+from collections import defaultdict
+from typing import Any, DefaultDict, Generator, List
 
 import pytest
 
 os.environ["PALABROS_DB_PATH"] = "file::memory:?cache=shared"
 
 from palabros import __version__  # noqa:E402
+from palabros import database, dictionary, storage, writer  # noqa:E402
 from palabros.database import db_cursor  # noqa:E402
 from palabros.queries import Query  # noqa:E402
 from tests.base import WORDS  # noqa:E402
 
+# The time spent by the test cases run against every storage backend
+_timings: DefaultDict[str, List[float]] = defaultdict(list)
+
 
 @pytest.fixture(scope="function")
-def init_database() -> Generator[sqlite3.Cursor, None, None]:
-    with db_cursor() as cur:
-        cur.execute(Query.CreateVersionsTable)
-        cur.execute(Query.CreateWordsTable)
-        cur.execute(Query.CreateGamesTable)
-        cur.execute(Query.CreateAttemptsTable)
-        cur.execute(Query.CreateGamesDateIndex)
-        cur.execute(Query.CreateVersion, (__version__,))
-        values = ",".join([f"('{w}',{i})" for i, w in enumerate(WORDS)])
-        cur.execute(Query.PopulateWordsTable.format(values))
-        yield
+def init_database(request: Any) -> Generator[None, None, None]:
+    # Test cases run against the SQLite storage, unless they set the `backend` attribute, which also times them
+    timed = getattr(request.cls, "backend", None)
+    backend = timed or "sqlite"
+    os.environ[storage.ENV_VAR] = backend
+    if backend == "sqlite":
+        with db_cursor() as cur:
+            cur.execute(Query.CreateVersionsTable)
+            cur.execute(Query.CreateWordsTable)
+            cur.execute(Query.CreateWordsRevisionTable)
+            cur.execute(Query.CreateGamesTable)
+            cur.execute(Query.CreateAttemptsTable)
+            cur.execute(Query.CreateStatsTable)
+            cur.execute(Query.CreateStatsDistributionTable)
+            cur.execute(Query.CreateGamesPlayerDateLengthIndex)
+            cur.execute(Query.CreateGamesDateWordIndex)
+            cur.execute(Query.CreateGamesWordIndex)
+            cur.execute(Query.CreateAttemptsGameIndex)
+            cur.execute(Query.CreateWordsFrequencyIndex)
+            cur.execute(Query.CreateWordsLengthFrequencyIndex)
+            cur.execute(Query.CreateWordsLengthDifficultyIndex)
+            cur.execute(Query.CreateVersion, (__version__,))
+    storage.get_storage().add_words((w, i) for i, w in enumerate(WORDS))
+    start = time.perf_counter()
+    yield
+    if timed is not None:
+        _timings[backend].append(time.perf_counter() - start)
+    storage.close()
+    writer.close()
+    database.close()
+    dictionary.invalidate()
+    del os.environ[storage.ENV_VAR]
+
+
+def pytest_terminal_summary(terminalreporter: Any) -> None:
+    if not _timings:
+        return
+    terminalreporter.section("storage backends")
+    for backend, timings in sorted(_timings.items()):
+        terminalreporter.write_line(f"{backend:<8}{len(timings):>6} tests{sum(timings) * 1000:>10.1f} ms")
@@ -1,50 +1,110 @@
-from collections import Counter
-from datetime import datetime
-from typing import List
-
-from palabros.database import db_cursor
+import hashlib
+import random
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+
+from palabros import profiling
+from palabros.constraints import filter_words, from_attempts
+from palabros.dictionary import get_dictionary
 from palabros.errors import DatabaseError, GameError
-from palabros.queries import Query
-from palabros.schemas import Attempt, CharInspection, Game
+from palabros.normalization import normalize
+from palabros.patterns import get_matrix
+from palabros.schemas import (
+    DEFAULT_PLAYER,
+    MAX_ATTEMPTS,
+    Attempt,
+    CharInspection,
+    Game,
+    Stats,
+    Suggestion,
+)
+from palabros.scoring import get_match_pattern, score
+from palabros.solver import filter_attempts, get_mask, get_members, rank_guesses
+from palabros.storage import get_storage
 
 WORD_LENGTH = 5
+SEED_CANDIDATES = 50
+
+# The variants a game can be played with: its word length and its number of attempts
+MIN_WORD_LENGTH = 4
+MAX_WORD_LENGTH = 8
+MIN_ATTEMPTS = 1
+MAX_ATTEMPTS_LIMIT = 10
 
 
-def _normalize_word(word: str) -> str:
+@profiling.timed("call")
+def _get_random_word(
+    seed: Optional[str] = None,
+    length: int = WORD_LENGTH,
+    difficulty: Optional[Tuple[int, int]] = None,
+) -> str:
 
     """
-    Normalize a given word.
+    Get a random word from the database, among the most frequent ones with the given length which haven't been played
+    yet.
+
+    When a difficulty band is given, the candidates are the rated words within it instead, the easiest and then the
+    most frequent first, which is the order of the `words` index they are read from.
 
     Args:
-        word: The word to normalize.
+        seed: An optional seed, such as a date. Given the same game history, the same seed always yields the same
+            word.
+        length: The word length.
+        difficulty: An optional band of difficulty, given as its lowest and highest values.
 
     Returns:
-        The properly normalized word.
+        The word retrieved from the database.
+
+    Raises:
+        DatabaseError: if no word could be retrieved from the database.
     """
 
-    return word.translate(str.maketrans("áéíóúü", "aeiouu"))
+    candidates = get_storage().get_seed_candidates(length, SEED_CANDIDATES, difficulty)
+
+    if not candidates and difficulty is not None:
+        raise DatabaseError(
+            f"No quedan palabras de [bold]{length}[/] letras con una dificultad entre [bold]{difficulty[0]}[/] y "
+            f"[bold]{difficulty[1]}[/]; prueba a puntuarlas con [bold]palabros rate-words[/]"
+        )
+
+    if not candidates:
+        raise DatabaseError("No se ha podido generar una palabra para el juego de hoy")
+
+    if seed is None:
+        return random.choice(candidates)
+
+    digest = hashlib.sha1(seed.encode()).digest()
+    return candidates[int.from_bytes(digest[:8], "big") % len(candidates)]
 
 
-def _get_random_word() -> str:
+@profiling.timed("call")
+def _score_attempt(seed: str, word: str) -> int:
 
     """
-    Get a random word from the database
+    Score the given attempt against a seed word.
+
+    Args:
+        seed: The seed word, which the player tries to guess.
+        word: The word given by the player.
 
     Returns:
-        The word retrieved from the database.
+        The packed pattern of the attempt.
 
     Raises:
-        DatabaseError: if no word could be retrieved from the database.
+        GameError: if the seed word or the one given by the player has a wrong length.
     """
 
-    with db_cursor() as cur:
-        cur.execute(Query.GetRandomWord)
-        result = cur.fetchone()
+    seed, word = normalize(seed), normalize(word)
 
-    if result is None:
-        raise DatabaseError("No se ha podido generar una palabra para el juego de hoy")
+    if not MIN_WORD_LENGTH <= len(seed) <= MAX_WORD_LENGTH:
+        raise GameError(
+            f"La palabra semilla tiene que tener entre [bold]{MIN_WORD_LENGTH}[/] y [bold]{MAX_WORD_LENGTH}[/] letras"
+        )
+
+    if len(word) != len(seed):
+        raise GameError(f"La palabra tiene que tener [bold]{len(seed)}[/] letras")
 
-    return result["word"]
+    return score(seed, word)
 
 
 def _inspect_attempt(seed: str, word: str) -> List[CharInspection]:
@@ -63,128 +123,339 @@ def _inspect_attempt(seed: str, word: str) -> List[CharInspection]:
         GameError: if the seed word or the one given by the player has a wrong length.
     """
 
-    if len(seed) != WORD_LENGTH:
-        raise GameError(f"La palabra semilla tiene que tener [bold]{WORD_LENGTH}[/] letras")
+    return Attempt(0, word, False, pattern=_score_attempt(seed, word)).chars
 
-    if len(word) != WORD_LENGTH:
-        raise GameError(f"La palabra tiene que tener [bold]{WORD_LENGTH}[/] letras")
 
-    result = []
-    word = _normalize_word(word)
-    upper_seed = seed.upper()
-    occurrences = Counter(char[0] for char in upper_seed)
+def word_exists(word: str) -> bool:
 
-    for i in range(WORD_LENGTH):
+    """
+    Check if the given word exists in the database dictionary.
 
-        inspection = CharInspection(
-            char=word[i].upper(),
-            position=i,
-        )
+    The check runs against the in-memory dictionary partition of the word length, so it never hits the database once
+    it's loaded.
 
-        if inspection.char in upper_seed and occurrences[inspection.char] > 0:
-            if upper_seed[i] == inspection.char:
-                inspection.valid = True
-            else:
-                inspection.missplaced = True
-            occurrences[inspection.char] -= 1
+    Args:
+        word: The word to check.
 
-        result.append(inspection)
+    Returns:
+        True if the word exists in the database dictionary; otherwise False.
+    """
 
-    return result
+    word = normalize(word)
+    return word in get_dictionary(len(word))
 
 
-def word_exists(word: str) -> bool:
+@profiling.timed("call")
+def check_variant(length: int, max_attempts: int = MAX_ATTEMPTS) -> None:
 
     """
-    Check if the given word exists in the database dictionary.
+    Check if a game can be played with the given word length and number of attempts.
+
+    The bundled dictionary just has words of the default length, so the words of any other length must be loaded
+    before its games can be played.
 
     Args:
-        word: The word to check.
+        length: The word length.
+        max_attempts: The number of attempts.
+
+    Raises:
+        GameError: if the word length or the number of attempts are out of bounds, or the dictionary has no words of
+            that length.
+    """
+
+    if not MIN_WORD_LENGTH <= length <= MAX_WORD_LENGTH:
+        raise GameError(
+            f"Las palabras tienen que tener entre [bold]{MIN_WORD_LENGTH}[/] y [bold]{MAX_WORD_LENGTH}[/] letras"
+        )
+
+    if not MIN_ATTEMPTS <= max_attempts <= MAX_ATTEMPTS_LIMIT:
+        raise GameError(f"Los intentos tienen que estar entre [bold]{MIN_ATTEMPTS}[/] y [bold]{MAX_ATTEMPTS_LIMIT}[/]")
+
+    if not get_dictionary(length):
+        raise GameError(
+            f"No hay palabras de [bold]{length}[/] letras en el diccionario; "
+            "cárgalas con [bold]palabros load-words[/]"
+        )
+
+
+@profiling.timed("call")
+def parse_difficulty(text: str) -> Tuple[int, int]:
+
+    """
+    Parse a band of difficulty, given either as a single value, such as `4`, or as a range, such as `3-5`.
+
+    Args:
+        text: The band of difficulty.
 
     Returns:
-        True if the word exists in the database dictionary; otherwise False.
+        The lowest and highest values of the band.
+
+    Raises:
+        GameError: if the band is not valid.
+    """
+
+    first, _, last = text.partition("-")
+
+    try:
+        low, high = int(first), int(last or first)
+    except ValueError:
+        low = high = 0
+
+    if not 1 <= low <= high:
+        raise GameError(f"La dificultad [bold]{text}[/] tiene que ser un número, como 4, o un rango, como 3-5")
+
+    return low, high
+
+
+@profiling.timed("call")
+def check_word(word: str, length: int = WORD_LENGTH) -> None:
+
+    """
+    Check if the given word can be played.
+
+    Args:
+        word: The word given by the player.
+        length: The word length of the game.
+
+    Raises:
+        GameError: if the word has a wrong length or doesn't exist in the dictionary.
     """
 
-    with db_cursor() as cur:
-        cur.execute(Query.WordExists, (_normalize_word(word),))
-        result = cur.fetchone()
+    normalized = normalize(word)
 
-    return result is not None and bool(result["total"])
+    if len(normalized) != length:
+        raise GameError(f"La palabra tiene que tener [bold]{length}[/] letras")
 
+    if normalized not in get_dictionary(length):
+        raise GameError(f"La palabra [bold]{word}[/] no existe en el diccionario")
 
-def get_current_game() -> Game:
+
+@profiling.timed("call")
+def get_current_game(
+    seeded: bool = False,
+    player_id: str = DEFAULT_PLAYER,
+    length: int = WORD_LENGTH,
+    max_attempts: int = MAX_ATTEMPTS,
+    difficulty: Optional[Tuple[int, int]] = None,
+    hard: bool = False,
+) -> Game:
 
     """
-    Get the current game if it's already ongoing; otherwise create a new one.
+    Get the current game of a player if it's already ongoing; otherwise create a new one.
+
+    An ongoing game is loaded, along with its attempts, in a single query. Creating the game happens in a write
+    transaction, so concurrent requests never race to create the same game. Every player of the same day and word
+    length gets the same seed word.
+
+    Args:
+        seeded: Whether the word of a new game is chosen deterministically from its date instead of randomly.
+        player_id: The player id.
+        length: The word length.
+        max_attempts: The number of attempts of a new game. An ongoing game keeps the number it was created with.
+        difficulty: An optional band of difficulty the word of a new game is chosen from, unless some other player
+            already got the word of the day.
+        hard: Whether a new game is played in hard mode, where every guess must reuse the hints revealed so far. An
+            ongoing game keeps the mode it was created with.
 
     Returns:
         An instance of `Game` with the current game.
+
+    Raises:
+        GameError: if the word length or the number of attempts are out of bounds, or the dictionary has no words of
+            that length.
     """
 
+    check_variant(length, max_attempts)
     today = datetime.now().strftime("%Y%m%d")
 
-    # Retrieve the current game
-    with db_cursor() as cur:
-        cur.execute(Query.GetGameByDate, (today,))
-        game = cur.fetchone()
-
-    # Create a new game
-    if game is None:
-        word = _get_random_word()
-        with db_cursor() as cur:
-            cur.execute(Query.CreateGame, (word, today))
-            game_id = cur.lastrowid
-        return Game(game_id, word, today)
-
-    # Retrieve the current game's attempts
-    with db_cursor() as cur:
-        cur.execute(Query.GetAttemptsByGame, (game["id"],))
-        attempts = cur.fetchall()
-
-    return Game(
-        game["id"],
-        game["word"],
-        game["date"],
-        [
-            Attempt(
-                attempt["id"],
-                attempt["word"],
-                bool(attempt["match"]),
-                _inspect_attempt(
-                    game["word"],
-                    attempt["word"],
-                ),
-            )
-            for attempt in attempts
-        ],
-    )
+    # Retrieve the current game and its attempts
+    game = get_game(today, player_id, length)
+
+    if game is not None:
+        return game
+
+    # Create a new game, unless someone else did it in the meantime
+    storage = get_storage()
+    with storage.transaction():
+        word = storage.get_word_by_date(today, length)
+        if word is None:
+            word = _get_random_word(today if seeded else None, length, difficulty)
+        return storage.create_game(player_id, today, word, max_attempts, hard)
 
 
+@profiling.timed("call")
+def get_game(date: str, player_id: str = DEFAULT_PLAYER, length: int = WORD_LENGTH) -> Optional[Game]:
+
+    """
+    Get the game of a player in the given date, along with its attempts.
+
+    Args:
+        date: The date, given in YYYYMMDD format.
+        player_id: The player id.
+        length: The word length.
+
+    Returns:
+        An instance of `Game`, or None if the player had no game that date.
+    """
+
+    return get_storage().get_game(player_id, date, length)
+
+
+@profiling.timed("call")
+def get_stats(player_id: str = DEFAULT_PLAYER) -> Stats:
+
+    """
+    Get the lifetime statistics of a player.
+
+    They're read from summary tables, which are kept up to date as games finish, so it costs the same whatever the
+    length of the game history.
+
+    Args:
+        player_id: The player id.
+
+    Returns:
+        An instance of `Stats`.
+    """
+
+    result = get_storage().get_stats(player_id)
+
+    # A streak is broken as soon as a day goes by without winning
+    yesterday = (datetime.now() - timedelta(days=1)).strftime("%Y%m%d")
+    if result.last_won_date is None or result.last_won_date < yesterday:
+        result.current_streak = 0
+
+    return result
+
+
+@profiling.timed("call")
 def play_game(game: Game, word: str) -> Attempt:
 
     """
     Try to guess the seed word.
 
+    The attempt goes through the write-behind queue, which groups the attempts of concurrent players in a single
+    transaction, and this waits until it's committed. In hard mode, the hints revealed by the previous attempts are
+    compiled once and the word is checked against them before anything is written.
+
     Args:
         game: The current game.
         word: The word given by the player.
 
     Returns:
         An instance of `Attempt` with the result.
+
+    Raises:
+        GameError: if the word has a wrong length, or doesn't reuse the hints revealed so far in hard mode.
     """
 
-    inspection = _inspect_attempt(game.word, word)
-    match = all([char.valid for char in inspection])
+    pattern = _score_attempt(game.word, word)
 
-    # Create a new attempt
-    with db_cursor() as cur:
-        cur.execute(Query.CreateAttempt, (game.id, word, match))
-        attempt_id = cur.lastrowid
+    if game.hard:
+        _check_hard_mode(game, normalize(word))
+    match = pattern == get_match_pattern(len(game.word))
+    finished = match or len(game.attempts) + 1 >= game.max_attempts
+
+    # Create a new attempt, and update the statistics if it finishes the game
+    attempt_id = get_storage().add_attempt(game, word, match, pattern, finished)
 
     # Add the attempt to the current game
     return Attempt(
         id=attempt_id,
         word=word,
         match=match,
-        chars=inspection,
+        pattern=pattern,
+    )
+
+
+def _check_hard_mode(game: Game, word: str) -> None:
+
+    """
+    Check if a word reuses every hint revealed by the attempts of a hard mode game.
+
+    Args:
+        game: The game.
+        word: The word given by the player, normalized.
+
+    Raises:
+        GameError: if the word doesn't reuse any hint.
+    """
+
+    violation = from_attempts(game.attempts, len(game.word)).find_violation(word)
+
+    if violation is None:
+        return
+
+    if violation.position is not None:
+        raise GameError(
+            f"En el modo difícil, la letra [bold]{violation.position + 1}[/] "
+            f"tiene que ser [bold]{violation.char.upper()}[/]"
+        )
+
+    times = f" [bold]{violation.count}[/] veces" if violation.count > 1 else ""
+    raise GameError(
+        f"En el modo difícil, la palabra tiene que tener la letra [bold]{violation.char.upper()}[/]{times}"
     )
+
+
+def _get_attempt_patterns(game: Game) -> List[Tuple[str, int]]:
+
+    """
+    Get the normalized word and the packed pattern of every attempt of the given game.
+
+    Args:
+        game: The game.
+
+    Returns:
+        A list of (word, pattern) tuples.
+    """
+
+    return [(normalize(attempt.word), attempt.pattern) for attempt in game.attempts]
+
+
+@profiling.timed("call")
+def get_candidates(game: Game) -> List[str]:
+
+    """
+    Get the dictionary words which could still be the seed word of the given game.
+
+    Args:
+        game: The game.
+
+    Returns:
+        The candidate words.
+    """
+
+    matrix = get_matrix(len(game.word))
+    mask = filter_attempts(matrix, _get_attempt_patterns(game))
+    return [matrix.words[i] for i in get_members(matrix, mask)]
+
+
+@profiling.timed("call")
+def suggest_guesses(game: Game, limit: int = 5) -> List[Suggestion]:
+
+    """
+    Suggest the best next guesses for the given game.
+
+    The candidates left by the game attempts are found through the pattern matrix, and every dictionary word is ranked
+    by the information it's expected to give about them. In hard mode, just the words reusing every hint revealed so
+    far are ranked.
+
+    Args:
+        game: The game.
+        limit: The number of suggestions.
+
+    Returns:
+        A list of `Suggestion` instances, the best first.
+    """
+
+    matrix = get_matrix(len(game.word))
+    dictionary = get_dictionary(len(game.word))
+    mask = filter_attempts(matrix, _get_attempt_patterns(game))
+    frequencies = dict(zip(dictionary.words, dictionary.frequencies))
+
+    allowed = None
+    if game.hard:
+        constraints = from_attempts(game.attempts, len(game.word))
+        allowed = get_mask(matrix, (matrix.index[word] for word in filter_words(matrix.words, constraints, hard=True)))
+
+    return rank_guesses(matrix, mask, frequencies, limit, allowed)
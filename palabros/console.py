@@ -1,118 +1,185 @@
 from datetime import datetime, time, timedelta
-from typing import List
+from typing import TYPE_CHECKING, Dict, List, Optional
 
-from rich.console import Console
-from rich.padding import Padding
-from rich.table import Table, box
+from palabros.rendering import (
+    get_console,
+    is_interactive,
+    print_board,
+    render_plain,
+    use_ansi,
+)
+from palabros.schemas import MAX_ATTEMPTS, Game, Stats, Suggestion
 
-from palabros.business import WORD_LENGTH
-from palabros.schemas import Attempt, Game
+if TYPE_CHECKING:
+    from palabros.simulation import SimulationReport
 
+# The most answers not guessed listed after a simulation
+MAX_FAILED_SHOWN = 10
 
-def _generate_attempt_row(attempt: Attempt) -> List[Padding]:
+# The style of the error messages
+ERROR_STYLE = "red"
+
+
+def _print_board(game: Game) -> None:
 
     """
-    Generate a table row with the given attempt info.
+    Print the board of a game, laid out by `rich` in a terminal, or as plain text otherwise.
 
     Args:
-        attempt: The attempt result to show.
+        game: The game to show.
+    """
+
+    if is_interactive():
+        print_board(game)
+    else:
+        get_console().file.write(f"{render_plain(game, ansi=use_ansi())}\n")
+
+
+def _get_countdown() -> str:
+
+    """
+    Calculate the countdown to the moment the user can play again.
 
     Returns:
-        A list of `rich.padding.Padding` instances.
-    """
-
-    return [
-        Padding(
-            char.char,
-            1,
-            style="bold black on green"
-            if char.valid
-            else "bold black on yellow"
-            if char.missplaced
-            else "bold white on black",
-        )
-        for char in sorted(attempt.chars, key=lambda x: x.position)
-    ]
+        The countdown, given as a string.
+    """
+
+    now = datetime.now()
+    tomorrow = now + timedelta(days=1)
+    midnight = datetime.combine(tomorrow.date(), time(0, 0))
+    countdown = midnight - now
+    hours, remainder = divmod(countdown.seconds, 3600)
+    minutes, seconds = divmod(remainder, 60)
+    return f'{str(hours).rjust(2, "0")}:{str(minutes).rjust(2, "0")}:{str(seconds).rjust(2, "0")}'
 
 
-def _generate_empty_row(cols: int = WORD_LENGTH) -> List[str]:
+def _print_distribution(distribution: Dict[int, int], max_attempts: int) -> None:
 
     """
-    Generate and empty table row.
+    Print a distribution of attempts as a bar chart.
 
     Args:
-        cols: The number of columns.
+        distribution: The number of games won per number of attempts.
+        max_attempts: The least number of attempts shown.
+    """
 
-    Returns:
-        A list of `rich.padding.Padding` instances.
+    console = get_console()
+    top = max(distribution.values(), default=0) or 1
+    # Games with more attempts than usual can be won later
+    for attempts in range(1, max([max_attempts, *distribution]) + 1):
+        total = distribution.get(attempts, 0)
+        console.print(f"  {attempts} [green]{'█' * round(20 * total / top)}[/] {total}")
+    console.print()
+
+
+def print_message(message: str, style: Optional[str] = None) -> None:
+
+    """
+    Print the given message in the console.
+
+    Args:
+        message: The message to print.
+        style: An optional style for the whole message, on top of its own markup.
     """
 
-    return [Padding("", 1) for _ in range(cols)]
+    console = get_console()
+    console.print(f"\n{message}\n", style=style)
 
 
-def _create_table(game: Game) -> Table:
+def print_error(message: str) -> None:
 
     """
-    Create a table to show the given game status.
+    Print the given error message in the console.
 
     Args:
-        game: The game to show.
+        message: The message to print.
+    """
+
+    print_message(message, style=ERROR_STYLE)
+
+
+def print_progress(done: int) -> None:
 
-    Returns:
-        An instance of `rich.table.Table`.
     """
+    Print, overwriting the current line, how many items have been processed so far.
 
-    table = Table(
-        show_header=False,
-        show_footer=False,
-        show_lines=True,
-        box=box.HEAVY,
-    )
+    Args:
+        done: The number of items processed.
+    """
 
-    table.add_column(width=5, justify="center")
-    table.add_column(width=5, justify="center")
-    table.add_column(width=5, justify="center")
-    table.add_column(width=5, justify="center")
-    table.add_column(width=5, justify="center")
+    # A line overwritten over and over is just noise when the output is not a terminal
+    if not is_interactive():
+        return
 
-    for attempt in game.attempts:
-        table.add_row(*_generate_attempt_row(attempt))
+    console = get_console()
+    console.print(f"Procesados [bold]{done}[/]...", end="\r")
 
-    for _ in range(game.get_attempts_left()):
-        table.add_row(*_generate_empty_row())
 
-    return table
+def print_migration(done: int, total: int) -> None:
 
+    """
+    Print, overwriting the current line, how far the database update has gone.
 
-def _get_countdown() -> str:
+    Args:
+        done: The number of steps run so far.
+        total: The total number of steps.
+    """
+
+    # A line overwritten over and over is just noise when the output is not a terminal
+    if not is_interactive():
+        return
+
+    console = get_console()
+    console.print(f"Actualizando la base de datos: paso [bold]{done}[/] de [bold]{total}[/]...", end="\r")
+
+
+def print_suggestions(candidates: int, suggestions: List[Suggestion]) -> None:
 
     """
-    Calculate the countdown to the moment the user can play again.
+    Print the suggested guesses in the console.
 
-    Returns:
-        The countdown, given as a string.
+    Args:
+        candidates: The number of words which could still be the seed word.
+        suggestions: The suggested guesses, the best first.
     """
 
-    now = datetime.now()
-    tomorrow = now + timedelta(days=1)
-    midnight = datetime.combine(tomorrow.date(), time(0, 0))
-    countdown = midnight - now
-    hours, remainder = divmod(countdown.seconds, 3600)
-    minutes, seconds = divmod(remainder, 60)
-    return f'{str(hours).rjust(2, "0")}:{str(minutes).rjust(2, "0")}:{str(seconds).rjust(2, "0")}'
+    lines = [
+        f"[bold]{suggestion.word.upper()}[/] ({suggestion.entropy:.2f} bits"
+        + (f", {suggestion.chance:.0%} de acertar)" if suggestion.candidate else ")")
+        for suggestion in suggestions
+    ]
 
+    console = get_console()
+    console.print(f"\nQuedan [bold]{candidates}[/] palabras posibles. Prueba con:\n")
+    console.print("\n".join(f"  {line}" for line in lines))
+    console.print()
 
-def print_error(message: str) -> None:
+
+def print_search(pattern: str, words: List[str], total: int) -> None:
 
     """
-    Print the given error message in the console.
+    Print the dictionary words matching a search in the console.
 
     Args:
-        message: The message to print.
+        pattern: The search pattern.
+        words: The words shown, the most frequent first.
+        total: The number of words matching the search.
     """
 
-    console = Console()
-    console.print(f"\n{message}\n")
+    console = get_console()
+
+    if not total:
+        console.print(f"\nNo hay palabras que encajen con [bold]{pattern.upper()}[/]\n")
+        return
+
+    more = total - len(words)
+    console.print(
+        f"\nHay [bold]{total}[/] palabras que encajen con [bold]{pattern.upper()}[/], las más frecuentes antes:\n"
+    )
+    console.print("\n".join(f"  [bold]{word.upper()}[/]" for word in words))
+    if more > 0:
+        console.print(f"  y [bold]{more}[/] más")
+    console.print()
 
 
 def print_result(game: Game) -> None:
@@ -132,6 +199,69 @@ def print_result(game: Game) -> None:
         else f"¡Tenías que acertar [bold]{game.word.upper()}[/]! Siguiente palabra en [bold]{_get_countdown()}[/]."
     )
 
-    console = Console()
-    console.print(_create_table(game))
-    console.print(f"\n{message}\n")
+    _print_board(game)
+    get_console().print(f"\n{message}\n")
+
+
+def print_results(game: Optional[Game], stats: Stats) -> None:
+
+    """
+    Print the result of a game, along with the lifetime statistics, in the console.
+
+    Args:
+        game: The game to show, if any.
+        stats: The lifetime statistics.
+    """
+
+    console = get_console()
+
+    if game is None:
+        console.print("\nNo se jugó ninguna partida ese día.\n")
+    else:
+        message = (
+            f"¡Acertaste [bold]{game.word.upper()}[/] en [bold]{len(game.attempts)}[/] intentos!"
+            if game.any_match()
+            else f"La partida sigue en juego: quedan [bold]{game.get_attempts_left()}[/] intentos."
+            if game.any_attempt_left()
+            else f"No acertaste [bold]{game.word.upper()}[/]."
+        )
+        _print_board(game)
+        console.print(f"\n{message}\n")
+
+    console.print(
+        f"Jugadas: [bold]{stats.played}[/]  "
+        f"Victorias: [bold]{stats.get_win_rate():.0%}[/]  "
+        f"Racha actual: [bold]{stats.current_streak}[/]  "
+        f"Mejor racha: [bold]{stats.max_streak}[/]\n"
+    )
+
+    _print_distribution(stats.distribution, MAX_ATTEMPTS)
+
+
+def print_simulation(report: "SimulationReport", max_attempts: int) -> None:
+
+    """
+    Print the outcome of a simulation in the console.
+
+    Args:
+        report: The simulation report.
+        max_attempts: The number of attempts of every game.
+    """
+
+    console = get_console()
+    console.print(
+        f"\nLa estrategia [bold]{report.strategy}[/] ha jugado [bold]{report.words}[/] palabras "
+        f"con [bold]{report.workers}[/] procesos\n"
+    )
+    console.print(
+        f"Media de intentos: [bold]{report.get_mean_guesses():.3f}[/]  "
+        f"Fallos: [bold]{report.get_failure_rate():.2%}[/]  "
+        f"Palabras/s: [bold]{report.get_words_per_second():.0f}[/] "
+        f"([bold]{report.get_words_per_second_per_core():.0f}[/] por proceso)\n"
+    )
+    _print_distribution(report.distribution, max_attempts)
+
+    if report.failed:
+        shown = ", ".join(word.upper() for word in report.failed[:MAX_FAILED_SHOWN])
+        more = len(report.failed) - MAX_FAILED_SHOWN
+        console.print(f"No acertadas: {shown}" + (f" y [bold]{more}[/] más" if more > 0 else "") + "\n")
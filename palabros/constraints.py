@@ -0,0 +1,214 @@
+import re
+from typing import Dict, Iterable, List, NamedTuple, Optional, Pattern, Sequence, Tuple
+
+from palabros.schemas import Attempt, CharInspection
+
+# Every letter a normalized word can have
+ALPHABET = "abcdefghijklmnopqrstuvwxyzñ"
+
+_BITS = {char: 1 << i for i, char in enumerate(ALPHABET)}
+_ANY = (1 << len(ALPHABET)) - 1
+
+
+class Violation(NamedTuple):
+
+    """
+    A hint revealed so far which a guess doesn't reuse: either a valid letter missing from its position, or a letter
+    which the guess doesn't have as many times as revealed.
+    """
+
+    char: str
+    position: Optional[int] = None
+    count: int = 1
+
+
+class Constraints(NamedTuple):
+
+    """
+    The hints revealed by the attempts of a game, compiled into a compact form which checks any word in constant time.
+
+    Letters are bits of a mask, in the order of `ALPHABET`, and every position has a mask of the letters it can hold.
+    """
+
+    length: int
+    fixed: Tuple[Optional[str], ...]
+    allowed: Tuple[int, ...]
+    min_counts: Tuple[Tuple[str, int], ...]
+    max_counts: Tuple[Tuple[str, int], ...]
+
+    @property
+    def excluded(self) -> Tuple[str, ...]:
+
+        """
+        Get the letters known not to be in the seed word.
+
+        Returns:
+            The excluded letters.
+        """
+
+        return tuple(char for char, count in self.max_counts if count == 0)
+
+    def find_violation(self, word: str) -> Optional[Violation]:
+
+        """
+        Check if a guess reuses every hint revealed so far, as hard mode requires: every valid letter in its position,
+        and every valid or missplaced letter as many times as it was revealed.
+
+        Args:
+            word: The guess, normalized and lowercase.
+
+        Returns:
+            The first hint the guess doesn't reuse, or None if it reuses them all.
+        """
+
+        for i, char in enumerate(self.fixed):
+            if char is not None and word[i] != char:
+                return Violation(char, position=i)
+
+        for char, count in self.min_counts:
+            if word.count(char) < count:
+                return Violation(char, count=count)
+
+        return None
+
+    def matches(self, word: str) -> bool:
+
+        """
+        Check if a word could still be the seed word, given every hint revealed so far.
+
+        Args:
+            word: The word, normalized and lowercase.
+
+        Returns:
+            True if the word is consistent with every hint; otherwise False.
+        """
+
+        if len(word) != self.length:
+            return False
+
+        for char, mask in zip(word, self.allowed):
+            if not _BITS.get(char, 0) & mask:
+                return False
+
+        return all(word.count(char) >= count for char, count in self.min_counts) and all(
+            word.count(char) <= count for char, count in self.max_counts
+        )
+
+    def get_pattern(self, hard: bool = False) -> Pattern[str]:
+
+        """
+        Compile the position masks into a regular expression, which rules out most words without a Python loop.
+
+        Args:
+            hard: Whether to compile just the valid letters, which is all hard mode checks by position.
+
+        Returns:
+            The compiled regular expression.
+        """
+
+        classes = []
+        for char, mask in zip(self.fixed, self.allowed):
+            if hard:
+                classes.append(char if char is not None else ".")
+                continue
+            chars = "".join(letter for letter in ALPHABET if _BITS[letter] & mask)
+            classes.append(f"[{chars}]" if chars else "(?!)")
+        return re.compile("".join(classes))
+
+
+def compile_constraints(attempts: Iterable[Sequence[CharInspection]], length: int) -> Constraints:
+
+    """
+    Compile the hints revealed by some attempts.
+
+    A valid letter fixes its position, and a missplaced one rules its position out. Every letter must appear at least
+    as many times as it was marked valid or missplaced in a single attempt; and exactly that many if the same attempt
+    also had it absent, which rules it out altogether when it was never marked. Absent letters don't rule their
+    position out, since a letter repeated in a guess is absent once the seed word has no occurrences of it left.
+
+    Args:
+        attempts: The inspection of every char of every attempt, as given by `Attempt.chars`.
+        length: The word length.
+
+    Returns:
+        An instance of `Constraints`.
+    """
+
+    fixed: List[Optional[str]] = [None] * length
+    allowed = [_ANY] * length
+    min_counts: Dict[str, int] = {}
+    max_counts: Dict[str, int] = {}
+
+    for chars in attempts:
+        marked: Dict[str, int] = {}
+        absent = set()
+        for inspection in chars:
+            char = inspection.char.lower()
+            if inspection.valid:
+                fixed[inspection.position] = char
+                allowed[inspection.position] = _BITS.get(char, 0)
+                marked[char] = marked.get(char, 0) + 1
+            elif inspection.missplaced:
+                allowed[inspection.position] &= ~_BITS.get(char, 0)
+                marked[char] = marked.get(char, 0) + 1
+            else:
+                absent.add(char)
+        for char, count in marked.items():
+            min_counts[char] = max(min_counts.get(char, 0), count)
+        for char in absent:
+            max_counts[char] = min(max_counts.get(char, length), marked.get(char, 0))
+
+    return Constraints(
+        length=length,
+        fixed=tuple(fixed),
+        allowed=tuple(allowed),
+        min_counts=tuple(sorted(min_counts.items())),
+        max_counts=tuple(sorted(max_counts.items())),
+    )
+
+
+def from_attempts(attempts: Iterable[Attempt], length: int) -> Constraints:
+
+    """
+    Compile the hints revealed by the attempts of a game.
+
+    Args:
+        attempts: The attempts.
+        length: The word length of the game.
+
+    Returns:
+        An instance of `Constraints`.
+    """
+
+    return compile_constraints((attempt.chars for attempt in attempts), length)
+
+
+def filter_words(words: Iterable[str], constraints: Constraints, hard: bool = False) -> List[str]:
+
+    """
+    Keep the words allowed by some constraints, at once.
+
+    The position masks rule most words out through a single compiled regular expression, and just the words left are
+    checked for their letter counts.
+
+    Args:
+        words: The words, normalized and lowercase.
+        constraints: The constraints.
+        hard: Whether to keep every word which could be played in hard mode, instead of the words which could still
+            be the seed word.
+
+    Returns:
+        The allowed words, in the same order.
+    """
+
+    match = constraints.get_pattern(hard).fullmatch
+    min_counts = constraints.min_counts
+    max_counts = () if hard else constraints.max_counts
+
+    return [
+        word
+        for word in words
+        if match(word)
+        and all(word.count(char) >= count for char, count in min_counts)
+        and all(word.count(char) <= count for char, count in max_counts)
+    ]
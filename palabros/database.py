@@ -1,17 +1,189 @@
+import atexit
 import json
 import os
 import sqlite3
+import threading
 from contextlib import contextmanager
+from itertools import islice
 from pathlib import Path
-from typing import Generator
+from typing import (
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 
-from palabros import __version__
+from palabros import __version__, profiling
 from palabros.errors import DatabaseError
 from palabros.queries import Query
 
 _APP_PATH = Path.home().joinpath(".palabros")
 _DB_PATH = _APP_PATH.joinpath("games.db")
 _WORDS_JSON_PATH = Path(__file__).parent.joinpath("words.json")
+_READ_BUFFER_SIZE = 65536
+
+# Bump it whenever a migration is added, so the initialization marker of existing databases gets outdated
+_SCHEMA_REVISION = 7
+_JSON_WHITESPACE = frozenset(" \t\r\n")
+_JSON_DELIMITERS = _JSON_WHITESPACE | {",", ":", "}"}
+_MISSING = object()
+
+# The states of the dictionary file reader, and the chars moving it from one to another
+_JSON_OBJECT, _JSON_FIRST_WORD, _JSON_WORD, _JSON_COLON, _JSON_VALUE, _JSON_NEXT, _JSON_END = range(7)
+_JSON_TRANSITIONS: Dict[int, Dict[str, int]] = {
+    _JSON_OBJECT: {"{": _JSON_FIRST_WORD},
+    _JSON_FIRST_WORD: {"}": _JSON_END},
+    _JSON_WORD: {},
+    _JSON_COLON: {":": _JSON_VALUE},
+    _JSON_VALUE: {},
+    _JSON_NEXT: {",": _JSON_WORD, "}": _JSON_END},
+    _JSON_END: {},
+}
+# The states where a word or a frequency comes next
+_JSON_TOKENS = frozenset({_JSON_FIRST_WORD, _JSON_WORD, _JSON_VALUE})
+
+# Room enough for every statement in the `Query` catalog, so they are prepared just once per connection
+_STATEMENT_CACHE_SIZE = 128
+
+_SESSION_PRAGMAS = (
+    "PRAGMA journal_mode = WAL;",
+    "PRAGMA synchronous = NORMAL;",
+    "PRAGMA mmap_size = 268435456;",
+    "PRAGMA cache_size = -8192;",
+)
+
+_local = threading.local()
+_connections: List[sqlite3.Connection] = []
+_connections_lock = threading.Lock()
+_generation = 0
+
+# The databases already initialized by this process
+_initialized: Set[str] = set()
+
+
+def get_db_path() -> str:
+
+    """
+    Get the path of the database in use.
+
+    Returns:
+        The database path, which can be overridden with the `PALABROS_DB_PATH` environment variable.
+    """
+
+    return os.getenv("PALABROS_DB_PATH", str(_DB_PATH))
+
+
+def get_sidecar_path(suffix: str) -> Optional[Path]:
+
+    """
+    Get the path of a file stored next to the database in use.
+
+    Args:
+        suffix: The suffix appended to the database file name.
+
+    Returns:
+        The file path, or None if the database doesn't live in a regular file.
+    """
+
+    path = get_db_path()
+
+    if path.startswith("file:") or path == ":memory:":
+        return None
+
+    db_path = Path(path)
+    return db_path.with_name(f"{db_path.name}{suffix}")
+
+
+@profiling.timed("connect")
+def _connect(path: str) -> sqlite3.Connection:
+
+    """
+    Open a new connection to the database and set it up for the current session.
+
+    Args:
+        path: The database path.
+
+    Returns:
+        An instance of `sqlite3.Connection`.
+    """
+
+    conn = sqlite3.connect(
+        path,
+        isolation_level=None,
+        check_same_thread=False,
+        cached_statements=_STATEMENT_CACHE_SIZE,
+        uri=True,
+    )
+    conn.row_factory = sqlite3.Row
+
+    for pragma in _SESSION_PRAGMAS:
+        conn.execute(pragma)
+
+    with _connections_lock:
+        _connections.append(conn)
+
+    return conn
+
+
+def get_connection() -> sqlite3.Connection:
+
+    """
+    Get the connection of the current thread, opening it the first time.
+
+    Every thread keeps a long-lived connection, which is reopened only when the database path changes or after
+    calling `close`.
+
+    Returns:
+        An instance of `sqlite3.Connection`.
+
+    Raises:
+        DatabaseError: if the connection could not be opened.
+    """
+
+    path = get_db_path()
+    conn = getattr(_local, "conn", None)
+
+    if conn is None or _local.path != path or _local.generation != _generation:
+        try:
+            conn = _connect(path)
+        except sqlite3.DatabaseError as err:
+            raise DatabaseError(str(err)) from err
+        _local.conn = conn
+        _local.path = path
+        _local.generation = _generation
+
+    return conn
+
+
+def close() -> None:
+
+    """
+    Close every connection opened by any thread.
+
+    This is registered as an exit hook, but it can be called at any time: the next database access will just open
+    a fresh connection.
+    """
+
+    global _generation
+
+    with _connections_lock:
+        connections = list(_connections)
+        _connections.clear()
+        _generation += 1
+
+    for conn in connections:
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+
+
+atexit.register(close)
 
 
 @contextmanager
@@ -20,6 +192,8 @@ def db_cursor() -> Generator[sqlite3.Cursor, None, None]:
     """
     Create a cursor to interact with the database.
 
+    While profiling, the cursor is wrapped to measure every statement run through it.
+
     Yields:
         An instance of `sqlite3.Cursor`.
 
@@ -28,71 +202,227 @@ def db_cursor() -> Generator[sqlite3.Cursor, None, None]:
     """
 
     try:
-        with sqlite3.connect(
-            os.getenv("PALABROS_DB_PATH", str(_DB_PATH)),
-            isolation_level=None,
-        ) as conn:
-            conn.row_factory = sqlite3.Row
-            cur = conn.cursor()
-            yield cur
+        cur = get_connection().cursor()
+        try:
+            yield profiling.ProfiledCursor(cur) if profiling.is_enabled() else cur
+        finally:
+            cur.close()
     except sqlite3.DatabaseError as err:
         raise DatabaseError(str(err)) from err
 
 
-def _generate_words_population_query() -> str:
+@contextmanager
+def db_transaction() -> Generator[sqlite3.Cursor, None, None]:
+
+    """
+    Create a cursor to interact with the database within a write transaction.
+
+    The transaction takes the database write lock from the very beginning, so concurrent writers wait for it instead
+    of failing halfway. It is committed on exit, or rolled back if any error is raised.
+
+    Yields:
+        An instance of `sqlite3.Cursor`.
+
+    Raises:
+        DatabaseError: if any error occurred while working with the database.
+    """
+
+    with db_cursor() as cur:
+        cur.execute(Query.BeginImmediate)
+        try:
+            yield cur
+        except BaseException:
+            cur.execute(Query.Rollback)
+            raise
+        cur.execute(Query.Commit)
+
+
+def read_words(path: Path = _WORDS_JSON_PATH, buffer_size: int = _READ_BUFFER_SIZE) -> Iterator[Tuple[str, float]]:
+
+    """
+    Read a JSON dictionary file incrementally, without loading it whole in memory.
+
+    The file must contain a single JSON object, mapping every word to its frequency.
+
+    Args:
+        path: The dictionary file path.
+        buffer_size: The number of characters read from the file at once.
 
+    Yields:
+        Every word along with its frequency.
+
+    Raises:
+        DatabaseError: if the file has not the expected format.
     """
-    Generate the query to populate the words table.
+
+    decoder = json.JSONDecoder()
+    buffer = ""
+    pos = 0
+    eof = False
+    # What comes next: the opening brace, a word, a colon, a frequency, a comma or the closing brace, or nothing
+    state = _JSON_OBJECT
+    word = ""
+
+    with open(path, encoding="utf-8") as f:
+        while True:
+            while pos < len(buffer) and buffer[pos] in _JSON_WHITESPACE:
+                pos += 1
+
+            if pos == len(buffer):
+                if eof:
+                    break
+                chunk = f.read(buffer_size)
+                buffer, pos, eof = chunk, 0, not chunk
+                continue
+
+            transitions = _JSON_TRANSITIONS[state]
+
+            if buffer[pos] in transitions:
+                state = transitions[buffer[pos]]
+                pos += 1
+                continue
+
+            if state not in _JSON_TOKENS:
+                raise DatabaseError(f"El diccionario [bold]{path}[/] no tiene un formato válido")
+
+            try:
+                token, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                token, end = _MISSING, len(buffer)
+
+            # A token not followed by a delimiter could be truncated, so read a bit more before trusting it
+            if (end == len(buffer) or buffer[end] not in _JSON_DELIMITERS) and not eof:
+                chunk = f.read(buffer_size)
+                buffer, pos, eof = buffer[pos:] + chunk, 0, not chunk
+                continue
+
+            if state == _JSON_VALUE:
+                if isinstance(token, bool) or not isinstance(token, (int, float)):
+                    raise DatabaseError(f"El diccionario [bold]{path}[/] no tiene un formato válido")
+                yield word, float(token)
+                state = _JSON_NEXT
+            else:
+                if not isinstance(token, str):
+                    raise DatabaseError(f"El diccionario [bold]{path}[/] no tiene un formato válido")
+                word = token
+                state = _JSON_COLON
+
+            pos = end
+
+    if state != _JSON_END:
+        raise DatabaseError(f"El diccionario [bold]{path}[/] no tiene un formato válido")
+
+
+def populate_words(
+    words: Iterable[Tuple[str, float]],
+    chunk_size: int = 1000,
+    progress: Optional[Callable[[int], None]] = None,
+) -> int:
+
+    """
+    Add the given words to the dictionary, or update their frequency if they already exist.
+
+    The words are inserted in chunks, each one in its own transaction, so memory stays bounded whatever the number of
+    words. Every chunk bumps the dictionary revision, so the processes holding the dictionary in memory reload it.
+
+    Args:
+        words: The words to add, along with their frequency.
+        chunk_size: The number of words inserted per transaction.
+        progress: An optional callback, called after every chunk with the number of words loaded so far.
 
     Returns:
-        The query, ready to execute.
+        The number of words loaded.
     """
 
-    with open(_WORDS_JSON_PATH) as f:
-        words = json.load(f)
-    values = ", ".join([f"('{k}', {v})" for k, v in words.items()])
-    return Query.PopulateWordsTable.format(values)
+    total = 0
+    iterator = iter(words)
+
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            break
+        with db_transaction() as cur:
+            cur.executemany(Query.UpsertWord, chunk)
+            cur.execute(Query.BumpWordsRevision)
+        total += len(chunk)
+        if progress is not None:
+            progress(total)
 
+    return total
 
-def _table_exists(table: str) -> bool:
+
+def _get_marker_path(db_path: Path) -> Path:
 
     """
-    Check if the given table exists in the database.
+    Get the path of the marker telling the given database is already initialized.
 
     Args:
-        table: The table to check.
+        db_path: The database path.
 
     Returns:
-        True if the table exists in the database; otherwise False.
+        The marker path, next to the database.
     """
 
-    with db_cursor() as cur:
-        cur.execute(Query.TableExists, (table,))
-        result = cur.fetchone()
+    return db_path.with_name(f"{db_path.name}.init")
 
-    return result is not None and bool(result["total"])
 
+def _get_marker_content() -> str:
 
-def init() -> None:
+    """
+    Get the expected content of an up to date initialization marker.
 
+    Returns:
+        The marker content.
     """
-    Initialize the database.
+
+    return f"{__version__}:{_SCHEMA_REVISION}"
+
+
+def _write_marker(db_path: Path) -> None:
+
     """
+    Write the initialization marker of the given database, unless it's not a regular file.
 
-    if not _APP_PATH.exists():
-        _APP_PATH.mkdir(parents=True, exist_ok=True)
+    Args:
+        db_path: The database path.
+    """
 
-    if _DB_PATH.exists():
-        if _table_exists("versions"):
+    if db_path.exists():
+        _get_marker_path(db_path).write_text(_get_marker_content())
+
+
+def init(progress: Optional[Callable[[int, int], None]] = None) -> None:
+
+    """
+    Initialize the database, creating it or applying the pending migrations.
+
+    Once the database is initialized, a marker file is written next to it, so later runs can skip the whole process
+    with a single file read instead of querying the database. Within the same process, it's skipped altogether.
+
+    Args:
+        progress: An optional callback, called after every migration step with the number of steps run so far and
+            the total.
+    """
+
+    path = get_db_path()
+
+    if path in _initialized:
+        return
+
+    db_path = Path(path)
+
+    try:
+        if db_path.exists() and _get_marker_path(db_path).read_text() == _get_marker_content():
+            _initialized.add(path)
             return
-        # Force old database rebuilding
-        _DB_PATH.unlink(missing_ok=True)
+    except OSError:
+        pass
 
-    with db_cursor() as cur:
-        cur.execute(Query.CreateVersionsTable)
-        cur.execute(Query.CreateWordsTable)
-        cur.execute(Query.CreateGamesTable)
-        cur.execute(Query.CreateAttemptsTable)
-        cur.execute(Query.CreateGamesDateIndex)
-        cur.execute(Query.CreateVersion, (__version__,))
-        cur.execute(_generate_words_population_query())
+    if not db_path.parent.exists():
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+
+    from palabros import migrations
+
+    migrations.migrate(progress)
+    _write_marker(db_path)
+    _initialized.add(path)
@@ -0,0 +1,191 @@
+import hashlib
+import threading
+from dataclasses import dataclass
+from itertools import islice
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+from palabros.database import read_words
+from palabros.normalization import normalize_batch
+from palabros.storage import Storage, get_storage
+
+
+@dataclass(frozen=True)
+class Dictionary:
+
+    """
+    An in-memory, read-only snapshot of the storage dictionary.
+    """
+
+    revision: int
+    version: str
+    words: Tuple[str, ...]
+    frequencies: Tuple[float, ...]
+    index: Dict[str, int]
+
+    def __contains__(self, word: object) -> bool:
+
+        """
+        Check if the given word exists in the dictionary.
+
+        Args:
+            word: The word to check, already normalized.
+
+        Returns:
+            True if the word exists in the dictionary; otherwise False.
+        """
+
+        return word in self.index
+
+    def __len__(self) -> int:
+
+        """
+        Get the number of words in the dictionary.
+
+        Returns:
+            The number of words.
+        """
+
+        return len(self.words)
+
+
+_cache: Dict[Tuple[Storage, Optional[int]], Dictionary] = {}
+_cache_lock = threading.Lock()
+
+
+def _load(length: Optional[int]) -> Dictionary:
+
+    """
+    Load the dictionary, or just the partition of the words with the given length, from the storage in use.
+
+    The words are sorted by frequency, the most common first, and the version is a digest of the whole content, so
+    any change in the words or their frequencies gives a different version. The storage revision is read before the
+    words, so a change made while they're read is found by the next `refresh`.
+
+    Args:
+        length: The word length, or None to load every word.
+
+    Returns:
+        An instance of `Dictionary`.
+    """
+
+    storage = get_storage()
+    revision = storage.get_words_revision()
+    rows = storage.get_words(length)
+    words = tuple(word for word, _ in rows)
+    frequencies = tuple(frequency for _, frequency in rows)
+    digest = hashlib.sha1("\n".join(f"{w}:{f}" for w, f in zip(words, frequencies)).encode())
+
+    return Dictionary(
+        revision=revision,
+        version=digest.hexdigest(),
+        words=words,
+        frequencies=frequencies,
+        index={word: i for i, word in enumerate(words)},
+    )
+
+
+def get_dictionary(length: Optional[int] = None) -> Dictionary:
+
+    """
+    Get the dictionary of the storage in use, loading it the first time.
+
+    Every word length has its own partition, loaded on its own through the length index of the storage, so games of a
+    given length never touch the words of any other. Once loaded, checking a word never touches the storage; long
+    running processes call `refresh` once per request to find the words loaded by any other process, such as
+    `palabros load-words` while `palabros serve` runs.
+
+    Args:
+        length: The word length, or None to get every word.
+
+    Returns:
+        An instance of `Dictionary`.
+    """
+
+    storage = get_storage()
+    key = (storage, length)
+    dictionary = _cache.get(key)
+
+    if dictionary is None:
+        with _cache_lock:
+            dictionary = _cache.get(key)
+            if dictionary is None:
+                dictionary = _cache[key] = _load(length)
+
+    return dictionary
+
+
+def refresh() -> None:
+
+    """
+    Check the revision of the storage in use, dropping its loaded dictionaries if it changed, so they're loaded again
+    on the next access.
+
+    This is a single lookup, meant to be run once per request or command rather than once per word.
+    """
+
+    storage = get_storage()
+    revision = storage.get_words_revision()
+
+    with _cache_lock:
+        for key in [
+            key for key, dictionary in _cache.items() if key[0] is storage and dictionary.revision != revision
+        ]:
+            del _cache[key]
+
+
+def invalidate() -> None:
+
+    """
+    Drop every loaded dictionary, so it's loaded again on the next access.
+
+    Words added through the storage bump its revision, which `refresh` finds; this is just needed when the words are
+    changed some other way.
+    """
+
+    with _cache_lock:
+        _cache.clear()
+
+
+def normalize_words(words: Iterable[Tuple[str, float]], chunk_size: int = 1000) -> Iterator[Tuple[str, float]]:
+
+    """
+    Normalize the words of a dictionary being imported, so it stores the very keys guesses are looked up with.
+
+    Args:
+        words: The words, along with their frequency.
+        chunk_size: The number of words normalized at once.
+
+    Yields:
+        Every normalized word along with its frequency.
+    """
+
+    iterator = iter(words)
+
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield from zip(normalize_batch([word for word, _ in chunk]), (frequency for _, frequency in chunk))
+
+
+def import_words(path: Path, progress: Optional[Callable[[int], None]] = None) -> int:
+
+    """
+    Import the words of a JSON dictionary file, adding the new ones and updating the frequency of the existing ones.
+
+    The file is streamed, so it can be as big as needed, and the database doesn't need to be rebuilt. Words are
+    normalized on the way in.
+
+    Args:
+        path: The dictionary file path.
+        progress: An optional callback, called from time to time with the number of words imported so far.
+
+    Returns:
+        The number of words imported.
+    """
+
+    try:
+        return get_storage().add_words(normalize_words(read_words(path)), progress=progress)
+    finally:
+        invalidate()
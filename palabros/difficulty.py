@@ -0,0 +1,61 @@
+from typing import Callable, List, Optional, Tuple
+
+from palabros import simulation
+from palabros.business import MAX_WORD_LENGTH, MIN_WORD_LENGTH
+from palabros.storage import get_storage
+
+# The solver words are rated against: it always guesses the most frequent candidate left, so it's deterministic and
+# quick enough to play the whole dictionary
+REFERENCE_STRATEGY = "frequency"
+
+
+def _get_lengths() -> List[int]:
+
+    """
+    Get the word lengths games can be played with which have any word in the dictionary.
+
+    Returns:
+        The word lengths, in ascending order.
+    """
+
+    return [length for length in get_storage().get_word_lengths() if MIN_WORD_LENGTH <= length <= MAX_WORD_LENGTH]
+
+
+def rate_words(
+    length: Optional[int] = None,
+    workers: Optional[int] = None,
+    progress: Optional[Callable[[int], None]] = None,
+) -> List[Tuple[int, int]]:
+
+    """
+    Rate the difficulty of every dictionary word, as the number of guesses the reference solver needs to guess it.
+
+    This is an offline batch job: the words of every length are played across a pool of worker processes, and their
+    difficulty is stored, in the `words.difficulty` column of SQLite databases, in a single transaction per length. It
+    has to run again whenever the dictionary changes, since new words are left unrated and the solver may play the
+    others differently.
+
+    Args:
+        length: The word length to rate, or None to rate every length.
+        workers: The number of worker processes. 1 rates every word in the current process; None uses every core.
+        progress: An optional callback, called from time to time with the number of words rated so far.
+
+    Returns:
+        The number of words rated per word length.
+    """
+
+    rated: List[Tuple[int, int]] = []
+    done = 0
+
+    for current in [length] if length is not None else _get_lengths():
+        guesses = simulation.get_guesses(
+            current,
+            REFERENCE_STRATEGY,
+            workers=workers,
+            progress=(lambda total: progress(done + total)) if progress is not None else None,
+        )
+        get_storage().set_difficulties(guesses.items())
+        done += len(guesses)
+        rated.append((current, len(guesses)))
+
+    return rated
@@ -0,0 +1,331 @@
+import json
+import time
+from itertools import islice
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    TextIO,
+    Tuple,
+)
+
+from palabros.business import (
+    MAX_ATTEMPTS_LIMIT,
+    MAX_WORD_LENGTH,
+    MIN_ATTEMPTS,
+    MIN_WORD_LENGTH,
+)
+from palabros.constraints import from_attempts
+from palabros.dictionary import get_dictionary
+from palabros.normalization import normalize
+from palabros.schemas import DEFAULT_PLAYER, MAX_ATTEMPTS, Attempt, Game
+from palabros.scoring import get_match_pattern, score
+from palabros.storage import get_storage
+
+# The number of games written per transaction
+CHUNK_SIZE = 1000
+
+
+class HistoryGame(NamedTuple):
+
+    """
+    A game as it's stored in a history file: a JSON object per line.
+    """
+
+    player_id: str
+    date: str
+    word: str
+    attempts: Tuple[str, ...]
+    max_attempts: int = MAX_ATTEMPTS
+    hard: bool = False
+
+
+class ImportReport(NamedTuple):
+
+    """
+    The outcome of a history import.
+    """
+
+    games: int
+    attempts: int
+    skipped: int
+    rejected: int
+    elapsed: float
+
+    def get_attempts_per_second(self) -> float:
+
+        """
+        Get the import throughput.
+
+        Returns:
+            The number of attempts imported per second.
+        """
+
+        return self.attempts / self.elapsed if self.elapsed else 0.0
+
+
+def _parse_game(line: str) -> Optional[HistoryGame]:
+
+    """
+    Parse a line of a history file.
+
+    Args:
+        line: The line to parse.
+
+    Returns:
+        An instance of `HistoryGame`, or None if the line is not a valid game.
+    """
+
+    try:
+        data = json.loads(line)
+        game = HistoryGame(
+            data.get("player", DEFAULT_PLAYER),
+            data["date"],
+            data["word"],
+            tuple(data["attempts"]),
+            data.get("max_attempts", MAX_ATTEMPTS),
+            data.get("hard", False),
+        )
+    except (ValueError, TypeError, KeyError, AttributeError):
+        return None
+
+    if not all(isinstance(value, str) for value in (game.player_id, game.date, game.word, *game.attempts)):
+        return None
+
+    if len(game.date) != 8 or not game.date.isdigit():
+        return None
+
+    if not isinstance(game.max_attempts, int) or not MIN_ATTEMPTS <= game.max_attempts <= MAX_ATTEMPTS_LIMIT:
+        return None
+
+    if not isinstance(game.hard, bool):
+        return None
+
+    return game
+
+
+def read_games(f: TextIO) -> Iterator[Optional[HistoryGame]]:
+
+    """
+    Read the games of a history file, a line at a time.
+
+    Args:
+        f: The history file.
+
+    Yields:
+        Every game, or None for every line which is not a valid game.
+    """
+
+    for line in f:
+        if line.strip():
+            yield _parse_game(line)
+
+
+def _score_game(game: HistoryGame, unknown: Set[str]) -> Optional[List[Tuple[str, bool, int]]]:
+
+    """
+    Score the attempts of a game the same way they're scored when played.
+
+    Args:
+        game: The game.
+        unknown: The normalized words of the game which don't exist in the dictionary.
+
+    Returns:
+        The word, whether it's a match and the packed pattern of every attempt; or None if any word is not in the
+        dictionary, the game has more attempts than it could have been played, or any attempt of a hard mode game
+        doesn't reuse the hints revealed before it.
+    """
+
+    seed = normalize(game.word)
+    if (
+        not MIN_WORD_LENGTH <= len(seed) <= MAX_WORD_LENGTH
+        or seed in unknown
+        or len(game.attempts) > game.max_attempts
+    ):
+        return None
+
+    match_pattern = get_match_pattern(len(seed))
+    scored = []
+    played: List[Attempt] = []
+
+    for i, word in enumerate(game.attempts):
+        normalized = normalize(word)
+        if len(normalized) != len(seed) or normalized in unknown:
+            return None
+        if game.hard and from_attempts(played, len(seed)).find_violation(normalized) is not None:
+            return None
+        pattern = score(seed, normalized)
+        match = pattern == match_pattern
+        # Nothing can be played once the word is guessed
+        if match and i != len(game.attempts) - 1:
+            return None
+        scored.append((word, match, pattern))
+        if game.hard:
+            played.append(Attempt(0, word, match, pattern=pattern))
+
+    return scored
+
+
+def import_games(
+    games: Iterable[Optional[HistoryGame]],
+    chunk_size: int = CHUNK_SIZE,
+    progress: Optional[Callable[[int], None]] = None,
+) -> ImportReport:
+
+    """
+    Import a game history, adding the games which don't exist yet.
+
+    The games are streamed and added to the storage in use in chunks, each one in its own transaction, so memory stays
+    bounded whatever the size of the history. The words of every chunk are checked against the dictionary partitions
+    of their length at once, and the attempts are scored just as they are when played. Games already existing for the
+    same player, date and word length are skipped, so an import can be run again after a failure. The statistics are
+    rebuilt once at the end.
+
+    Args:
+        games: The games to import, with None for every unparseable one.
+        chunk_size: The number of games written per transaction.
+        progress: An optional callback, called after every chunk with the number of games read so far.
+
+    Returns:
+        An instance of `ImportReport`.
+    """
+
+    storage = get_storage()
+    iterator = iter(games)
+    imported = attempts = skipped = rejected = read = 0
+    start = time.perf_counter()
+
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            break
+
+        # Every distinct word of the chunk is looked up just once, in the dictionary partition of its length
+        words = {normalize(word) for game in chunk if game is not None for word in (game.word, *game.attempts)}
+        dictionaries = {length: get_dictionary(length) for length in {len(word) for word in words}}
+        unknown = {word for word in words if word not in dictionaries[len(word)]}
+
+        pending: List[Game] = []
+        for game in chunk:
+            scored = _score_game(game, unknown) if game is not None else None
+            if scored is None:
+                rejected += 1
+                continue
+            # The seed is stored normalized, as the dictionary words games are created with
+            pending.append(
+                Game(
+                    0,
+                    normalize(game.word),
+                    game.date,
+                    [Attempt(0, word, match, pattern=pattern) for word, match, pattern in scored],
+                    game.max_attempts,
+                    game.player_id,
+                    game.hard,
+                )
+            )
+
+        added = storage.add_games(pending)
+        imported += len(added)
+        attempts += sum(len(new.attempts) for new in added)
+        skipped += len(pending) - len(added)
+
+        read += len(chunk)
+        if progress is not None:
+            progress(read)
+
+    storage.rebuild_stats()
+
+    return ImportReport(imported, attempts, skipped, rejected, time.perf_counter() - start)
+
+
+def import_file(path: Path, progress: Optional[Callable[[int], None]] = None) -> ImportReport:
+
+    """
+    Import the game history of a JSONL file, a game per line.
+
+    Args:
+        path: The history file path.
+        progress: An optional callback, called from time to time with the number of games read so far.
+
+    Returns:
+        An instance of `ImportReport`.
+    """
+
+    with open(path, encoding="utf-8") as f:
+        return import_games(read_games(f), progress=progress)
+
+
+def export_games() -> Iterator[HistoryGame]:
+
+    """
+    Read the whole game history, streaming it from the storage in use.
+
+    Yields:
+        Every game, ordered by player and date.
+    """
+
+    for game in get_storage().get_games():
+        yield HistoryGame(
+            game.player_id,
+            game.date,
+            game.word,
+            tuple(attempt.word for attempt in game.attempts),
+            game.max_attempts,
+            game.hard,
+        )
+
+
+def _dump_game(game: HistoryGame) -> str:
+
+    """
+    Serialize a game as a line of a history file.
+
+    Args:
+        game: The game.
+
+    Returns:
+        The JSON line, without the line break.
+    """
+
+    data: Dict[str, Any] = {
+        "player": game.player_id,
+        "date": game.date,
+        "word": game.word,
+        "attempts": list(game.attempts),
+        "max_attempts": game.max_attempts,
+        "hard": game.hard,
+    }
+    return json.dumps(data, ensure_ascii=False)
+
+
+def export_file(path: Path, progress: Optional[Callable[[int], None]] = None) -> int:
+
+    """
+    Export the whole game history to a JSONL file, a game per line.
+
+    Args:
+        path: The history file path.
+        progress: An optional callback, called from time to time with the number of games written so far.
+
+    Returns:
+        The number of games exported.
+    """
+
+    total = 0
+
+    with open(path, "w", encoding="utf-8") as f:
+        for game in export_games():
+            f.write(_dump_game(game))
+            f.write("\n")
+            total += 1
+            if progress is not None and not total % CHUNK_SIZE:
+                progress(total)
+
+    return total
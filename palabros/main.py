@@ -1,14 +1,53 @@
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
 import typer
 
-from palabros import business, console, database
+from palabros import business, console, dictionary, history, profiling, storage
 from palabros.errors import DatabaseError, GameError
+from palabros.schemas import MAX_ATTEMPTS
 
-database.init()
 app = typer.Typer()
 
+_LENGTH_OPTION = typer.Option(business.WORD_LENGTH, "--length", "-l", help="The word length of the game.")
+
+
+@app.callback()
+def _main(
+    profile: bool = typer.Option(
+        False,
+        "--profile",
+        help=f"Print where the command spends its time when it exits. Set {profiling.ENV_VAR}=json to get JSON lines.",
+    ),
+) -> None:
+
+    """
+    Guess the word of the day.
+    \f
+
+    Args:
+        profile: Whether to profile the command.
+    """
+
+    if profile:
+        profiling.enable(os.getenv(profiling.ENV_VAR) or "table")
+
 
 @app.command("play")
-def _play_game(word: str) -> None:
+def _play_game(
+    word: str,
+    length: int = _LENGTH_OPTION,
+    attempts: int = typer.Option(MAX_ATTEMPTS, "--attempts", "-a", help="The number of attempts of a new game."),
+    difficulty: Optional[str] = typer.Option(
+        None,
+        "--difficulty",
+        "-d",
+        help="The difficulty of the word of a new game, such as 4, or a range, such as 3-5.",
+    ),
+    hard: bool = typer.Option(False, "--hard", help="Play a new game in hard mode, reusing every hint revealed."),
+) -> None:
 
     """
     Try to guess the seed word using WORD.
@@ -16,21 +55,31 @@ def _play_game(word: str) -> None:
 
     Args:
         word: The word which he player is playing with.
+        length: The word length of the game.
+        attempts: The number of attempts of a new game.
+        difficulty: The difficulty band of the word of a new game.
+        hard: Whether a new game is played in hard mode.
 
     Raises:
         Exit: if an error occurred while executing the command.
     """
 
-    if len(word) != business.WORD_LENGTH:
-        console.print_error(f"La palabra tiene que tener [bold]{business.WORD_LENGTH}[/] letras")
+    try:
+        band = business.parse_difficulty(difficulty) if difficulty is not None else None
+    except GameError as err:
+        console.print_error(err.message)
         raise typer.Exit()
 
-    if not business.word_exists(word):
-        console.print_error(f"La palabra [bold]{word}[/] no existe en el diccionario")
+    try:
+        storage.init(progress=console.print_migration)
+        business.check_variant(length, attempts)
+        business.check_word(word, length)
+    except (DatabaseError, GameError) as err:
+        console.print_error(err.message)
         raise typer.Exit()
 
     try:
-        game = business.get_current_game()
+        game = business.get_current_game(length=length, max_attempts=attempts, difficulty=band, hard=hard)
 
         if not game.any_match() and game.any_attempt_left():
             attempt = business.play_game(game, word)
@@ -44,8 +93,39 @@ def _play_game(word: str) -> None:
         console.print_result(game)
 
 
+@app.command("hint")
+def _get_hint(length: int = _LENGTH_OPTION) -> None:
+
+    """
+    Suggest the best words to try next in today's game.
+    \f
+
+    Args:
+        length: The word length of the game.
+
+    Raises:
+        Exit: if an error occurred while executing the command.
+    """
+
+    try:
+        storage.init(progress=console.print_migration)
+        game = business.get_current_game(length=length)
+
+        if game.any_match() or not game.any_attempt_left():
+            console.print_error("La partida de hoy ya ha terminado")
+            raise typer.Exit()
+
+        candidates = business.get_candidates(game)
+        suggestions = business.suggest_guesses(game)
+
+    except (DatabaseError, GameError) as err:
+        console.print_error(err.message)
+    else:
+        console.print_suggestions(len(candidates), suggestions)
+
+
 @app.command("results")
-def _view_results(date: str) -> None:
+def _view_results(date: str, length: int = _LENGTH_OPTION) -> None:
 
     """
     Check the results of a given DATE.
@@ -53,13 +133,262 @@ def _view_results(date: str) -> None:
 
     Args:
         date: The date, given in YYYYMMDD format.
+        length: The word length of the game.
 
     Raises:
         Exit: if an error occurred while executing the command.
     """
 
-    console.print_error("Esta funcionalidad aún no está implementada")
-    raise typer.Exit()
+    try:
+        datetime.strptime(date, "%Y%m%d")
+    except ValueError:
+        console.print_error(f"La fecha [bold]{date}[/] no tiene el formato AAAAMMDD")
+        raise typer.Exit()
+
+    try:
+        storage.init(progress=console.print_migration)
+        game = business.get_game(date, length=length)
+        stats = business.get_stats()
+    except (DatabaseError, GameError) as err:
+        console.print_error(err.message)
+    else:
+        console.print_results(game, stats)
+
+
+@app.command("load-words")
+def _load_words(path: Path) -> None:
+
+    """
+    Load the words of the JSON file PATH into the dictionary, adding the new ones and updating the existing ones.
+    \f
+
+    Args:
+        path: The path of a JSON file which maps every word to its frequency.
+
+    Raises:
+        Exit: if an error occurred while executing the command.
+    """
+
+    try:
+        storage.init(progress=console.print_migration)
+        total = dictionary.import_words(path, progress=console.print_progress)
+    except (DatabaseError, OSError) as err:
+        console.print_error(str(err))
+        raise typer.Exit()
+
+    console.print_message(f"Se han cargado [bold]{total}[/] palabras")
+
+
+@app.command("rate-words")
+def _rate_words(
+    length: Optional[int] = typer.Option(
+        None, "--length", "-l", help="The word length to rate, every one by default."
+    ),
+    workers: Optional[int] = typer.Option(None, "--workers", "-w", min=1, help="The number of worker processes."),
+) -> None:
+
+    """
+    Rate the difficulty of every dictionary word, so new games can be played with words of a given difficulty.
+    \f
+
+    Args:
+        length: The word length to rate, every one by default.
+        workers: The number of worker processes, every core by default.
+
+    Raises:
+        Exit: if an error occurred while executing the command.
+    """
+
+    from palabros import difficulty
+
+    try:
+        storage.init(progress=console.print_migration)
+        rated = difficulty.rate_words(length, workers=workers, progress=console.print_progress)
+    except (DatabaseError, GameError) as err:
+        console.print_error(err.message)
+        raise typer.Exit()
+
+    if not rated:
+        console.print_message("No hay palabras que puntuar")
+        return
+
+    summary = ", ".join(f"[bold]{total}[/] palabras de [bold]{current}[/] letras" for current, total in rated)
+    console.print_message(f"Se han puntuado {summary}")
+
+
+@app.command("export")
+def _export_history(path: Path) -> None:
+
+    """
+    Export the game history of every player to the JSONL file PATH, a game per line.
+    \f
+
+    Args:
+        path: The path of the JSONL file.
+
+    Raises:
+        Exit: if an error occurred while executing the command.
+    """
+
+    try:
+        storage.init(progress=console.print_migration)
+        total = history.export_file(path, progress=console.print_progress)
+    except (DatabaseError, OSError) as err:
+        console.print_error(str(err))
+        raise typer.Exit()
+
+    console.print_message(f"Se han exportado [bold]{total}[/] partidas")
+
+
+@app.command("import")
+def _import_history(path: Path) -> None:
+
+    """
+    Import the game history of the JSONL file PATH, skipping the games which already exist.
+    \f
+
+    Args:
+        path: The path of a JSONL file, as written by the export command.
+
+    Raises:
+        Exit: if an error occurred while executing the command.
+    """
+
+    try:
+        storage.init(progress=console.print_migration)
+        report = history.import_file(path, progress=console.print_progress)
+    except (DatabaseError, OSError) as err:
+        console.print_error(str(err))
+        raise typer.Exit()
+
+    console.print_message(
+        f"Se han importado [bold]{report.games}[/] partidas y [bold]{report.attempts}[/] intentos "
+        f"([bold]{report.get_attempts_per_second():.0f}[/] intentos/s); "
+        f"se han saltado [bold]{report.skipped}[/] partidas que ya existían "
+        f"y [bold]{report.rejected}[/] que no son válidas"
+    )
+
+
+@app.command("simulate")
+def _simulate(
+    length: int = _LENGTH_OPTION,
+    attempts: int = typer.Option(MAX_ATTEMPTS, "--attempts", "-a", help="The number of attempts of every game."),
+    strategy: str = typer.Option(
+        "frequency", "--strategy", "-s", help="How guesses are chosen: frequency, entropy or random."
+    ),
+    workers: Optional[int] = typer.Option(None, "--workers", "-w", min=1, help="The number of worker processes."),
+    chunk_size: int = typer.Option(64, "--chunk-size", min=1, help="The number of words sent to a worker at once."),
+    seed: int = typer.Option(0, help="The seed of the random choices."),
+    limit: Optional[int] = typer.Option(None, min=1, help="Play just this many words, sampled with the seed."),
+) -> None:
+
+    """
+    Play a strategy against every dictionary word as the answer, and report how well and how fast it did.
+    \f
+
+    Args:
+        length: The word length of the games.
+        attempts: The number of attempts of every game.
+        strategy: How guesses are chosen.
+        workers: The number of worker processes, every core by default.
+        chunk_size: The number of words sent to a worker at once.
+        seed: The seed of the random choices.
+        limit: The number of words to play, every one by default.
+
+    Raises:
+        Exit: if an error occurred while executing the command.
+    """
+
+    from palabros import simulation
+
+    try:
+        storage.init(progress=console.print_migration)
+        business.check_variant(length, attempts)
+    except (DatabaseError, GameError) as err:
+        console.print_error(err.message)
+        raise typer.Exit()
+
+    try:
+        report = simulation.simulate(
+            length,
+            strategy,
+            max_attempts=attempts,
+            workers=workers,
+            chunk_size=chunk_size,
+            seed=seed,
+            limit=limit,
+            progress=console.print_progress,
+        )
+    except (DatabaseError, GameError) as err:
+        console.print_error(err.message)
+        raise typer.Exit()
+
+    console.print_simulation(report, attempts)
+
+
+@app.command("search")
+def _search_words(
+    pattern: str,
+    has: str = typer.Option(
+        "", "--has", help="Letters the words must have anywhere; repeat one to need it more times."
+    ),
+    excluded: str = typer.Option("", "--not", help="Letters the words must not have."),
+    limit: int = typer.Option(20, "--limit", "-n", min=1, help="The most words shown."),
+) -> None:
+
+    """
+    Search the dictionary words matching PATTERN, such as c?c?e, with a ? in every unknown position.
+    \f
+
+    Args:
+        pattern: The search pattern, which also gives the word length.
+        has: The letters the words must have.
+        excluded: The letters the words must not have.
+        limit: The most words shown, the most frequent first.
+
+    Raises:
+        Exit: if an error occurred while executing the command.
+    """
+
+    from palabros import search
+
+    try:
+        storage.init(progress=console.print_migration)
+        result = search.search(pattern, has, excluded, limit)
+    except (DatabaseError, GameError) as err:
+        console.print_error(err.message)
+        raise typer.Exit()
+
+    console.print_search(pattern, result.words, result.total)
+
+
+@app.command("serve")
+def _serve(
+    host: str = typer.Option("127.0.0.1", help="The host to listen on."),
+    port: int = typer.Option(8000, help="The port to listen on."),
+    workers: int = typer.Option(4, help="The number of worker threads running business calls."),
+) -> None:
+
+    """
+    Serve the game to many players at once through an HTTP API.
+    \f
+
+    Args:
+        host: The host to listen on.
+        port: The port to listen on.
+        workers: The number of worker threads running business calls.
+    """
+
+    from palabros import server
+
+    try:
+        storage.init(progress=console.print_migration)
+    except DatabaseError as err:
+        console.print_error(err.message)
+        raise typer.Exit()
+
+    console.print_message(f"Sirviendo palabros en [bold]http://{host}:{port}[/]")
+    server.serve(host, port, workers)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,406 @@
+import threading
+from bisect import bisect_left, bisect_right
+from contextlib import contextmanager
+from dataclasses import replace
+from itertools import islice
+from typing import (
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from palabros import __version__, stats
+from palabros.database import read_words
+from palabros.dictionary import normalize_words
+from palabros.errors import DatabaseError
+from palabros.schemas import MAX_ATTEMPTS, Attempt, Game, Stats
+from palabros.storage import Storage
+
+
+class _Word(NamedTuple):
+
+    """
+    A dictionary word, along with its frequency and its difficulty, if it was rated.
+    """
+
+    frequency: float
+    difficulty: Optional[int] = None
+
+
+class _LengthIndex(NamedTuple):
+
+    """
+    The words of a given length, sorted the way seed candidates are read.
+    """
+
+    # The most frequent first
+    by_frequency: List[str]
+    # The rated words only, the easiest and then the most frequent first, along with their difficulties
+    by_difficulty: List[str]
+    difficulties: List[int]
+
+
+class MemoryStorage(Storage):
+
+    """
+    A storage living in memory only, for tests, simulations and ephemeral servers.
+
+    Every table is a dictionary keyed by its lookups, and the words of every length are sorted into arrays the first
+    time seed candidates are read, so difficulty bands are found by bisection. Everything is lost once the process
+    exits or the storage is closed.
+    """
+
+    def __init__(self) -> None:
+
+        """
+        Class constructor.
+        """
+
+        # Reentrant, so operations can be grouped within a transaction
+        self._lock = threading.RLock()
+        # Never reset, so the dictionaries loaded before the storage is closed are never taken as current
+        self._words_revision = 0
+        self._clear()
+
+    def _clear(self) -> None:
+
+        """
+        Drop every table.
+        """
+
+        self._versions: Set[str] = set()
+        self._words: Dict[str, _Word] = {}
+        self._words_revision += 1
+        self._indexes: Dict[int, _LengthIndex] = {}
+        self._games: List[Game] = []
+        self._game_ids: Dict[Tuple[str, str, int], int] = {}
+        self._words_by_date: Dict[Tuple[str, int], str] = {}
+        self._played: Set[str] = set()
+        self._last_attempt_id = 0
+        self._stats: Dict[str, Stats] = {}
+
+    def init(self, progress: Optional[Callable[[int, int], None]] = None) -> None:
+
+        """
+        Load the bundled dictionary the first time, and record the current version. See `Storage.init`.
+
+        There's nothing to migrate, so the progress callback is never called.
+        """
+
+        from palabros.migrations import MIGRATIONS
+
+        with self._lock:
+            if __version__ in self._versions:
+                return
+            self.add_words(normalize_words(read_words()))
+            self._versions.update(migration.version for migration in MIGRATIONS)
+            self._versions.add(__version__)
+
+    def close(self) -> None:
+
+        """
+        Drop everything stored.
+        """
+
+        with self._lock:
+            self._clear()
+
+    @contextmanager
+    def transaction(self) -> Generator[None, None, None]:
+
+        """
+        Hold the storage lock while the block runs. See `Storage.transaction`.
+
+        Every write is applied as soon as it runs, so the block is isolated from other writers but an error raised
+        within it doesn't undo the writes already applied.
+        """
+
+        with self._lock:
+            yield
+
+    def get_versions(self) -> Set[str]:
+
+        """
+        Get the versions recorded by `init`. See `Storage.get_versions`.
+        """
+
+        with self._lock:
+            return set(self._versions)
+
+    def _get_index(self, length: int) -> _LengthIndex:
+
+        """
+        Get the sorted words of the given length, sorting them the first time after any change.
+
+        Args:
+            length: The word length.
+
+        Returns:
+            An instance of `_LengthIndex`.
+        """
+
+        index = self._indexes.get(length)
+
+        if index is None:
+            words = sorted(
+                (word for word in self._words if len(word) == length),
+                key=lambda word: (-self._words[word].frequency, word),
+            )
+            rated = sorted(
+                (word for word in words if self._words[word].difficulty is not None),
+                key=lambda word: (self._words[word].difficulty, -self._words[word].frequency, word),
+            )
+            index = self._indexes[length] = _LengthIndex(
+                by_frequency=words,
+                by_difficulty=rated,
+                difficulties=[self._words[word].difficulty or 0 for word in rated],
+            )
+
+        return index
+
+    def get_words(self, length: Optional[int] = None) -> List[Tuple[str, float]]:
+
+        """
+        Get the dictionary words, from the sorted index of their length when it's given. See `Storage.get_words`.
+        """
+
+        with self._lock:
+            if length is None:
+                words = sorted(self._words, key=lambda word: (-self._words[word].frequency, word))
+            else:
+                words = self._get_index(length).by_frequency
+            return [(word, self._words[word].frequency) for word in words]
+
+    def get_words_revision(self) -> int:
+
+        """
+        Get the dictionary revision, bumped by every chunk of words added. See `Storage.get_words_revision`.
+        """
+
+        with self._lock:
+            return self._words_revision
+
+    def get_word_lengths(self) -> List[int]:
+
+        """
+        Get the lengths of the dictionary words. See `Storage.get_word_lengths`.
+        """
+
+        with self._lock:
+            return sorted({len(word) for word in self._words})
+
+    def add_words(
+        self,
+        words: Iterable[Tuple[str, float]],
+        chunk_size: int = 1000,
+        progress: Optional[Callable[[int], None]] = None,
+    ) -> int:
+
+        """
+        Upsert the given words, keeping the difficulty of the existing ones. See `Storage.add_words`.
+        """
+
+        total = 0
+        iterator = iter(words)
+
+        while True:
+            chunk = list(islice(iterator, chunk_size))
+            if not chunk:
+                break
+            with self._lock:
+                for word, frequency in chunk:
+                    current = self._words.get(word)
+                    self._words[word] = _Word(frequency, current.difficulty if current is not None else None)
+                self._indexes.clear()
+                self._words_revision += 1
+            total += len(chunk)
+            if progress is not None:
+                progress(total)
+
+        return total
+
+    def set_difficulties(self, difficulties: Iterable[Tuple[str, int]]) -> None:
+
+        """
+        Rate the difficulty of the given words, skipping the unknown ones. See `Storage.set_difficulties`.
+        """
+
+        with self._lock:
+            for word, value in difficulties:
+                current = self._words.get(word)
+                if current is not None:
+                    self._words[word] = current._replace(difficulty=value)
+            self._indexes.clear()
+
+    def get_seed_candidates(
+        self,
+        length: int,
+        limit: int,
+        difficulty: Optional[Tuple[int, int]] = None,
+    ) -> List[str]:
+
+        """
+        Get the words not played yet, walking the sorted index of their length from the first word of the difficulty
+        band, if any. See `Storage.get_seed_candidates`.
+        """
+
+        with self._lock:
+            index = self._get_index(length)
+
+            if difficulty is None:
+                words: Iterable[str] = index.by_frequency
+            else:
+                start = bisect_left(index.difficulties, difficulty[0])
+                end = bisect_right(index.difficulties, difficulty[1])
+                words = islice(index.by_difficulty, start, end)
+
+            return list(islice((word for word in words if word not in self._played), limit))
+
+    def get_word_by_date(self, date: str, length: int) -> Optional[str]:
+
+        """
+        Get the word of the games of a date. See `Storage.get_word_by_date`.
+        """
+
+        with self._lock:
+            return self._words_by_date.get((date, length))
+
+    def get_game(self, player_id: str, date: str, length: int) -> Optional[Game]:
+
+        """
+        Get a copy of a game, so the caller can change it freely. See `Storage.get_game`.
+        """
+
+        with self._lock:
+            game_id = self._game_ids.get((player_id, date, length))
+            if game_id is None:
+                return None
+            game = self._games[game_id - 1]
+            return replace(game, attempts=list(game.attempts))
+
+    def _add_game(self, game: Game) -> Optional[Game]:
+
+        """
+        Add a game along with its attempts, unless it already exists, giving them new ids.
+
+        Args:
+            game: The game to add, whose ids are ignored.
+
+        Returns:
+            The game added, or None if it already existed.
+        """
+
+        key = (game.player_id, game.date, len(game.word))
+        if key in self._game_ids:
+            return None
+
+        attempts = []
+        for attempt in game.attempts:
+            self._last_attempt_id += 1
+            attempts.append(Attempt(self._last_attempt_id, attempt.word, attempt.match, pattern=attempt.pattern))
+
+        added = replace(game, id=len(self._games) + 1, attempts=attempts)
+        self._games.append(added)
+        self._game_ids[key] = added.id
+        self._words_by_date.setdefault((game.date, len(game.word)), game.word)
+        self._played.add(game.word)
+
+        return replace(added, attempts=list(attempts))
+
+    def create_game(
+        self,
+        player_id: str,
+        date: str,
+        word: str,
+        max_attempts: int = MAX_ATTEMPTS,
+        hard: bool = False,
+    ) -> Game:
+
+        """
+        Create a game unless it already exists, and get a copy of it. See `Storage.create_game`.
+        """
+
+        with self._lock:
+            self._add_game(Game(0, word, date, [], max_attempts, player_id, hard))
+            game = self.get_game(player_id, date, len(word))
+
+        assert game is not None
+        return game
+
+    def add_attempt(self, game: Game, word: str, match: bool, pattern: int, finished: bool) -> int:
+
+        """
+        Add an attempt, recording the game in the statistics of its player if it's finished. See
+        `Storage.add_attempt`.
+        """
+
+        with self._lock:
+            if not 0 < game.id <= len(self._games):
+                raise DatabaseError(f"La partida [bold]{game.id}[/] no existe")
+            self._last_attempt_id += 1
+            self._games[game.id - 1].attempts.append(Attempt(self._last_attempt_id, word, match, pattern=pattern))
+            if finished:
+                stats.apply(
+                    self._stats.setdefault(game.player_id, Stats()),
+                    game.date,
+                    match,
+                    len(game.attempts) + 1,
+                )
+            return self._last_attempt_id
+
+    def get_stats(self, player_id: str) -> Stats:
+
+        """
+        Get a copy of the statistics of a player. See `Storage.get_stats`.
+        """
+
+        with self._lock:
+            current = self._stats.get(player_id, Stats())
+            return replace(current, distribution=dict(current.distribution))
+
+    def get_games(self) -> Iterator[Game]:
+
+        """
+        Get a copy of every game, taken at once so the storage isn't locked while they're read. See
+        `Storage.get_games`.
+        """
+
+        with self._lock:
+            games = [
+                replace(game, attempts=list(game.attempts))
+                for game in sorted(self._games, key=lambda game: (game.player_id, game.date, game.id))
+            ]
+
+        yield from games
+
+    def add_games(self, games: Iterable[Game]) -> List[Game]:
+
+        """
+        Add the games which don't exist yet, along with their attempts. See `Storage.add_games`.
+        """
+
+        with self._lock:
+            return [added for added in map(self._add_game, games) if added is not None]
+
+    def rebuild_stats(self) -> None:
+
+        """
+        Rebuild the statistics of every player, replaying their finished games in date and creation order. See
+        `Storage.rebuild_stats`.
+        """
+
+        players: Dict[str, Stats] = {}
+
+        with self._lock:
+            for game in sorted(self._games, key=lambda game: (game.player_id, game.date, game.id)):
+                won = game.any_match()
+                if won or not game.any_attempt_left():
+                    stats.apply(players.setdefault(game.player_id, Stats()), game.date, won, len(game.attempts))
+            self._stats = players
@@ -0,0 +1,283 @@
+import sqlite3
+from contextlib import contextmanager
+from typing import Callable, Generator, List, NamedTuple, Optional, Set, Tuple, Union
+
+from palabros import __version__, stats
+from palabros.database import db_transaction, get_sidecar_path, read_words
+from palabros.dictionary import normalize_words
+from palabros.queries import Query
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+    import msvcrt
+
+# A step is either a statement or a function running arbitrary work with the migration cursor
+Step = Union[str, Callable[[sqlite3.Cursor], None]]
+
+
+class Migration(NamedTuple):
+
+    """
+    A schema change, keyed on the version introducing it.
+    """
+
+    version: str
+    steps: Tuple[Step, ...]
+
+
+def _load_words(cur: sqlite3.Cursor) -> None:
+
+    """
+    Load the bundled dictionary, normalized, adding the new words and updating the frequency of the existing ones.
+
+    Args:
+        cur: The cursor to use.
+    """
+
+    cur.executemany(Query.UpsertWord, normalize_words(read_words()))
+
+
+def _rebuild_stats(cur: sqlite3.Cursor) -> None:
+
+    """
+    Rebuild the statistics summary tables from the game history.
+
+    Args:
+        cur: The cursor to use.
+    """
+
+    stats.rebuild(cur)
+
+
+# The steps creating an up to date database from scratch, so a new one has nothing to migrate
+_CREATE: Tuple[Step, ...] = (
+    Query.CreateVersionsTable,
+    Query.CreateWordsTable,
+    Query.CreateWordsRevisionTable,
+    Query.CreateGamesTable,
+    Query.CreateAttemptsTable,
+    Query.CreateStatsTable,
+    Query.CreateStatsDistributionTable,
+    Query.CreateGamesPlayerDateLengthIndex,
+    Query.CreateGamesDateWordIndex,
+    Query.CreateGamesWordIndex,
+    Query.CreateAttemptsGameIndex,
+    Query.CreateWordsFrequencyIndex,
+    Query.CreateWordsLengthFrequencyIndex,
+    Query.CreateWordsLengthDifficultyIndex,
+    _load_words,
+)
+
+# The tables as they were created by 0.0.5. Later migrations add columns to them, so they must never follow the
+# current queries, which already have those columns
+_CREATE_WORDS_TABLE_0_0_5 = """
+    CREATE TABLE IF NOT EXISTS words (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        word TEXT NOT NULL UNIQUE,
+        frequency REAL NOT NULL
+    );
+"""
+
+_CREATE_ATTEMPTS_TABLE_0_0_5 = """
+    CREATE TABLE IF NOT EXISTS attempts (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        game_id INTEGER NOT NULL,
+        word TEXT NOT NULL,
+        match INTEGER NOT NULL,
+        FOREIGN KEY (game_id) REFERENCES games (id)
+    );
+"""
+
+# Every schema change, in order. Statements must be safe to run against any earlier schema of the same version, and
+# must create tables as they were at that version, since later migrations change them. Functions run the current
+# queries, so they belong to the latest migration changing a column they rely on
+MIGRATIONS: Tuple[Migration, ...] = (
+    # Databases created before the `versions` table existed, whose outdated dictionary is reloaded by 0.1.2
+    Migration(
+        "0.0.5",
+        (
+            _CREATE_WORDS_TABLE_0_0_5,
+            _CREATE_ATTEMPTS_TABLE_0_0_5,
+        ),
+    ),
+    # Per-player games and statistics, which are derived data and so just rebuilt from the game history by 0.1.2
+    Migration(
+        "0.1.0",
+        (
+            Query.AddGamesPlayerColumn,
+            Query.DropGamesDateIndex,
+            Query.CreateGamesDateWordIndex,
+            Query.CreateGamesWordIndex,
+            Query.CreateAttemptsGameIndex,
+            Query.CreateWordsFrequencyIndex,
+            Query.DropStatsTable,
+            Query.DropStatsDistributionTable,
+            Query.CreateStatsTable,
+            Query.CreateStatsDistributionTable,
+        ),
+    ),
+    # The pattern of every attempt, which is left empty for the former ones
+    Migration(
+        "0.1.1",
+        (Query.AddAttemptsPatternColumn,),
+    ),
+    # Games of any word length and number of attempts, a game per player, date and length
+    Migration(
+        "0.1.2",
+        (
+            Query.AddWordsLengthColumn,
+            Query.UpdateWordsLength,
+            Query.CreateWordsLengthFrequencyIndex,
+            Query.AddGamesLengthColumn,
+            Query.AddGamesMaxAttemptsColumn,
+            Query.UpdateGamesLength,
+            Query.DropGamesPlayerDateIndex,
+            Query.CreateGamesPlayerDateLengthIndex,
+            _load_words,
+            _rebuild_stats,
+        ),
+    ),
+    # The difficulty of every word, which is left empty until the words are rated
+    Migration(
+        "0.1.3",
+        (
+            Query.AddWordsDifficultyColumn,
+            Query.CreateWordsLengthDifficultyIndex,
+        ),
+    ),
+    # Hard mode games, where every guess must reuse the hints revealed so far
+    Migration(
+        "0.1.4",
+        (Query.AddGamesHardColumn,),
+    ),
+    # The revision of the dictionary, bumped whenever words are loaded, so other processes know when to reload it
+    Migration(
+        "0.1.5",
+        (Query.CreateWordsRevisionTable,),
+    ),
+)
+
+
+@contextmanager
+def _file_lock() -> Generator[None, None, None]:
+
+    """
+    Hold an exclusive lock on a file next to the database, so concurrent processes migrate it one at a time.
+
+    The lock is skipped when the database doesn't live in a regular file, since it can't be shared with other
+    processes anyway.
+    """
+
+    path = get_sidecar_path(".lock")
+
+    if path is None:
+        yield
+        return
+
+    with open(path, "a+b") as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        else:  # pragma: no cover
+            while True:
+                try:
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            else:  # pragma: no cover
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def _table_exists(cur: sqlite3.Cursor, table: str) -> bool:
+
+    """
+    Check if the given table exists in the database.
+
+    Args:
+        cur: The cursor to use.
+        table: The table to check.
+
+    Returns:
+        True if the table exists in the database; otherwise False.
+    """
+
+    cur.execute(Query.TableExists, (table,))
+    result = cur.fetchone()
+    return result is not None and bool(result["total"])
+
+
+def get_applied(cur: sqlite3.Cursor) -> Set[str]:
+
+    """
+    Get the versions recorded in the database, which are the ones whose migrations were already applied.
+
+    Args:
+        cur: The cursor to use.
+
+    Returns:
+        The recorded versions.
+    """
+
+    cur.execute(Query.GetVersions)
+    return {row["version"] for row in cur.fetchall()}
+
+
+def _run(cur: sqlite3.Cursor, steps: List[Step], progress: Optional[Callable[[int, int], None]]) -> None:
+
+    """
+    Run the given steps, one after another.
+
+    Args:
+        cur: The cursor to use.
+        steps: The steps to run.
+        progress: An optional callback, called after every step with the number of steps run so far and the total.
+    """
+
+    for i, step in enumerate(steps, start=1):
+        if isinstance(step, str):
+            cur.execute(step)
+        else:
+            step(cur)
+        if progress is not None:
+            progress(i, len(steps))
+
+
+def migrate(progress: Optional[Callable[[int, int], None]] = None) -> List[str]:
+
+    """
+    Bring the database up to date, creating it if it's empty.
+
+    The pending migrations run in a single transaction, along with the record of their versions, so a database is
+    never left half-migrated. Concurrent processes wait for each other on a file lock, and then find nothing left to
+    do.
+
+    Args:
+        progress: An optional callback, called after every step with the number of steps run so far and the total.
+
+    Returns:
+        The versions migrated to, in order.
+    """
+
+    with _file_lock(), db_transaction() as cur:
+        if not _table_exists(cur, "versions") and not _table_exists(cur, "games"):
+            _run(cur, list(_CREATE), progress)
+            cur.executemany(Query.CreateVersion, ((migration.version,) for migration in MIGRATIONS))
+            pending = []
+        else:
+            cur.execute(Query.CreateVersionsTable)
+            applied = get_applied(cur)
+            pending = [migration for migration in MIGRATIONS if migration.version not in applied]
+            _run(cur, [step for migration in pending for step in migration.steps], progress)
+            cur.executemany(Query.CreateVersion, ((migration.version,) for migration in pending))
+
+        cur.execute(Query.CreateVersion, (__version__,))
+
+    return [migration.version for migration in pending]
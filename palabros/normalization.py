@@ -0,0 +1,111 @@
+import re
+import unicodedata
+from typing import Dict, Iterable, List
+
+# The one mark Spanish keeps, since "ñ" is a letter on its own
+_TILDE = "\u0303"
+
+# Words are joined with it to be normalized in batches, so it must be a char no word contains
+_SEPARATOR = "\n"
+
+# Anything which is not a normalized letter, so the word has to go through the full Unicode pipeline
+_UNNORMALIZED = re.compile("[^a-zñ]")
+_UNNORMALIZED_BATCH = re.compile(f"[^a-zñ{_SEPARATOR}]")
+
+
+def _strip_marks(text: str) -> str:
+
+    """
+    Decompose a text, compatibility forms included, and drop every combining mark but the tilde of "ñ".
+
+    Args:
+        text: The text.
+
+    Returns:
+        The text without marks, composed again.
+    """
+
+    chars: List[str] = []
+
+    for char in unicodedata.normalize("NFKD", text):
+        if unicodedata.combining(char) and not (char == _TILDE and chars and chars[-1] in "nN"):
+            continue
+        chars.append(char)
+
+    return unicodedata.normalize("NFC", "".join(chars))
+
+
+def _build_table() -> Dict[int, str]:
+
+    """
+    Build the translation table normalizing every Latin letter, uppercase and accented ones included, at once.
+
+    Returns:
+        The table, mapping every code point to its normalized, lowercase letter.
+    """
+
+    table = {}
+
+    for code in range(ord("A"), 0x250):
+        char = chr(code)
+        normalized = _strip_marks(char).lower()
+        if normalized != char and normalized.isalpha():
+            table[code] = normalized
+
+    return table
+
+
+_TABLE = _build_table()
+
+
+def normalize(word: str) -> str:
+
+    """
+    Normalize a word, as it's played and stored in the dictionary: lowercase and without accents, but keeping "ñ".
+
+    Latin letters are normalized through a precompiled translation table, in a single pass. Only words with other
+    chars, such as decomposed accents or full-width letters, go through the full Unicode decomposition.
+
+    Args:
+        word: The word to normalize.
+
+    Returns:
+        The normalized word.
+    """
+
+    result = word.translate(_TABLE)
+
+    if _UNNORMALIZED.search(result) is None:
+        return result
+
+    return _strip_marks(result).translate(_TABLE)
+
+
+def normalize_batch(words: Iterable[str]) -> List[str]:
+
+    """
+    Normalize many words at once, such as a whole dictionary being imported.
+
+    The words are translated joined in a single string, so the table is applied once for the whole batch, and just the
+    words needing the full Unicode decomposition are normalized one by one.
+
+    Args:
+        words: The words to normalize, which must not contain line breaks.
+
+    Returns:
+        The normalized words, in the same order.
+    """
+
+    batch = list(words)
+    if not batch:
+        return []
+
+    result = _SEPARATOR.join(batch).translate(_TABLE)
+
+    if _UNNORMALIZED_BATCH.search(result) is None:
+        return result.split(_SEPARATOR)
+
+    return [
+        word if _UNNORMALIZED.search(word) is None else _strip_marks(word).translate(_TABLE)
+        for word in result.split(_SEPARATOR)
+    ]
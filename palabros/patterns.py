@@ -0,0 +1,316 @@
+import json
+import mmap
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from palabros.database import get_db_path, get_sidecar_path
+from palabros.dictionary import get_dictionary
+from palabros.scoring import SeedLanes, get_pattern_size
+
+
+class PatternMatrix:
+
+    """
+    The pattern of every (guess, answer) pair of dictionary words with the same length.
+
+    The matrix is stored row by row, a row per guess and a column per answer, every cell being a packed pattern of
+    `size` bytes. It's usually memory-mapped from a file next to the database, so lookups don't copy anything.
+    """
+
+    def __init__(
+        self,
+        version: str,
+        words: Sequence[str],
+        length: int,
+        data: Union[bytes, mmap.mmap],
+        path: Optional[Path] = None,
+    ) -> None:
+
+        """
+        Class constructor.
+
+        Args:
+            version: The version of the dictionary the matrix was built from.
+            words: The words, in the same order as the rows and columns.
+            length: The word length.
+            data: The matrix content.
+            path: The path of the file the content is memory-mapped from, if any.
+        """
+
+        self.version = version
+        self.words = tuple(words)
+        self.length = length
+        self.path = path
+        self.size = get_pattern_size(length)
+        self.index = {word: i for i, word in enumerate(self.words)}
+        self._data = data
+        view = memoryview(data)
+        self._view = view if self.size == 1 else view.cast("H")
+
+    def __reduce__(self) -> Tuple[Callable[..., "PatternMatrix"], Tuple[Any, ...]]:
+
+        """
+        Pickle the matrix, so it can be sent to other processes. A memory-mapped matrix is mapped again from its file
+        on the other side, instead of copying its content.
+
+        Returns:
+            The function rebuilding the matrix, and its arguments.
+        """
+
+        if self.path is not None:
+            return _map, (self.version, self.words, self.length, self.path)
+
+        return PatternMatrix, (self.version, self.words, self.length, bytes(self._data))
+
+    def __len__(self) -> int:
+
+        """
+        Get the number of words in the matrix.
+
+        Returns:
+            The number of words.
+        """
+
+        return len(self.words)
+
+    def get(self, guess: str, answer: str) -> int:
+
+        """
+        Get the pattern of a guess against an answer.
+
+        Args:
+            guess: The guessed word.
+            answer: The answer word.
+
+        Returns:
+            The packed pattern.
+        """
+
+        return self._view[self.index[guess] * len(self.words) + self.index[answer]]
+
+    def row(self, guess: int) -> memoryview:
+
+        """
+        Get the patterns of a guess against every answer, without copying them.
+
+        Args:
+            guess: The position of the guessed word.
+
+        Returns:
+            A view of the packed patterns, in the same order as `words`.
+        """
+
+        n = len(self.words)
+        return self._view[guess * n : (guess + 1) * n]
+
+    def close(self) -> None:
+
+        """
+        Release the matrix content.
+        """
+
+        self._view.release()
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+
+
+_cache: Dict[Tuple[str, int], PatternMatrix] = {}
+_cache_lock = threading.Lock()
+
+
+def _get_paths(length: int) -> Optional[Tuple[Path, Path]]:
+
+    """
+    Get the paths of the files holding a matrix.
+
+    Args:
+        length: The word length.
+
+    Returns:
+        The paths of the header and the content files, or None if the database doesn't live in a regular file.
+    """
+
+    header_path = get_sidecar_path(f".patterns-{length}.json")
+    data_path = get_sidecar_path(f".patterns-{length}.bin")
+
+    if header_path is None or data_path is None:
+        return None
+
+    return header_path, data_path
+
+
+def _build(words: List[str], length: int, previous: Optional[PatternMatrix]) -> bytes:
+
+    """
+    Compute the content of a matrix.
+
+    When a previous matrix is given, its words must be the first ones and their patterns are just copied.
+
+    Args:
+        words: The words, in the order of the rows and columns.
+        length: The word length.
+        previous: An optional outdated matrix.
+
+    Returns:
+        The matrix content.
+    """
+
+    known = len(previous) if previous is not None else 0
+    lanes = SeedLanes(words, length)
+    new_lanes = SeedLanes(words[known:], length)
+    content = bytearray()
+
+    for i, word in enumerate(words):
+        if i < known:
+            content += previous.row(i).cast("B")
+            content += new_lanes.score(word)
+        else:
+            content += lanes.score(word)
+
+    return bytes(content)
+
+
+def _map(version: str, words: Sequence[str], length: int, path: Path) -> PatternMatrix:
+
+    """
+    Memory-map a matrix from its content file.
+
+    Args:
+        version: The version of the dictionary the matrix was built from.
+        words: The words, in the same order as the rows and columns.
+        length: The word length.
+        path: The content file path.
+
+    Returns:
+        An instance of `PatternMatrix`.
+
+    Raises:
+        ValueError: if the file size doesn't match the words.
+    """
+
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size != len(words) ** 2 * get_pattern_size(length) or not words:
+            raise ValueError(f"The pattern matrix {path} doesn't match its words")
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    return PatternMatrix(version, words, length, data, path)
+
+
+def _read(paths: Tuple[Path, Path], length: int) -> Optional[PatternMatrix]:
+
+    """
+    Memory-map a matrix from its files.
+
+    Args:
+        paths: The paths of the header and the content files.
+        length: The word length.
+
+    Returns:
+        An instance of `PatternMatrix`, or None if the files are missing or broken.
+    """
+
+    header_path, data_path = paths
+
+    try:
+        header = json.loads(header_path.read_text())
+        return _map(header["version"], header["words"], length, data_path)
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _write(paths: Tuple[Path, Path], version: str, words: List[str], content: bytes) -> None:
+
+    """
+    Write a matrix to its files.
+
+    Every file is written to a temporary one first, so a matrix being read is never left half-written.
+
+    Args:
+        paths: The paths of the header and the content files.
+        version: The version of the dictionary the matrix was built from.
+        words: The words, in the order of the rows and columns.
+        content: The matrix content.
+    """
+
+    header_path, data_path = paths
+
+    for path, data in ((data_path, content), (header_path, json.dumps({"version": version, "words": words}).encode())):
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+
+
+def _load(length: int, previous: Optional[PatternMatrix]) -> PatternMatrix:
+
+    """
+    Load the matrix from its files, building them if they're missing or outdated.
+
+    Args:
+        length: The word length.
+        previous: The matrix loaded so far, if any.
+
+    Returns:
+        An instance of `PatternMatrix`.
+    """
+
+    dictionary = get_dictionary(length)
+    paths = _get_paths(length)
+
+    if previous is None and paths is not None:
+        previous = _read(paths, length)
+        if previous is not None and previous.version == dictionary.version:
+            return previous
+
+    # Keep the words already in the matrix first, so their patterns can be reused
+    words = list(dictionary.words)
+    if previous is not None and set(previous.words).issubset(words):
+        known = set(previous.words)
+        words = list(previous.words) + [word for word in words if word not in known]
+    else:
+        previous = None
+
+    content = _build(words, length, previous)
+
+    if paths is None:
+        return PatternMatrix(dictionary.version, words, length, content)
+
+    _write(paths, dictionary.version, words, content)
+    return _read(paths, length) or PatternMatrix(dictionary.version, words, length, content)
+
+
+def get_matrix(length: int) -> PatternMatrix:
+
+    """
+    Get the pattern matrix of the dictionary words with the given length.
+
+    The matrix is built once per version of the dictionary partition of that length, and stored next to the database.
+    When the dictionary only gets new words, the patterns of the existing ones are reused. Rebuilding a matrix drops
+    the rankings the solver cached over the former one.
+
+    Args:
+        length: The word length.
+
+    Returns:
+        An instance of `PatternMatrix`.
+    """
+
+    key = (get_db_path(), length)
+    version = get_dictionary(length).version
+    matrix = _cache.get(key)
+
+    if matrix is None or matrix.version != version:
+        with _cache_lock:
+            matrix = _cache.get(key)
+            if matrix is None or matrix.version != version:
+                previous = matrix
+                matrix = _cache[key] = _load(length, matrix)
+                if previous is not None:
+                    # The solver imports this module, so it's imported here instead
+                    from palabros import solver
+
+                    # Rankings cached over the former matrix would keep it alive, and be stale
+                    solver.clear_cache()
+
+    return matrix
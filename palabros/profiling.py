@@ -0,0 +1,401 @@
+import atexit
+import json
+import os
+import sys
+import threading
+import time
+from functools import wraps
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    TextIO,
+    Tuple,
+    TypeVar,
+    cast,
+)
+
+from palabros.queries import Query
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Set it to `table`, or to `json` to get JSON lines, to print a profile of the command when it exits
+ENV_VAR = "PALABROS_PROFILE"
+
+FORMATS = ("table", "json")
+
+
+class Event(NamedTuple):
+
+    """
+    Something measured: a database connection opened, a statement run or its rows fetched, or a function call.
+    """
+
+    kind: str
+    name: str
+    elapsed: float
+    rows: Optional[int] = None
+
+
+Hook = Callable[[Event], None]
+
+# Swapped as a whole on every change, so emitting an event needs no lock
+_hooks: Tuple[Hook, ...] = ()
+_hooks_lock = threading.Lock()
+
+_query_names = {sql: name for name, sql in vars(Query).items() if not name.startswith("_") and isinstance(sql, str)}
+
+
+def is_enabled() -> bool:
+
+    """
+    Check if anything is listening to the instrumentation, which is skipped altogether otherwise.
+
+    Returns:
+        True if there is any hook subscribed; otherwise False.
+    """
+
+    return bool(_hooks)
+
+
+def subscribe(hook: Hook) -> Callable[[], None]:
+
+    """
+    Subscribe a hook to every event measured from now on, which enables the instrumentation.
+
+    Hooks are called from the thread the event happened in, so they must be thread-safe and quick.
+
+    Args:
+        hook: The function called with every event.
+
+    Returns:
+        A function unsubscribing the hook.
+    """
+
+    global _hooks
+
+    with _hooks_lock:
+        _hooks = _hooks + (hook,)
+
+    def unsubscribe() -> None:
+        global _hooks
+        with _hooks_lock:
+            _hooks = tuple(h for h in _hooks if h is not hook)
+
+    return unsubscribe
+
+
+def emit(event: Event) -> None:
+
+    """
+    Send an event to every subscribed hook.
+
+    Args:
+        event: The event.
+    """
+
+    for hook in _hooks:
+        hook(event)
+
+
+def timed(kind: str) -> Callable[[F], F]:
+
+    """
+    Decorate a function to measure every call to it, named after its module and itself.
+
+    While nothing is subscribed, calls go straight to the function after a single check.
+
+    Args:
+        kind: The kind of the events, such as `call` or `render`.
+
+    Returns:
+        The decorator.
+    """
+
+    def decorator(func: F) -> F:
+        name = f"{func.__module__.rpartition('.')[2]}.{func.__name__}"
+
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not _hooks:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                emit(Event(kind, name, time.perf_counter() - start))
+
+        return cast(F, wrapper)
+
+    return decorator
+
+
+def get_query_name(sql: str) -> str:
+
+    """
+    Get the name a statement has in the `Query` catalog.
+
+    Args:
+        sql: The statement.
+
+    Returns:
+        The name of the statement, or `sql` if it's not in the catalog.
+    """
+
+    return _query_names.get(sql, "sql")
+
+
+class ProfiledCursor:
+
+    """
+    A cursor proxy, measuring every statement run through it and counting the rows it fetches.
+    """
+
+    __slots__ = ("_cur", "_name")
+
+    def __init__(self, cur: Any) -> None:
+
+        """
+        Class constructor.
+
+        Args:
+            cur: The `sqlite3.Cursor` to measure.
+        """
+
+        self._cur = cur
+        self._name = "sql"
+
+    def __getattr__(self, name: str) -> Any:
+
+        """
+        Get any other cursor attribute, such as `lastrowid` or `rowcount`, from the actual cursor.
+
+        Args:
+            name: The attribute name.
+
+        Returns:
+            The attribute value.
+        """
+
+        return getattr(self._cur, name)
+
+    def _run(self, method: Callable[..., Any], sql: str, parameters: Any) -> "ProfiledCursor":
+
+        """
+        Run a statement, measuring it.
+
+        Args:
+            method: The cursor method running the statement.
+            sql: The statement.
+            parameters: The statement parameters.
+
+        Returns:
+            The cursor itself, as `sqlite3.Cursor` does.
+        """
+
+        self._name = get_query_name(sql)
+        start = time.perf_counter()
+        method(sql, parameters)
+        elapsed = time.perf_counter() - start
+        rows = self._cur.rowcount
+        emit(Event("query", self._name, elapsed, rows if rows >= 0 else None))
+        return self
+
+    def execute(self, sql: str, parameters: Any = ()) -> "ProfiledCursor":
+
+        """
+        Run a statement.
+
+        Args:
+            sql: The statement.
+            parameters: The statement parameters.
+
+        Returns:
+            The cursor itself.
+        """
+
+        return self._run(self._cur.execute, sql, parameters)
+
+    def executemany(self, sql: str, parameters: Any) -> "ProfiledCursor":
+
+        """
+        Run a statement once per set of parameters.
+
+        Args:
+            sql: The statement.
+            parameters: Every set of statement parameters.
+
+        Returns:
+            The cursor itself.
+        """
+
+        return self._run(self._cur.executemany, sql, parameters)
+
+    def fetchone(self) -> Any:
+
+        """
+        Fetch the next row of the last statement.
+
+        Returns:
+            The row, or None if there are no rows left.
+        """
+
+        start = time.perf_counter()
+        row = self._cur.fetchone()
+        emit(Event("fetch", self._name, time.perf_counter() - start, int(row is not None)))
+        return row
+
+    def fetchall(self) -> List[Any]:
+
+        """
+        Fetch every row left of the last statement.
+
+        Returns:
+            The rows.
+        """
+
+        start = time.perf_counter()
+        rows = self._cur.fetchall()
+        emit(Event("fetch", self._name, time.perf_counter() - start, len(rows)))
+        return rows
+
+    def __iter__(self) -> Iterator[Any]:
+
+        """
+        Iterate over the rows left of the last statement, counting them once the iteration is over.
+
+        Yields:
+            Every row.
+        """
+
+        name = self._name
+        rows = 0
+        try:
+            for row in self._cur:
+                rows += 1
+                yield row
+        finally:
+            emit(Event("fetch", name, 0.0, rows))
+
+
+class Summary:
+
+    """
+    A hook adding up the events by kind and name.
+    """
+
+    def __init__(self) -> None:
+
+        """
+        Class constructor.
+        """
+
+        self._lock = threading.Lock()
+        self._totals: Dict[Tuple[str, str], List[float]] = {}
+
+    def __call__(self, event: Event) -> None:
+
+        """
+        Add up an event.
+
+        Args:
+            event: The event.
+        """
+
+        with self._lock:
+            totals = self._totals.setdefault((event.kind, event.name), [0, 0.0, 0])
+            totals[0] += 1
+            totals[1] += event.elapsed
+            totals[2] += event.rows or 0
+
+    def get_entries(self) -> List[Dict[str, Any]]:
+
+        """
+        Get the totals of every kind and name, the most time consuming first.
+
+        Returns:
+            A JSON-serializable dictionary per kind and name.
+        """
+
+        with self._lock:
+            totals = sorted(self._totals.items(), key=lambda item: item[1][1], reverse=True)
+
+        return [
+            {
+                "kind": kind,
+                "name": name,
+                "calls": int(calls),
+                "total_ms": round(elapsed * 1000, 3),
+                "mean_ms": round(elapsed * 1000 / calls, 3),
+                "rows": int(rows),
+            }
+            for (kind, name), (calls, elapsed, rows) in totals
+        ]
+
+    def write(self, f: TextIO, fmt: str = "table") -> None:
+
+        """
+        Write the totals.
+
+        Args:
+            f: The file to write to.
+            fmt: Either `table`, for a plain text table, or `json`, for a JSON object per line.
+        """
+
+        entries = self.get_entries()
+
+        if fmt == "json":
+            for entry in entries:
+                f.write(json.dumps(entry) + "\n")
+            return
+
+        f.write(f"\n{'kind':<8}{'name':<40}{'calls':>8}{'total (ms)':>12}{'mean (ms)':>12}{'rows':>8}\n")
+        for entry in entries:
+            f.write(
+                f"{entry['kind']:<8}{entry['name']:<40}{entry['calls']:>8}"
+                f"{entry['total_ms']:>12.3f}{entry['mean_ms']:>12.3f}{entry['rows']:>8}\n"
+            )
+        f.write("\n")
+
+
+_summary: Optional[Summary] = None
+_format = "table"
+
+
+def enable(fmt: str = "table") -> None:
+
+    """
+    Profile the current process, writing the summary to the standard error when it exits.
+
+    Args:
+        fmt: Either `table` or `json`.
+    """
+
+    global _summary, _format
+
+    _format = fmt if fmt in FORMATS else "table"
+
+    if _summary is None:
+        _summary = Summary()
+        subscribe(_summary)
+
+
+def _report() -> None:
+
+    """
+    Write the summary of the process, if it's being profiled.
+    """
+
+    if _summary is not None:
+        _summary.write(sys.stderr, _format)
+
+
+# Registered before any other exit hook, so it runs after them and the work they do is measured too
+atexit.register(_report)
+
+if os.getenv(ENV_VAR):
+    enable(os.environ[ENV_VAR])
@@ -4,70 +4,176 @@ class Query:
     This is just a query catalog.
     """
 
-    WordExists = """
+    GetWords = """
         SELECT
-            COUNT(*) AS total
+            w.word,
+            w.frequency
+        FROM
+            words AS w
+        ORDER BY
+            w.frequency DESC,
+            w.word;
+    """
+
+    GetWordsByLength = """
+        SELECT
+            w.word,
+            w.frequency
         FROM
             words AS w
         WHERE
-            w.word = ?;
+            w.length = ?
+        ORDER BY
+            w.frequency DESC,
+            w.word;
     """
 
-    GetRandomWord = """
+    GetSeedCandidates = """
         SELECT
             w.word
-        FROM (
-            SELECT
-                w.word
-            FROM
-                words AS w
-                LEFT OUTER JOIN
-                    games AS g ON w.word = g.word
-            WHERE
-                g.id IS NULL
-            ORDER BY
-                w.frequency DESC
-            LIMIT
-                50
-        ) as w
+        FROM
+            words AS w
+        WHERE
+            w.length = ?
+        AND
+            NOT EXISTS (
+                SELECT
+                    1
+                FROM
+                    games AS g
+                WHERE
+                    g.word = w.word
+            )
         ORDER BY
-            RANDOM()
+            w.frequency DESC
         LIMIT
-            1;
+            ?;
     """
 
-    GetGameByDate = """
+    GetSeedCandidatesByDifficulty = """
         SELECT
-            g.id,
-            g.word,
-            g.date
+            w.word
+        FROM
+            words AS w
+        WHERE
+            w.length = ?
+        AND
+            w.difficulty BETWEEN ? AND ?
+        AND
+            NOT EXISTS (
+                SELECT
+                    1
+                FROM
+                    games AS g
+                WHERE
+                    g.word = w.word
+            )
+        ORDER BY
+            w.difficulty,
+            w.frequency DESC
+        LIMIT
+            ?;
+    """
+
+    GetWordLengths = """
+        SELECT DISTINCT
+            w.length
+        FROM
+            words AS w
+        ORDER BY
+            w.length;
+    """
+
+    GetWordsRevision = """
+        SELECT
+            r.revision
+        FROM
+            words_revision AS r
+        WHERE
+            r.id = 1;
+    """
+
+    BumpWordsRevision = """
+        INSERT INTO
+            words_revision (
+                id,
+                revision
+            )
+        VALUES (
+            1,
+            1
+        )
+        ON CONFLICT (id) DO UPDATE SET
+            revision = revision + 1;
+    """
+
+    UpdateWordDifficulty = """
+        UPDATE
+            words
+        SET
+            difficulty = ?
+        WHERE
+            word = ?;
+    """
+
+    GetWordByDate = """
+        SELECT
+            g.word
         FROM
             games AS g
         WHERE
-            g.date = ?;
+            g.date = ?
+        AND
+            g.length = ?
+        LIMIT
+            1;
     """
 
-    CreateGame = """
+    CreateGameIfNotExists = """
         INSERT INTO
             games (
+                player_id,
                 word,
-                date
+                date,
+                length,
+                max_attempts,
+                hard
             )
         VALUES (
+            ?,
+            ?,
+            ?,
+            LENGTH(?2),
             ?,
             ?
-        );
+        )
+        ON CONFLICT (player_id, date, length) DO NOTHING;
     """
 
-    GetAttemptsByGame = """
+    GetGameWithAttemptsByDate = """
         SELECT
-            a.id,
-            a.word,
-            a.match
+            g.id,
+            g.word,
+            g.date,
+            g.player_id,
+            g.max_attempts,
+            g.hard,
+            a.id AS attempt_id,
+            a.word AS attempt_word,
+            a.match AS attempt_match,
+            a.pattern AS attempt_pattern
         FROM
-            attempts AS a
+            games AS g
+            LEFT OUTER JOIN
+                attempts AS a ON a.game_id = g.id
         WHERE
-            a.game_id = ?;
+            g.player_id = ?
+        AND
+            g.date = ?
+        AND
+            g.length = ?
+        ORDER BY
+            a.id;
     """
 
     CreateAttempt = """
@@ -75,15 +181,171 @@ class Query:
             attempts (
                 game_id,
                 word,
-                match
+                match,
+                pattern
+            )
+        VALUES (
+            ?,
+            ?,
+            ?,
+            ?
+        );
+    """
+
+    BeginImmediate = """
+        BEGIN IMMEDIATE;
+    """
+
+    Commit = """
+        COMMIT;
+    """
+
+    Rollback = """
+        ROLLBACK;
+    """
+
+    Savepoint = """
+        SAVEPOINT attempt;
+    """
+
+    ReleaseSavepoint = """
+        RELEASE SAVEPOINT attempt;
+    """
+
+    RollbackToSavepoint = """
+        ROLLBACK TO SAVEPOINT attempt;
+    """
+
+    GetStats = """
+        SELECT
+            s.played,
+            s.won,
+            s.current_streak,
+            s.max_streak,
+            s.last_won_date
+        FROM
+            stats AS s
+        WHERE
+            s.player_id = ?;
+    """
+
+    GetStatsDistribution = """
+        SELECT
+            d.attempts,
+            d.total
+        FROM
+            stats_distribution AS d
+        WHERE
+            d.player_id = ?;
+    """
+
+    SaveStats = """
+        INSERT OR REPLACE INTO
+            stats (
+                player_id,
+                played,
+                won,
+                current_streak,
+                max_streak,
+                last_won_date
             )
         VALUES (
+            ?,
+            ?,
+            ?,
             ?,
             ?,
             ?
         );
     """
 
+    IncrementStatsDistribution = """
+        INSERT INTO
+            stats_distribution (
+                player_id,
+                attempts,
+                total
+            )
+        VALUES (
+            ?,
+            ?,
+            1
+        )
+        ON CONFLICT (player_id, attempts) DO UPDATE SET
+            total = total + 1;
+    """
+
+    SaveStatsDistribution = """
+        INSERT OR REPLACE INTO
+            stats_distribution (
+                player_id,
+                attempts,
+                total
+            )
+        VALUES (
+            ?,
+            ?,
+            ?
+        );
+    """
+
+    ClearStats = """
+        DELETE FROM stats;
+    """
+
+    ClearStatsDistribution = """
+        DELETE FROM stats_distribution;
+    """
+
+    GetGamesSummary = """
+        SELECT
+            g.player_id,
+            g.date,
+            g.max_attempts,
+            COUNT(a.id) AS attempts,
+            COALESCE(MAX(a.match), 0) AS won
+        FROM
+            games AS g
+            LEFT OUTER JOIN
+                attempts AS a ON a.game_id = g.id
+        GROUP BY
+            g.id
+        ORDER BY
+            g.player_id,
+            g.date,
+            g.id;
+    """
+
+    GetGamesWithAttempts = """
+        SELECT
+            g.id,
+            g.word,
+            g.date,
+            g.player_id,
+            g.max_attempts,
+            g.hard,
+            a.id AS attempt_id,
+            a.word AS attempt_word,
+            a.match AS attempt_match,
+            a.pattern AS attempt_pattern
+        FROM
+            games AS g
+            LEFT OUTER JOIN
+                attempts AS a ON a.game_id = g.id
+        ORDER BY
+            g.player_id,
+            g.date,
+            g.id,
+            a.id;
+    """
+
+    GetVersions = """
+        SELECT
+            v.version
+        FROM
+            versions AS v;
+    """
+
     TableExists = """
         SELECT
             COUNT(*) AS total
@@ -105,7 +367,16 @@ class Query:
         CREATE TABLE IF NOT EXISTS words (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             word TEXT NOT NULL UNIQUE,
-            frequency REAL NOT NULL
+            frequency REAL NOT NULL,
+            length INTEGER NOT NULL DEFAULT 0,
+            difficulty INTEGER
+        );
+    """
+
+    CreateWordsRevisionTable = """
+        CREATE TABLE IF NOT EXISTS words_revision (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            revision INTEGER NOT NULL
         );
     """
 
@@ -114,6 +385,10 @@ class Query:
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             word TEXT NOT NULL,
             date TEXT NOT NULL,
+            player_id TEXT NOT NULL DEFAULT '',
+            length INTEGER NOT NULL DEFAULT 0,
+            max_attempts INTEGER NOT NULL DEFAULT 6,
+            hard INTEGER NOT NULL DEFAULT 0,
             FOREIGN KEY (word) REFERENCES words (word)
         );
     """
@@ -124,20 +399,129 @@ class Query:
             game_id INTEGER NOT NULL,
             word TEXT NOT NULL,
             match INTEGER NOT NULL,
+            pattern INTEGER,
             FOREIGN KEY (game_id) REFERENCES games (id)
         );
     """
 
-    CreateGamesDateIndex = """
-        CREATE UNIQUE INDEX IF NOT EXISTS idx_games_date ON games (date);
+    CreateStatsTable = """
+        CREATE TABLE IF NOT EXISTS stats (
+            player_id TEXT PRIMARY KEY,
+            played INTEGER NOT NULL,
+            won INTEGER NOT NULL,
+            current_streak INTEGER NOT NULL,
+            max_streak INTEGER NOT NULL,
+            last_won_date TEXT
+        );
     """
 
-    PopulateWordsTable = """
-        INSERT OR IGNORE INTO words (word, frequency) VALUES {};
+    CreateStatsDistributionTable = """
+        CREATE TABLE IF NOT EXISTS stats_distribution (
+            player_id TEXT NOT NULL,
+            attempts INTEGER NOT NULL,
+            total INTEGER NOT NULL,
+            PRIMARY KEY (player_id, attempts)
+        );
     """
 
-    CreateVersion = """
+    CreateGamesPlayerDateLengthIndex = """
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_games_player_id_date_length ON games (player_id, date, length);
+    """
+
+    CreateGamesDateWordIndex = """
+        CREATE INDEX IF NOT EXISTS idx_games_date_word ON games (date, word);
+    """
+
+    CreateGamesWordIndex = """
+        CREATE INDEX IF NOT EXISTS idx_games_word ON games (word);
+    """
+
+    CreateAttemptsGameIndex = """
+        CREATE INDEX IF NOT EXISTS idx_attempts_game_id ON attempts (game_id);
+    """
+
+    CreateWordsFrequencyIndex = """
+        CREATE INDEX IF NOT EXISTS idx_words_frequency ON words (frequency DESC);
+    """
+
+    CreateWordsLengthFrequencyIndex = """
+        CREATE INDEX IF NOT EXISTS idx_words_length_frequency ON words (length, frequency DESC);
+    """
+
+    CreateWordsLengthDifficultyIndex = """
+        CREATE INDEX IF NOT EXISTS idx_words_length_difficulty ON words (length, difficulty, frequency DESC);
+    """
+
+    UpsertWord = """
         INSERT INTO
+            words (
+                word,
+                frequency,
+                length
+            )
+        VALUES (
+            ?,
+            ?,
+            LENGTH(?1)
+        )
+        ON CONFLICT (word) DO UPDATE SET
+            frequency = excluded.frequency;
+    """
+
+    AddGamesPlayerColumn = """
+        ALTER TABLE games ADD COLUMN player_id TEXT NOT NULL DEFAULT '';
+    """
+
+    AddAttemptsPatternColumn = """
+        ALTER TABLE attempts ADD COLUMN pattern INTEGER;
+    """
+
+    AddWordsLengthColumn = """
+        ALTER TABLE words ADD COLUMN length INTEGER NOT NULL DEFAULT 0;
+    """
+
+    AddWordsDifficultyColumn = """
+        ALTER TABLE words ADD COLUMN difficulty INTEGER;
+    """
+
+    AddGamesLengthColumn = """
+        ALTER TABLE games ADD COLUMN length INTEGER NOT NULL DEFAULT 0;
+    """
+
+    AddGamesMaxAttemptsColumn = """
+        ALTER TABLE games ADD COLUMN max_attempts INTEGER NOT NULL DEFAULT 6;
+    """
+
+    AddGamesHardColumn = """
+        ALTER TABLE games ADD COLUMN hard INTEGER NOT NULL DEFAULT 0;
+    """
+
+    UpdateWordsLength = """
+        UPDATE words SET length = LENGTH(word);
+    """
+
+    UpdateGamesLength = """
+        UPDATE games SET length = LENGTH(word);
+    """
+
+    DropGamesDateIndex = """
+        DROP INDEX IF EXISTS idx_games_date;
+    """
+
+    DropGamesPlayerDateIndex = """
+        DROP INDEX IF EXISTS idx_games_player_id_date;
+    """
+
+    DropStatsTable = """
+        DROP TABLE IF EXISTS stats;
+    """
+
+    DropStatsDistributionTable = """
+        DROP TABLE IF EXISTS stats_distribution;
+    """
+
+    CreateVersion = """
+        INSERT OR IGNORE INTO
             versions (
                 version
             )
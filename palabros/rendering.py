@@ -0,0 +1,271 @@
+import io
+import os
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional, Tuple
+
+from palabros import profiling
+from palabros.normalization import normalize
+from palabros.schemas import Game
+from palabros.scoring import ABSENT, MISSPLACED, VALID, decode
+
+# `rich` is imported lazily, just when something is printed, to keep the CLI startup fast
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.padding import Padding
+    from rich.table import Table
+
+# The most boards kept rendered, enough for a results view showing a whole year
+BOARD_CACHE_SIZE = 512
+
+_STYLES = {
+    VALID: "bold black on green",
+    MISSPLACED: "bold black on yellow",
+    ABSENT: "bold white on black",
+}
+
+_ANSI_STYLES = {
+    VALID: "\x1b[1;30;42m",
+    MISSPLACED: "\x1b[1;30;43m",
+    ABSENT: "\x1b[1;37;40m",
+}
+_ANSI_RESET = "\x1b[0m"
+
+_PLAIN_CELLS = {
+    VALID: "[{}]",
+    MISSPLACED: "({})",
+    ABSENT: " {} ",
+}
+_PLAIN_EMPTY_CELL = " · "
+
+# Everything a board looks like: the word length, the word and the pattern of every attempt, and the number of
+# attempts left
+BoardKey = Tuple[int, Tuple[Tuple[str, int], ...], int]
+
+_console: Optional["Console"] = None
+
+
+def get_console() -> "Console":
+
+    """
+    Get the console every output is printed to, creating it the first time.
+
+    Returns:
+        An instance of `rich.console.Console`.
+    """
+
+    global _console
+
+    if _console is None:
+        from rich.console import Console
+
+        _console = Console()
+
+    return _console
+
+
+def get_board_key(game: Game) -> BoardKey:
+
+    """
+    Get the key identifying how the board of a game looks like.
+
+    Args:
+        game: The game.
+
+    Returns:
+        The board key.
+    """
+
+    return (
+        len(game.word),
+        tuple((attempt.word, attempt.pattern) for attempt in game.attempts),
+        game.get_attempts_left(),
+    )
+
+
+def _get_states(word: str, pattern: int) -> Tuple[Tuple[str, int], ...]:
+
+    """
+    Get every char of an attempt, normalized and uppercase, along with its state.
+
+    Args:
+        word: The attempt word.
+        pattern: The packed pattern of the attempt.
+
+    Returns:
+        The (char, state) pairs, in order.
+    """
+
+    word = normalize(word).upper()
+    return tuple(zip(word, decode(pattern, len(word))))
+
+
+@lru_cache(maxsize=None)
+def get_cell(char: str, state: int) -> "Padding":
+
+    """
+    Get the styled cell showing a char of an attempt, which is created once and shared by every board.
+
+    Args:
+        char: The char, uppercase.
+        state: The state of the char.
+
+    Returns:
+        An instance of `rich.padding.Padding`.
+    """
+
+    from rich.padding import Padding
+
+    return Padding(char, 1, style=_STYLES[state])
+
+
+@lru_cache(maxsize=None)
+def get_empty_cell() -> "Padding":
+
+    """
+    Get the cell of an attempt not played yet, which is created once and shared by every board.
+
+    Returns:
+        An instance of `rich.padding.Padding`.
+    """
+
+    from rich.padding import Padding
+
+    return Padding("", 1)
+
+
+def create_table(key: BoardKey) -> "Table":
+
+    """
+    Create a table showing a board.
+
+    Args:
+        key: The board key.
+
+    Returns:
+        An instance of `rich.table.Table`.
+    """
+
+    from rich.table import Table, box
+
+    length, attempts, attempts_left = key
+
+    table = Table(
+        show_header=False,
+        show_footer=False,
+        show_lines=True,
+        box=box.HEAVY,
+    )
+
+    for _ in range(length):
+        table.add_column(width=5, justify="center")
+
+    for word, pattern in attempts:
+        table.add_row(*(get_cell(char, state) for char, state in _get_states(word, pattern)))
+
+    empty_row = [get_empty_cell()] * length
+    for _ in range(attempts_left):
+        table.add_row(*empty_row)
+
+    return table
+
+
+@lru_cache(maxsize=BOARD_CACHE_SIZE)
+@profiling.timed("render")
+def _render(key: BoardKey, width: int, color_system: Optional[str]) -> str:
+
+    """
+    Lay out a board and render it to text, caching the result.
+
+    Args:
+        key: The board key.
+        width: The console width.
+        color_system: The console color system.
+
+    Returns:
+        The rendered board, with the escape codes of the given color system.
+    """
+
+    from rich.console import Console
+
+    capture = Console(file=io.StringIO(), width=width, color_system=color_system, force_terminal=True)
+    capture.print(create_table(key))
+    return capture.file.getvalue()
+
+
+@profiling.timed("render")
+def print_board(game: Game) -> None:
+
+    """
+    Print the board of a game in the console.
+
+    Boards are laid out and rendered just once, and then written as they are for every game which looks the same.
+    Legacy Windows consoles, which are colored through API calls instead of escape codes, always get a fresh layout.
+
+    Args:
+        game: The game.
+    """
+
+    console = get_console()
+    key = get_board_key(game)
+
+    if console.legacy_windows:
+        console.print(create_table(key))
+        return
+
+    console.file.write(_render(key, console.width, console.color_system))
+    console.file.flush()
+
+
+@profiling.timed("render")
+def render_plain(game: Game, ansi: bool = False) -> str:
+
+    """
+    Render the board of a game as text, without `rich` at all.
+
+    Every valid char is shown in brackets and every missplaced one in parentheses, unless ANSI colors are used.
+
+    Args:
+        game: The game.
+        ansi: Whether to color the chars with ANSI escape codes.
+
+    Returns:
+        The board, a line per attempt.
+    """
+
+    length, attempts, attempts_left = get_board_key(game)
+    lines = []
+
+    for word, pattern in attempts:
+        if ansi:
+            cells = (f"{_ANSI_STYLES[state]} {char} {_ANSI_RESET}" for char, state in _get_states(word, pattern))
+        else:
+            cells = (_PLAIN_CELLS[state].format(char) for char, state in _get_states(word, pattern))
+        lines.append(" ".join(cells))
+
+    lines.extend([" ".join([_PLAIN_EMPTY_CELL] * length)] * attempts_left)
+    return "\n".join(lines)
+
+
+def is_interactive() -> bool:
+
+    """
+    Check if the output goes to a terminal, so it's worth laying it out with `rich`.
+
+    Returns:
+        True if the output is interactive; otherwise False.
+    """
+
+    return get_console().is_terminal
+
+
+def use_ansi() -> bool:
+
+    """
+    Check if non-interactive output should be colored anyway, as asked for with the `FORCE_COLOR` environment
+    variable, unless `NO_COLOR` is set.
+
+    Returns:
+        True if ANSI colors should be used; otherwise False.
+    """
+
+    return bool(os.getenv("FORCE_COLOR")) and not os.getenv("NO_COLOR")
@@ -1,7 +1,45 @@
-from dataclasses import dataclass, field
-from typing import List
+from dataclasses import dataclass, field, fields
+from typing import Dict, Iterable, List, Optional, Type, TypeVar
 
+from palabros.normalization import normalize
+from palabros.scoring import ABSENT, MISSPLACED, VALID, decode, encode
 
+T = TypeVar("T")
+
+MAX_ATTEMPTS = 6
+
+# The player of the command line game, which is also the owner of the games created before players existed
+DEFAULT_PLAYER = ""
+
+
+def _slots(cls: Type[T]) -> Type[T]:
+
+    """
+    Rebuild a dataclass with `__slots__`, so its instances have no `__dict__`.
+
+    Python 3.10 can do it with `dataclass(slots=True)`, but older versions have to rebuild the class by hand, since the
+    field defaults are class attributes clashing with the slots.
+
+    Args:
+        cls: The dataclass.
+
+    Returns:
+        The slotted dataclass.
+    """
+
+    namespace = dict(cls.__dict__)
+    names = tuple(f.name for f in fields(cls))
+
+    for name in names + ("__dict__", "__weakref__"):
+        namespace.pop(name, None)
+
+    namespace["__slots__"] = names
+    slotted = type(cls)(cls.__name__, cls.__bases__, namespace)
+    slotted.__qualname__ = cls.__qualname__
+    return slotted
+
+
+@_slots
 @dataclass
 class CharInspection:
 
@@ -15,19 +53,75 @@ class CharInspection:
     missplaced: bool = False
 
 
-@dataclass
+@_slots
+@dataclass(init=False)
 class Attempt:
 
     """
     Schema representing a database `Attempt` record.
+
+    The inspection of the attempt is kept packed as a base-3 pattern, a digit per char, and only decoded into
+    `CharInspection` instances when they're asked for. It can still be given as `chars` when the attempt is built, and
+    then it's packed right away. Both `pattern` and `chars` are keyword-only, so callers still passing `chars` as the
+    fourth positional argument fail loudly.
     """
 
     id: int
     word: str
     match: bool
-    chars: List[CharInspection] = field(default_factory=list)
+    pattern: int = 0
+
+    def __init__(
+        self,
+        id: int,
+        word: str,
+        match: bool,
+        *,
+        pattern: int = 0,
+        chars: Optional[Iterable[CharInspection]] = None,
+    ) -> None:
+
+        """
+        Class constructor.
+
+        Args:
+            id: The attempt id.
+            word: The word given by the player.
+            match: Whether the word is the seed word.
+            pattern: The packed pattern of the attempt.
+            chars: The inspection of every char, which is packed and replaces the pattern when given.
+        """
+
+        if chars is not None:
+            pattern = encode(
+                VALID if char.valid else MISSPLACED if char.missplaced else ABSENT
+                for char in sorted(chars, key=lambda char: char.position)
+            )
+
+        self.id = id
+        self.word = word
+        self.match = match
+        self.pattern = pattern
+
+    @property
+    def chars(self) -> List[CharInspection]:
+
+        """
+        Get the inspection of every char of the attempt.
+
+        Returns:
+            A list of `CharInspection` instances.
+        """
+
+        word = normalize(self.word).upper()
+
+        return [
+            CharInspection(char=char, position=i, valid=state == VALID, missplaced=state == MISSPLACED)
+            for i, (char, state) in enumerate(zip(word, decode(self.pattern, len(word))))
+        ]
 
 
+@_slots
 @dataclass
 class Game:
 
@@ -39,7 +133,9 @@ class Game:
     word: str
     date: str
     attempts: List[Attempt] = field(default_factory=list)
-    max_attempts: int = 6
+    max_attempts: int = MAX_ATTEMPTS
+    player_id: str = DEFAULT_PLAYER
+    hard: bool = False
 
     def any_match(self) -> bool:
 
@@ -50,7 +146,7 @@ class Game:
             True if a match is found; otherwise False.
         """
 
-        return any([attempt.match for attempt in self.attempts])
+        return any(attempt.match for attempt in self.attempts)
 
     def any_attempt_left(self) -> bool:
 
@@ -73,3 +169,44 @@ class Game:
         """
 
         return self.max_attempts - len(self.attempts)
+
+
+@_slots
+@dataclass
+class Stats:
+
+    """
+    Schema representing the lifetime statistics of the player.
+    """
+
+    played: int = 0
+    won: int = 0
+    current_streak: int = 0
+    max_streak: int = 0
+    last_won_date: Optional[str] = None
+    distribution: Dict[int, int] = field(default_factory=dict)
+
+    def get_win_rate(self) -> float:
+
+        """
+        Get the ratio of games won.
+
+        Returns:
+            The ratio of games won, between 0 and 1.
+        """
+
+        return self.won / self.played if self.played else 0.0
+
+
+@_slots
+@dataclass
+class Suggestion:
+
+    """
+    Schema representing a suggested guess.
+    """
+
+    word: str
+    entropy: float
+    candidate: bool
+    chance: float = 0.0
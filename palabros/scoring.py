@@ -0,0 +1,300 @@
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+ABSENT = 0
+MISSPLACED = 1
+VALID = 2
+
+# Batches go through seed lanes while they hold at most this many (seed, word) combinations per pair, beyond which
+# scoring the pairs one at a time is faster
+_LANES_RATIO = 32
+
+
+def _count_chars(seed: str) -> Dict[str, int]:
+
+    """
+    Count the occurrences of every char in a seed word.
+
+    Args:
+        seed: The seed word.
+
+    Returns:
+        A dictionary mapping every char to its occurrences.
+    """
+
+    counts: Dict[str, int] = {}
+    for char in seed:
+        counts[char] = counts.get(char, 0) + 1
+    return counts
+
+
+def _score(seed: str, word: str, counts: Dict[str, int]) -> int:
+
+    """
+    Score a word against a seed word, whose char occurrences are already counted.
+
+    Args:
+        seed: The seed word.
+        word: The word to score.
+        counts: The occurrences of every char in the seed word. It's not modified.
+
+    Returns:
+        The packed pattern.
+    """
+
+    remaining = counts.copy()
+    pattern = 0
+    weight = 1
+
+    for i, char in enumerate(word):
+        left = remaining.get(char)
+        if left:
+            remaining[char] = left - 1
+            pattern += weight * (VALID if seed[i] == char else MISSPLACED)
+        weight *= 3
+
+    return pattern
+
+
+def score(seed: str, word: str) -> int:
+
+    """
+    Score a word against a seed word.
+
+    Both words must be normalized, have the same length and the same case. Every char of the word, from left to right,
+    is valid if it's in the very same position in the seed word, missplaced if it's in some other position, or absent
+    otherwise. A char only counts while the seed word has occurrences of it left to match, so repeated chars beyond
+    those occurrences are absent.
+
+    Args:
+        seed: The seed word.
+        word: The word to score.
+
+    Returns:
+        The packed pattern: a base-3 integer, where the digit of weight 3^i holds the state of the char in position i.
+    """
+
+    return _score(seed, word, _count_chars(seed))
+
+
+def _score_pairs(seeds: Sequence[str], words: Sequence[str], length: Optional[int]) -> List[int]:
+
+    """
+    Score many words against their seed words, choosing the fastest way for the shape of the batch.
+
+    Args:
+        seeds: The seed words.
+        words: The words to score, matching the seed words by position.
+        length: The length of every word, or None if the words of some pair have different lengths.
+
+    Returns:
+        The packed patterns, in the same order.
+    """
+
+    distinct_seeds = list(dict.fromkeys(seeds))
+    distinct_words = set(words)
+
+    if length is not None and len(distinct_seeds) * len(distinct_words) <= _LANES_RATIO * len(seeds):
+        lanes = SeedLanes(distinct_seeds, length)
+        lane = {seed: j for j, seed in enumerate(distinct_seeds)}
+        rows: Dict[str, Sequence[int]] = {}
+        for word in distinct_words:
+            row = lanes.score(word)
+            rows[word] = (
+                row if lanes.size == 1 else [int.from_bytes(row[k : k + 2], "little") for k in range(0, len(row), 2)]
+            )
+        return [rows[word][lane[seed]] for seed, word in zip(seeds, words)]
+
+    counts = {seed: _count_chars(seed) for seed in distinct_seeds}
+    return [_score(seed, word, counts[seed]) for seed, word in zip(seeds, words)]
+
+
+def score_batch(seeds: Sequence[str], words: Sequence[str]) -> List[int]:
+
+    """
+    Score many words against their seed words at once.
+
+    The pairs are grouped by word length. Groups with few distinct seed words, such as many guesses scored against a
+    handful of answers, go through `SeedLanes`, scoring every distinct word against every distinct seed word at once;
+    groups where most of those combinations would be wasted are scored a pair at a time, counting the char occurrences
+    of every distinct seed word just once.
+
+    Args:
+        seeds: The seed words.
+        words: The words to score, matching the seed words by position.
+
+    Returns:
+        The packed patterns, in the same order.
+
+    Raises:
+        ValueError: if there are not as many seed words as words.
+    """
+
+    if len(seeds) != len(words):
+        raise ValueError("There must be as many seed words as words")
+
+    lengths = set(map(len, set(seeds))) | set(map(len, set(words)))
+    if len(lengths) == 1:
+        return _score_pairs(seeds, words, lengths.pop())
+
+    # The pairs of every word length, and the ones whose words have different lengths under None
+    groups: Dict[Optional[int], List[int]] = {}
+    for i, (seed, word) in enumerate(zip(seeds, words)):
+        groups.setdefault(len(seed) if len(seed) == len(word) else None, []).append(i)
+
+    result = [0] * len(seeds)
+    for length, indexes in groups.items():
+        patterns = _score_pairs([seeds[i] for i in indexes], [words[i] for i in indexes], length)
+        for i, pattern in zip(indexes, patterns):
+            result[i] = pattern
+
+    return result
+
+
+def decode(pattern: int, length: int) -> Tuple[int, ...]:
+
+    """
+    Unpack a pattern into the state of every char.
+
+    Args:
+        pattern: The packed pattern.
+        length: The word length.
+
+    Returns:
+        The state of every char, by position.
+    """
+
+    states = []
+    for _ in range(length):
+        pattern, state = divmod(pattern, 3)
+        states.append(state)
+    return tuple(states)
+
+
+def encode(states: Iterable[int]) -> int:
+
+    """
+    Pack the state of every char into a pattern.
+
+    Args:
+        states: The state of every char, by position.
+
+    Returns:
+        The packed pattern.
+    """
+
+    pattern = 0
+    weight = 1
+    for state in states:
+        pattern += weight * state
+        weight *= 3
+    return pattern
+
+
+def get_match_pattern(length: int) -> int:
+
+    """
+    Get the pattern of a full match, where every char is valid.
+
+    Args:
+        length: The word length.
+
+    Returns:
+        The packed pattern.
+    """
+
+    return 3**length - 1
+
+
+def get_pattern_size(length: int) -> int:
+
+    """
+    Get the number of bytes needed to store any pattern of the given word length.
+
+    Args:
+        length: The word length.
+
+    Returns:
+        The number of bytes.
+    """
+
+    return 1 if 3**length <= 256 else 2
+
+
+class SeedLanes:
+
+    """
+    Precomputed seed words, ready to score a word against all of them at once.
+
+    Every seed word takes a lane in a big integer, wide enough to hold any pattern, and every position or occurrence
+    check becomes a single bitwise or arithmetic operation over the whole integer. A char of the word, preceded by k
+    occurrences of itself, is marked in a seed word only if the seed word has more than k occurrences of it; and a
+    marked char is valid if it's in the very same position of the seed word. That's exactly what `score` does, one char
+    at a time.
+    """
+
+    def __init__(self, seeds: Sequence[str], length: int) -> None:
+
+        """
+        Class constructor.
+
+        Args:
+            seeds: The seed words, all of them with the given length.
+            length: The word length.
+
+        Raises:
+            ValueError: if any seed word has a wrong length.
+        """
+
+        self.size = get_pattern_size(length)
+        self.length = length
+        self.seeds = tuple(seeds)
+
+        # at_least[char][k] has a 1 in the lanes of the seed words with k occurrences of char or more
+        at_least: Dict[str, List[bytearray]] = {}
+        # at[i][char] has a 1 in the lanes of the seed words with char in position i
+        at: List[Dict[str, bytearray]] = [{} for _ in range(length)]
+        empty = bytes(len(self.seeds) * self.size)
+
+        for lane, seed in enumerate(self.seeds):
+            if len(seed) != length:
+                raise ValueError(f"The seed word {seed!r} has not {length} chars")
+            offset = lane * self.size
+            for char, count in _count_chars(seed).items():
+                masks = at_least.setdefault(char, [])
+                while len(masks) < count:
+                    masks.append(bytearray(empty))
+                for k in range(count):
+                    masks[k][offset] = 1
+            for i, char in enumerate(seed):
+                at[i].setdefault(char, bytearray(empty))[offset] = 1
+
+        self._at_least = {char: [int.from_bytes(m, "little") for m in masks] for char, masks in at_least.items()}
+        self._at = [{char: int.from_bytes(m, "little") for char, m in masks.items()} for masks in at]
+
+    def score(self, word: str) -> bytes:
+
+        """
+        Score a word against every seed word.
+
+        Args:
+            word: The word to score, with the same length and case as the seed words.
+
+        Returns:
+            The packed patterns, one per seed word and in the same order, as little-endian unsigned integers of
+            `size` bytes each.
+        """
+
+        total = 0
+        weight = 1
+        seen: Dict[str, int] = {}
+
+        for i, char in enumerate(word):
+            k = seen.get(char, 0)
+            seen[char] = k + 1
+            masks = self._at_least.get(char)
+            if masks is not None and k < len(masks):
+                marked = masks[k]
+                total += weight * (marked + (marked & self._at[i].get(char, 0)))
+            weight *= 3
+
+        return total.to_bytes(len(self.seeds) * self.size, "little")
@@ -0,0 +1,253 @@
+import threading
+from collections import Counter
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from palabros.constraints import ALPHABET
+from palabros.database import get_db_path
+from palabros.dictionary import get_dictionary
+from palabros.errors import GameError
+from palabros.normalization import normalize
+
+# The chars standing for an unknown letter in a search pattern
+WILDCARDS = "?_."
+
+# Every letter is encoded as its position in the alphabet, plus one, and lanes holding a given code are found with
+# a translation table, as the solver does with patterns
+_CODES = str.maketrans({char: chr(code) for code, char in enumerate(ALPHABET, start=1)})
+_ONLY = [bytes(1 if i == code else 0 for i in range(256)) for code in range(len(ALPHABET) + 1)]
+
+
+class SearchResult(NamedTuple):
+
+    """
+    The dictionary words matching a search, the most frequent first.
+    """
+
+    words: List[str]
+    total: int
+
+
+class SearchIndex:
+
+    """
+    A positional inverted index over the dictionary words of a given length.
+
+    Word sets are bitmasks with a lane per word, as the candidate sets of the solver: the word at position i belongs
+    to the set if bit 8 * i is set. Words are kept in the order of the dictionary, the most frequent first, so the
+    members of any set come out ranked. There's a set per position and letter, holding the words with that letter
+    there, and a set per letter and count, holding the words with that letter at least that many times, so every
+    query resolves through bitwise operations alone.
+    """
+
+    def __init__(self, version: str, words: Sequence[str], length: int) -> None:
+
+        """
+        Class constructor.
+
+        Args:
+            version: The version of the dictionary the index was built from.
+            words: The words, the most frequent first.
+            length: The word length.
+        """
+
+        self.version = version
+        self.words = tuple(words)
+        self.length = length
+        self.full = int.from_bytes(b"\x01" * len(self.words), "little")
+
+        # Every letter becomes a single byte, so the letters of every position are a strided slice of all the words
+        encoded = "".join(self.words).translate(_CODES).encode("latin-1", "replace")
+        self.positions: Dict[Tuple[str, int], int] = {}
+        for position in range(length):
+            column = encoded[position::length]
+            for code, char in enumerate(ALPHABET, start=1):
+                if code in column:
+                    self.positions[(char, position)] = int.from_bytes(column.translate(_ONLY[code]), "little")
+
+        self.counts: Dict[Tuple[str, int], int] = {}
+        for char in ALPHABET:
+            mask = 0
+            for position in range(length):
+                mask |= self.positions.get((char, position), 0)
+            if mask:
+                self.counts[(char, 1)] = mask
+
+        # Just the few words repeating a letter are walked one by one
+        repeated: Dict[Tuple[str, int], bytearray] = {}
+        for i, word in enumerate(self.words):
+            if len(set(word)) < len(word):
+                for char, total in Counter(word).items():
+                    for n in range(2, total + 1):
+                        data = repeated.get((char, n))
+                        if data is None:
+                            data = repeated[(char, n)] = bytearray(len(self.words))
+                        data[i] = 1
+        self.counts.update((key, int.from_bytes(data, "little")) for key, data in repeated.items())
+
+    def __len__(self) -> int:
+
+        """
+        Get the number of words in the index.
+
+        Returns:
+            The number of words.
+        """
+
+        return len(self.words)
+
+    def query(self, fixed: Sequence[Optional[str]], required: Dict[str, int], excluded: str) -> int:
+
+        """
+        Get the words with the known letters in their positions, every required letter and no excluded letter.
+
+        Args:
+            fixed: The letter of every position, or None where it's unknown.
+            required: The least number of times every required letter must appear.
+            excluded: The letters which must not appear.
+
+        Returns:
+            The word set bitmask.
+        """
+
+        mask = self.full
+
+        for position, char in enumerate(fixed):
+            if char is not None:
+                mask &= self.positions.get((char, position), 0)
+
+        for char, total in required.items():
+            mask &= self.counts.get((char, total), 0)
+
+        for char in excluded:
+            mask &= ~self.counts.get((char, 1), 0)
+
+        return mask
+
+    def get_members(self, mask: int, limit: Optional[int] = None) -> List[str]:
+
+        """
+        Get the words in a set, the most frequent first.
+
+        Args:
+            mask: The word set bitmask.
+            limit: The most words returned, or None to return them all.
+
+        Returns:
+            The words.
+        """
+
+        data = mask.to_bytes(len(self.words), "little")
+        members: List[str] = []
+        i = data.find(1)
+        while i != -1 and (limit is None or len(members) < limit):
+            members.append(self.words[i])
+            i = data.find(1, i + 1)
+        return members
+
+
+_cache: Dict[Tuple[str, int], SearchIndex] = {}
+_cache_lock = threading.Lock()
+
+
+def get_index(length: int) -> SearchIndex:
+
+    """
+    Get the search index of the dictionary words with the given length.
+
+    The index is built the first time it's needed, and again only when the dictionary partition of that length gets a
+    new version.
+
+    Args:
+        length: The word length.
+
+    Returns:
+        An instance of `SearchIndex`.
+    """
+
+    key = (get_db_path(), length)
+    dictionary = get_dictionary(length)
+    index = _cache.get(key)
+
+    if index is None or index.version != dictionary.version:
+        with _cache_lock:
+            index = _cache.get(key)
+            if index is None or index.version != dictionary.version:
+                index = _cache[key] = SearchIndex(dictionary.version, dictionary.words, length)
+
+    return index
+
+
+def _parse_letters(text: str) -> str:
+
+    """
+    Normalize a set of letters given in a search.
+
+    Args:
+        text: The letters.
+
+    Returns:
+        The normalized letters.
+
+    Raises:
+        GameError: if any char is not a letter.
+    """
+
+    letters = normalize(text)
+
+    if any(char not in ALPHABET for char in letters):
+        raise GameError(f"[bold]{text}[/] tiene que tener solo letras")
+
+    return letters
+
+
+def parse_pattern(pattern: str) -> Tuple[Optional[str], ...]:
+
+    """
+    Parse a search pattern, such as `c?c?e`, with a letter in every known position and a wildcard in the rest.
+
+    Args:
+        pattern: The search pattern. Any of `WILDCARDS` stands for an unknown letter.
+
+    Returns:
+        The letter of every position, or None where it's unknown.
+
+    Raises:
+        GameError: if the pattern is empty or has any char which is neither a letter nor a wildcard.
+    """
+
+    chars = normalize(pattern)
+
+    if not chars or any(char not in ALPHABET and char not in WILDCARDS for char in chars):
+        raise GameError(
+            f"El patrón [bold]{pattern}[/] tiene que tener una letra en cada posición conocida "
+            "y [bold]?[/] en el resto"
+        )
+
+    return tuple(None if char in WILDCARDS else char for char in chars)
+
+
+def search(pattern: str, has: str = "", excluded: str = "", limit: Optional[int] = None) -> SearchResult:
+
+    """
+    Search the dictionary words matching a pattern, having some letters and not having some others.
+
+    Args:
+        pattern: The search pattern, such as `c?c?e`, which also gives the word length.
+        has: The letters the words must have, anywhere. A letter given several times must appear at least that many
+            times, counting its known positions.
+        excluded: The letters the words must not have.
+        limit: The most words returned, or None to return them all.
+
+    Returns:
+        An instance of `SearchResult`, with the matching words ranked by frequency.
+
+    Raises:
+        GameError: if the pattern or any of the letters are not valid.
+    """
+
+    fixed = parse_pattern(pattern)
+    required = Counter(_parse_letters(has))
+    index = get_index(len(fixed))
+
+    mask = index.query(fixed, dict(required), _parse_letters(excluded))
+    return SearchResult(index.get_members(mask, limit), bin(mask).count("1"))
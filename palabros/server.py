@@ -0,0 +1,488 @@
+import asyncio
+import json
+import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from http import HTTPStatus
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
+from urllib.parse import parse_qs, urlsplit
+from weakref import WeakValueDictionary
+
+from palabros import business, database, dictionary, writer
+from palabros.errors import DatabaseError, GameError, PalabrosError
+from palabros.schemas import Game, Stats
+
+T = TypeVar("T")
+
+MAX_BODY_SIZE = 4096
+
+# The most header lines a request can have, and the most bytes they can take altogether, so a client can't hold a
+# connection sending headers forever
+MAX_HEADERS = 64
+MAX_HEADERS_SIZE = 8192
+
+_ROUTE = re.compile(r"^/players/(?P<player>[A-Za-z0-9_-]{1,64})/(?P<resource>game|attempts|results)$")
+_MARKUP = re.compile(r"\[/?[a-z ]*\]")
+
+_logger = logging.getLogger(__name__)
+
+Response = Tuple[HTTPStatus, Dict[str, Any]]
+
+
+class HttpError(Exception):
+
+    """
+    An exception raised to answer a request with an error.
+    """
+
+    def __init__(self, status: HTTPStatus, code: str, message: str) -> None:
+
+        """
+        Class constructor.
+
+        Args:
+            status: The HTTP status.
+            code: The error code.
+            message: The error message.
+        """
+
+        super().__init__(message)
+        self.status = status
+        self.code = code
+        self.message = message
+
+
+def _headers_too_large() -> HttpError:
+
+    """
+    Get the error answering a request whose headers are beyond the limits.
+
+    Returns:
+        An instance of `HttpError`.
+    """
+
+    return HttpError(
+        HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE,
+        "palabros.headersTooLarge",
+        "Las cabeceras de la petición son demasiado grandes",
+    )
+
+
+def _serialize_game(game: Game) -> Dict[str, Any]:
+
+    """
+    Serialize a game, hiding its seed word until it's finished.
+
+    Args:
+        game: The game to serialize.
+
+    Returns:
+        A JSON-serializable dictionary.
+    """
+
+    finished = game.any_match() or not game.any_attempt_left()
+
+    return {
+        "date": game.date,
+        "word": game.word if finished else None,
+        "finished": finished,
+        "won": game.any_match(),
+        "attempts_left": game.get_attempts_left(),
+        "attempts": [
+            {
+                "word": attempt.word,
+                "match": attempt.match,
+                "chars": [
+                    {"char": char.char, "valid": char.valid, "missplaced": char.missplaced} for char in attempt.chars
+                ],
+            }
+            for attempt in game.attempts
+        ],
+    }
+
+
+def _serialize_stats(stats: Stats) -> Dict[str, Any]:
+
+    """
+    Serialize the lifetime statistics.
+
+    Args:
+        stats: The statistics to serialize.
+
+    Returns:
+        A JSON-serializable dictionary.
+    """
+
+    return {
+        "played": stats.played,
+        "won": stats.won,
+        "win_rate": stats.get_win_rate(),
+        "current_streak": stats.current_streak,
+        "max_streak": stats.max_streak,
+        "distribution": {str(k): v for k, v in sorted(stats.distribution.items())},
+    }
+
+
+def _get_state(player: str) -> Dict[str, Any]:
+
+    """
+    Get the state of the current game of a player.
+
+    Args:
+        player: The player id.
+
+    Returns:
+        The serialized game.
+    """
+
+    return _serialize_game(business.get_current_game(player_id=player))
+
+
+def _play(player: str, word: str) -> Dict[str, Any]:
+
+    """
+    Play a word in the current game of a player.
+
+    Args:
+        player: The player id.
+        word: The word given by the player.
+
+    Returns:
+        The serialized game, including the new attempt.
+
+    Raises:
+        HttpError: if the game is already finished.
+    """
+
+    # The dictionary revision is checked once per attempt, so words loaded meanwhile are found
+    dictionary.refresh()
+    business.check_word(word)
+    game = business.get_current_game(player_id=player)
+
+    if game.any_match() or not game.any_attempt_left():
+        raise HttpError(HTTPStatus.CONFLICT, "palabros.gameFinished", "La partida de hoy ya ha terminado")
+
+    game.attempts.append(business.play_game(game, word))
+    return _serialize_game(game)
+
+
+def _get_results(player: str, date: str) -> Dict[str, Any]:
+
+    """
+    Get the game of a player in a date, along with their lifetime statistics.
+
+    Args:
+        player: The player id.
+        date: The date, given in YYYYMMDD format.
+
+    Returns:
+        The serialized game and statistics.
+    """
+
+    game = business.get_game(date, player)
+    return {
+        "game": _serialize_game(game) if game is not None else None,
+        "stats": _serialize_stats(business.get_stats(player)),
+    }
+
+
+class Server:
+
+    """
+    An HTTP API over the business layer, able to serve many players at once.
+
+    Requests are parsed in the event loop, while every blocking business call runs in a bounded pool of worker
+    threads, each one with its own long-lived database connection. Attempts of the same player are serialized.
+    """
+
+    def __init__(self, workers: int = 4) -> None:
+
+        """
+        Class constructor.
+
+        Args:
+            workers: The number of worker threads running business calls.
+        """
+
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="palabros")
+        # A lock lives as long as some request holds it or waits for it, so idle players take no memory
+        self._locks: "WeakValueDictionary[str, asyncio.Lock]" = WeakValueDictionary()
+
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+
+        """
+        Run a blocking call in the worker threads.
+
+        Args:
+            func: The function to call.
+            args: The function arguments.
+
+        Returns:
+            The function result.
+        """
+
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    def _get_lock(self, player: str) -> asyncio.Lock:
+
+        """
+        Get the lock serializing the attempts of a player, creating it unless some request holds it or waits for it.
+
+        Args:
+            player: The player id.
+
+        Returns:
+            An instance of `asyncio.Lock`.
+        """
+
+        lock = self._locks.get(player)
+        if lock is None:
+            lock = self._locks[player] = asyncio.Lock()
+        return lock
+
+    async def dispatch(self, method: str, target: str, body: bytes) -> Response:
+
+        """
+        Answer a request.
+
+        Args:
+            method: The HTTP method.
+            target: The request target, including the query string.
+            body: The request body.
+
+        Returns:
+            The HTTP status and the JSON payload.
+        """
+
+        url = urlsplit(target)
+        match = _ROUTE.match(url.path)
+
+        try:
+            if match is None:
+                raise HttpError(HTTPStatus.NOT_FOUND, "palabros.notFound", "Recurso no encontrado")
+
+            player, resource = match.group("player"), match.group("resource")
+
+            if resource == "game" and method == "GET":
+                return HTTPStatus.OK, await self._run(_get_state, player)
+
+            if resource == "attempts" and method == "POST":
+                word = self._parse_word(body)
+                async with self._get_lock(player):
+                    return HTTPStatus.CREATED, await self._run(_play, player, word)
+
+            if resource == "results" and method == "GET":
+                date = parse_qs(url.query).get("date", [datetime.now().strftime("%Y%m%d")])[0]
+                if not re.fullmatch(r"\d{8}", date):
+                    raise HttpError(HTTPStatus.BAD_REQUEST, "palabros.badRequest", "La fecha no es AAAAMMDD")
+                return HTTPStatus.OK, await self._run(_get_results, player, date)
+
+            raise HttpError(HTTPStatus.METHOD_NOT_ALLOWED, "palabros.methodNotAllowed", "Método no permitido")
+
+        except HttpError as err:
+            return err.status, {"code": err.code, "message": err.message}
+        except GameError as err:
+            return HTTPStatus.UNPROCESSABLE_ENTITY, self._serialize_error(err)
+        except DatabaseError as err:
+            return HTTPStatus.SERVICE_UNAVAILABLE, self._serialize_error(err)
+        except Exception:
+            _logger.exception("Unhandled error answering %s %s", method, target)
+            return HTTPStatus.INTERNAL_SERVER_ERROR, {
+                "code": "palabros.internalError",
+                "message": "Error no controlado",
+            }
+
+    @staticmethod
+    def _parse_word(body: bytes) -> str:
+
+        """
+        Get the word from the body of an attempt request.
+
+        Args:
+            body: The request body.
+
+        Returns:
+            The word given by the player.
+
+        Raises:
+            HttpError: if the body is not a JSON object with a word.
+        """
+
+        try:
+            word = json.loads(body).get("word")
+        except (ValueError, AttributeError):
+            word = None
+
+        if not isinstance(word, str):
+            raise HttpError(HTTPStatus.BAD_REQUEST, "palabros.badRequest", 'Se esperaba {"word": "..."}')
+
+        return word
+
+    @staticmethod
+    def _serialize_error(err: PalabrosError) -> Dict[str, Any]:
+
+        """
+        Serialize a business error, without console markup.
+
+        Args:
+            err: The error.
+
+        Returns:
+            A JSON-serializable dictionary.
+        """
+
+        return {"code": err.code, "message": _MARKUP.sub("", err.message)}
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+
+        """
+        Serve the requests of a client connection, keeping it alive as HTTP/1.1 does by default.
+
+        Args:
+            reader: The connection reader.
+            writer: The connection writer.
+        """
+
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+
+                try:
+                    method, target, version = request_line.decode("latin-1").split()
+                except ValueError:
+                    break
+
+                header_error: Optional[HttpError] = None
+                try:
+                    headers = await self._read_headers(reader)
+                except HttpError as err:
+                    headers, header_error = {}, err
+
+                try:
+                    length = int(headers.get("content-length") or 0)
+                except ValueError:
+                    length = -1
+
+                # Neither the rest of the headers nor a body without a valid length can be skipped, so the connection
+                # is closed after answering
+                if header_error is not None:
+                    status, payload = header_error.status, {"code": header_error.code, "message": header_error.message}
+                    keep_alive = False
+                elif length < 0:
+                    status, payload = HTTPStatus.BAD_REQUEST, {
+                        "code": "palabros.badRequest",
+                        "message": "La cabecera Content-Length no es válida",
+                    }
+                    keep_alive = False
+                elif length > MAX_BODY_SIZE:
+                    status, payload = HTTPStatus.REQUEST_ENTITY_TOO_LARGE, {"code": "palabros.tooLarge"}
+                    keep_alive = False
+                else:
+                    body = await reader.readexactly(length) if length else b""
+                    status, payload = await self.dispatch(method, target, body)
+                    keep_alive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+
+                data = json.dumps(payload, ensure_ascii=False).encode()
+                writer.write(
+                    (
+                        f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+                        "Content-Type: application/json; charset=utf-8\r\n"
+                        f"Content-Length: {len(data)}\r\n"
+                        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+                    ).encode("latin-1")
+                    + data
+                )
+                await writer.drain()
+
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _read_headers(reader: asyncio.StreamReader) -> Dict[str, str]:
+
+        """
+        Read the headers of a request.
+
+        Args:
+            reader: The connection reader.
+
+        Returns:
+            The headers, with lowercase names.
+
+        Raises:
+            HttpError: if there are more than `MAX_HEADERS` header lines, or they take more than `MAX_HEADERS_SIZE`
+                bytes.
+        """
+
+        headers = {}
+        count = size = 0
+        while True:
+            try:
+                line = await reader.readline()
+            except ValueError as err:
+                # A single line longer than the limit of the reader
+                raise _headers_too_large() from err
+            if line in (b"\r\n", b"\n", b""):
+                return headers
+            count += 1
+            size += len(line)
+            if count > MAX_HEADERS or size > MAX_HEADERS_SIZE:
+                raise _headers_too_large()
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+    async def serve(self, host: str, port: int, ready: Optional[Callable[[int], None]] = None) -> None:
+
+        """
+        Serve requests until cancelled.
+
+        Args:
+            host: The host to listen on.
+            port: The port to listen on, or 0 to pick a free one.
+            ready: An optional callback, called with the actual port once the server is listening.
+        """
+
+        # No line can be longer than every header altogether
+        server = await asyncio.start_server(self.handle, host, port, limit=MAX_HEADERS_SIZE)
+        if ready is not None:
+            ready(server.sockets[0].getsockname()[1])
+
+        async with server:
+            await server.serve_forever()
+
+    def close(self) -> None:
+
+        """
+        Stop the worker threads and close their database connections.
+        """
+
+        self._executor.shutdown(wait=True)
+        writer.close()
+        database.close()
+
+
+def serve(host: str = "127.0.0.1", port: int = 8000, workers: int = 4) -> None:
+
+    """
+    Run the server until interrupted.
+
+    Args:
+        host: The host to listen on.
+        port: The port to listen on.
+        workers: The number of worker threads running business calls.
+    """
+
+    server = Server(workers)
+    try:
+        asyncio.run(server.serve(host, port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
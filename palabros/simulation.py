@@ -0,0 +1,389 @@
+import os
+import random
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from palabros.dictionary import get_dictionary
+from palabros.errors import GameError
+from palabros.patterns import PatternMatrix, get_matrix
+from palabros.schemas import MAX_ATTEMPTS
+from palabros.scoring import get_match_pattern, score
+from palabros.solver import (
+    count_members,
+    filter_candidates,
+    get_full_mask,
+    get_members,
+    rank_guesses,
+)
+
+# How the next guess is chosen among the words left: the most frequent candidate, the one expected to give the most
+# information, as `palabros hint` suggests, or a random candidate
+STRATEGIES = ("frequency", "entropy", "random")
+
+# The number of answers a worker solves at once
+CHUNK_SIZE = 64
+
+
+class SimulationReport(NamedTuple):
+
+    """
+    The outcome of a simulation, which plays a strategy against every dictionary word as the answer.
+    """
+
+    strategy: str
+    words: int
+    distribution: Dict[int, int]
+    failed: Tuple[str, ...]
+    elapsed: float
+    busy: float
+    workers: int
+
+    def get_failure_rate(self) -> float:
+
+        """
+        Get the share of answers the strategy couldn't guess.
+
+        Returns:
+            The failure rate, between 0 and 1.
+        """
+
+        return len(self.failed) / self.words if self.words else 0.0
+
+    def get_mean_guesses(self) -> float:
+
+        """
+        Get the mean number of guesses needed by the answers the strategy guessed.
+
+        Returns:
+            The mean number of guesses.
+        """
+
+        solved = sum(self.distribution.values())
+        return sum(guesses * total for guesses, total in self.distribution.items()) / solved if solved else 0.0
+
+    def get_words_per_second(self) -> float:
+
+        """
+        Get the simulation throughput, as seen from the outside.
+
+        Returns:
+            The number of answers played per second of wall time.
+        """
+
+        return self.words / self.elapsed if self.elapsed else 0.0
+
+    def get_words_per_second_per_core(self) -> float:
+
+        """
+        Get the throughput of a single worker, which shouldn't change with the number of workers.
+
+        Returns:
+            The number of answers played per second of worker time.
+        """
+
+        return self.words / self.busy if self.busy else 0.0
+
+
+class _Player:
+
+    """
+    A strategy playing games against a pattern matrix.
+    """
+
+    def __init__(
+        self,
+        matrix: PatternMatrix,
+        frequencies: Sequence[float],
+        strategy: str,
+        max_attempts: int,
+        seed: int,
+    ) -> None:
+
+        """
+        Class constructor.
+
+        Args:
+            matrix: The pattern matrix of the dictionary words.
+            frequencies: The frequency of every word in the matrix, in the same order.
+            strategy: One of `STRATEGIES`.
+            max_attempts: The number of attempts of every game.
+            seed: The seed of the random choices.
+        """
+
+        self.matrix = matrix
+        self.frequencies = tuple(frequencies)
+        self.strategy = strategy
+        self.max_attempts = max_attempts
+        self.seed = seed
+        self.match = get_match_pattern(matrix.length)
+        self._weights = dict(zip(matrix.words, self.frequencies))
+        # The guess of the deterministic strategies depends on the candidates left only, so it's memoized
+        self._guesses: Dict[int, str] = {}
+
+    def _guess(self, mask: int, rnd: Optional[random.Random]) -> str:
+
+        """
+        Choose the next guess.
+
+        Args:
+            mask: The candidate set bitmask.
+            rnd: The random generator of the game, used by the `random` strategy only.
+
+        Returns:
+            The guessed word.
+        """
+
+        if rnd is not None:
+            return self.matrix.words[rnd.choice(get_members(self.matrix, mask))]
+
+        guess = self._guesses.get(mask)
+        if guess is None:
+            if self.strategy == "entropy" and count_members(mask) > 2:
+                guess = rank_guesses(self.matrix, mask, self._weights, 1)[0].word
+            else:
+                guess = self.matrix.words[max(get_members(self.matrix, mask), key=self.frequencies.__getitem__)]
+            self._guesses[mask] = guess
+
+        return guess
+
+    def play(self, answer: str) -> Optional[int]:
+
+        """
+        Play a game, scoring every guess the same way attempts are scored.
+
+        Args:
+            answer: The seed word of the game.
+
+        Returns:
+            The number of guesses needed, or None if the answer wasn't guessed.
+        """
+
+        # Every game has its own generator, so the result doesn't depend on how answers are split among workers
+        rnd = random.Random(f"{self.seed}:{answer}") if self.strategy == "random" else None
+        mask = get_full_mask(self.matrix)
+
+        for attempt in range(1, self.max_attempts + 1):
+            guess = self._guess(mask, rnd)
+            pattern = score(answer, guess)
+            if pattern == self.match:
+                return attempt
+            mask = filter_candidates(self.matrix, mask, guess, pattern)
+
+        return None
+
+
+_player: Optional[_Player] = None
+
+
+def _init_worker(
+    matrix: PatternMatrix,
+    frequencies: Sequence[float],
+    strategy: str,
+    max_attempts: int,
+    seed: int,
+) -> None:
+
+    """
+    Set up the player of a worker process.
+
+    Args:
+        matrix: The pattern matrix of the dictionary words.
+        frequencies: The frequency of every word in the matrix, in the same order.
+        strategy: One of `STRATEGIES`.
+        max_attempts: The number of attempts of every game.
+        seed: The seed of the random choices.
+    """
+
+    global _player
+
+    _player = _Player(matrix, frequencies, strategy, max_attempts, seed)
+
+
+def _play_chunk(answers: Sequence[str]) -> Tuple[List[Optional[int]], float]:
+
+    """
+    Play a game against every answer of a chunk, in a worker process.
+
+    Args:
+        answers: The seed words.
+
+    Returns:
+        The number of guesses needed by every answer, or None for the ones not guessed, and the time spent.
+    """
+
+    assert _player is not None
+
+    start = time.perf_counter()
+    guesses = [_player.play(answer) for answer in answers]
+    return guesses, time.perf_counter() - start
+
+
+def _split(words: Sequence[str], chunk_size: int) -> Iterator[Sequence[str]]:
+
+    """
+    Split the answers into chunks.
+
+    Args:
+        words: The answers.
+        chunk_size: The number of answers per chunk.
+
+    Yields:
+        Every chunk.
+    """
+
+    for i in range(0, len(words), chunk_size):
+        yield words[i : i + chunk_size]
+
+
+def _play(
+    length: int,
+    strategy: str,
+    max_attempts: Optional[int],
+    workers: Optional[int],
+    chunk_size: int,
+    seed: int,
+    limit: Optional[int],
+    progress: Optional[Callable[[int], None]],
+) -> Tuple[Sequence[str], List[Optional[int]], float, int]:
+
+    """
+    Play a strategy against the dictionary words of the given length, across a pool of worker processes.
+
+    Args:
+        length: The word length.
+        strategy: One of `STRATEGIES`.
+        max_attempts: The number of attempts of every game, or None to play until the answer is guessed.
+        workers: The number of worker processes. 1 plays every game in the current process; None uses every core.
+        chunk_size: The number of answers sent to a worker at once.
+        seed: The seed of the random choices.
+        limit: An optional number of answers to play, sampled from the dictionary with the seed.
+        progress: An optional callback, called after every chunk with the number of answers played so far.
+
+    Returns:
+        The answers played, the number of guesses needed by every one of them or None if it wasn't guessed, the time
+        spent by all the workers together, and the number of workers.
+
+    Raises:
+        GameError: if the strategy is unknown or there are no words of the given length.
+    """
+
+    if strategy not in STRATEGIES:
+        raise GameError(f"La estrategia tiene que ser una de estas: [bold]{', '.join(STRATEGIES)}[/]")
+
+    dictionary = get_dictionary(length)
+    if not len(dictionary):
+        raise GameError(f"No hay palabras de [bold]{length}[/] letras en el diccionario")
+
+    matrix = get_matrix(length)
+    frequencies = [dictionary.frequencies[dictionary.index[word]] for word in matrix.words]
+    words: Sequence[str] = dictionary.words
+    if limit is not None and limit < len(words):
+        words = random.Random(seed).sample(words, limit)
+
+    # Every guess of the strategies but entropy is a candidate, so no game takes more guesses than words there are
+    workers = max(1, workers or os.cpu_count() or 1)
+    args = (matrix, frequencies, strategy, max_attempts or len(matrix), seed)
+    guesses: List[Optional[int]] = []
+    busy = 0.0
+
+    def collect(results: Iterator[Tuple[List[Optional[int]], float]]) -> None:
+        nonlocal busy
+        for chunk_guesses, chunk_busy in results:
+            guesses.extend(chunk_guesses)
+            busy += chunk_busy
+            if progress is not None:
+                progress(len(guesses))
+
+    if workers == 1:
+        _init_worker(*args)
+        collect(map(_play_chunk, _split(words, chunk_size)))
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=args) as executor:
+            collect(executor.map(_play_chunk, _split(words, chunk_size)))
+
+    return words, guesses, busy, workers
+
+
+def simulate(
+    length: int,
+    strategy: str = "frequency",
+    max_attempts: int = MAX_ATTEMPTS,
+    workers: Optional[int] = None,
+    chunk_size: int = CHUNK_SIZE,
+    seed: int = 0,
+    limit: Optional[int] = None,
+    progress: Optional[Callable[[int], None]] = None,
+) -> SimulationReport:
+
+    """
+    Play a strategy against every dictionary word of the given length as the answer.
+
+    The answers are split into chunks and played across a pool of worker processes, which get the pattern matrix once,
+    memory-mapped from its file whenever it lives in one. Every candidate set is narrowed down through the matrix, but
+    every guess is scored the same way attempts are, so the simulation measures both paths. Given the same seed and
+    dictionary, the result is always the same, whatever the number of workers.
+
+    Args:
+        length: The word length.
+        strategy: One of `STRATEGIES`.
+        max_attempts: The number of attempts of every game.
+        workers: The number of worker processes. 1 plays every game in the current process; None uses every core.
+        chunk_size: The number of answers sent to a worker at once.
+        seed: The seed of the random choices.
+        limit: An optional number of answers to play, sampled from the dictionary with the seed.
+        progress: An optional callback, called after every chunk with the number of answers played so far.
+
+    Returns:
+        An instance of `SimulationReport`.
+
+    Raises:
+        GameError: if the strategy is unknown or there are no words of the given length.
+    """
+
+    start = time.perf_counter()
+    words, guesses, busy, workers = _play(length, strategy, max_attempts, workers, chunk_size, seed, limit, progress)
+    distribution = Counter(total for total in guesses if total is not None)
+
+    return SimulationReport(
+        strategy=strategy,
+        words=len(words),
+        distribution=dict(sorted(distribution.items())),
+        failed=tuple(sorted(word for word, total in zip(words, guesses) if total is None)),
+        elapsed=time.perf_counter() - start,
+        busy=busy,
+        workers=workers,
+    )
+
+
+def get_guesses(
+    length: int,
+    strategy: str = "frequency",
+    workers: Optional[int] = None,
+    chunk_size: int = CHUNK_SIZE,
+    seed: int = 0,
+    progress: Optional[Callable[[int], None]] = None,
+) -> Dict[str, int]:
+
+    """
+    Get the number of guesses a strategy needs to guess every dictionary word of the given length, with no limit of
+    attempts.
+
+    Args:
+        length: The word length.
+        strategy: One of `STRATEGIES`.
+        workers: The number of worker processes. 1 plays every game in the current process; None uses every core.
+        chunk_size: The number of answers sent to a worker at once.
+        seed: The seed of the random choices.
+        progress: An optional callback, called after every chunk with the number of answers played so far.
+
+    Returns:
+        A dictionary mapping every word to the number of guesses needed.
+
+    Raises:
+        GameError: if the strategy is unknown or there are no words of the given length.
+    """
+
+    words, guesses, _, _ = _play(length, strategy, None, workers, chunk_size, seed, None, progress)
+    return {word: total for word, total in zip(words, guesses) if total is not None}
@@ -0,0 +1,315 @@
+import hashlib
+import json
+import math
+import os
+from array import array
+from collections import Counter
+from functools import lru_cache
+from operator import itemgetter
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from palabros.database import get_sidecar_path
+from palabros.patterns import PatternMatrix
+from palabros.schemas import Suggestion
+from palabros.scoring import score
+
+# Candidate sets up to this size are ranked over every candidate, so the ranking is exact. Bigger ones, such as the
+# whole dictionary before the first guess, are sampled evenly down to this size to keep the latency bounded, so their
+# entropies are estimates
+MAX_SAMPLE = 256
+
+# The opening ranking, over the whole dictionary before any guess, is the slowest one and the same for every game of
+# a dictionary version, so this many of its best guesses are stored next to the database and read on later runs
+OPENING_SIZE = 20
+
+# Candidate sets are bitmasks with a lane per matrix word: the word at position i is a candidate if bit 8 * i is set
+_ONLY = [bytes(1 if i == pattern else 0 for i in range(256)) for pattern in range(256)]
+_CLOG = [0.0] + [c * math.log2(c) for c in range(1, MAX_SAMPLE + 1)]
+
+
+def get_full_mask(matrix: PatternMatrix) -> int:
+
+    """
+    Get the candidate set holding every word of a matrix.
+
+    Args:
+        matrix: The pattern matrix.
+
+    Returns:
+        The candidate set bitmask.
+    """
+
+    return int.from_bytes(b"\x01" * len(matrix), "little")
+
+
+def get_mask(matrix: PatternMatrix, members: Iterable[int]) -> int:
+
+    """
+    Get the candidate set holding the given words of a matrix.
+
+    Args:
+        matrix: The pattern matrix.
+        members: The position of every word in the matrix.
+
+    Returns:
+        The candidate set bitmask.
+    """
+
+    data = bytearray(len(matrix))
+    for i in members:
+        data[i] = 1
+    return int.from_bytes(data, "little")
+
+
+def count_members(mask: int) -> int:
+
+    """
+    Count the words in a candidate set.
+
+    Args:
+        mask: The candidate set bitmask.
+
+    Returns:
+        The number of candidates.
+    """
+
+    return bin(mask).count("1")
+
+
+def get_members(matrix: PatternMatrix, mask: int) -> List[int]:
+
+    """
+    Get the words in a candidate set.
+
+    Args:
+        matrix: The pattern matrix.
+        mask: The candidate set bitmask.
+
+    Returns:
+        The position of every candidate in the matrix.
+    """
+
+    data = mask.to_bytes(len(matrix), "little")
+    members = []
+    i = data.find(1)
+    while i != -1:
+        members.append(i)
+        i = data.find(1, i + 1)
+    return members
+
+
+def filter_candidates(matrix: PatternMatrix, mask: int, guess: str, pattern: int) -> int:
+
+    """
+    Keep the candidates which would give the same pattern for the given guess.
+
+    Args:
+        matrix: The pattern matrix.
+        mask: The candidate set bitmask.
+        guess: The guessed word, normalized and lowercase.
+        pattern: The packed pattern the guess got.
+
+    Returns:
+        The filtered candidate set bitmask.
+    """
+
+    i = matrix.index.get(guess)
+
+    if i is None:
+        # Not a dictionary word anymore, so it has to be scored against every candidate
+        data = bytearray(len(matrix))
+        for j in get_members(matrix, mask):
+            data[j] = score(matrix.words[j], guess) == pattern
+        return mask & int.from_bytes(data, "little")
+
+    row = matrix.row(i)
+    if matrix.size == 1:
+        data = bytes(row).translate(_ONLY[pattern])
+    else:
+        data = bytes(value == pattern for value in row)
+
+    return mask & int.from_bytes(data, "little")
+
+
+def filter_attempts(matrix: PatternMatrix, attempts: Sequence[Tuple[str, int]]) -> int:
+
+    """
+    Get the candidate set left after some attempts.
+
+    Args:
+        matrix: The pattern matrix.
+        attempts: Every guessed word, normalized and lowercase, along with the packed pattern it got.
+
+    Returns:
+        The candidate set bitmask.
+    """
+
+    mask = get_full_mask(matrix)
+    for guess, pattern in attempts:
+        mask = filter_candidates(matrix, mask, guess, pattern)
+    return mask
+
+
+def clear_cache() -> None:
+
+    """
+    Drop the cached rankings, along with the pattern matrices they hold, which must happen whenever a matrix is
+    rebuilt.
+    """
+
+    _rank.cache_clear()
+    _get_opening.cache_clear()
+
+
+@lru_cache(maxsize=64)
+def _rank(
+    matrix: PatternMatrix,
+    mask: int,
+    frequencies: Tuple[float, ...],
+    limit: int,
+    allowed: Optional[int],
+) -> Tuple[Suggestion, ...]:
+
+    """
+    Rank the words of a matrix as the next guess, caching the result.
+
+    Args:
+        matrix: The pattern matrix.
+        mask: The candidate set bitmask.
+        frequencies: The frequency of every word in the matrix, in the same order.
+        limit: The number of guesses to return.
+        allowed: The bitmask of the words which can be guessed, or None if any word can.
+
+    Returns:
+        The best guesses, the best first.
+    """
+
+    members = get_members(matrix, mask)
+    total = sum(frequencies[j] for j in members) or 1.0
+
+    if len(members) <= 2:
+        ranked = sorted(members, key=lambda j: frequencies[j], reverse=True)
+        return tuple(
+            Suggestion(matrix.words[j], float(len(members) - 1), True, frequencies[j] / total) for j in ranked[:limit]
+        )
+
+    step = math.ceil(len(members) / MAX_SAMPLE)
+    sample = members[::step]
+    n = len(sample)
+    getter = itemgetter(*sample)
+    candidates = set(members)
+    log_n = math.log2(n)
+    row = matrix.row
+    clog = _CLOG.__getitem__
+    guesses = range(len(matrix)) if allowed is None else get_members(matrix, allowed)
+    scores = []
+
+    for i in guesses:
+        entropy = log_n - sum(map(clog, Counter(getter(row(i))).values())) / n
+        chance = frequencies[i] / total if i in candidates else 0.0
+        scores.append((entropy + chance, frequencies[i], i, entropy, chance))
+
+    scores.sort(reverse=True)
+    return tuple(
+        Suggestion(matrix.words[i], entropy, chance > 0, chance) for _, _, i, entropy, chance in scores[:limit]
+    )
+
+
+def _get_opening_path(matrix: PatternMatrix) -> Optional[Path]:
+
+    """
+    Get the path of the file holding the opening ranking of a matrix.
+
+    Args:
+        matrix: The pattern matrix.
+
+    Returns:
+        The file path, or None if the database doesn't live in a regular file.
+    """
+
+    return get_sidecar_path(f".opening-{matrix.length}.json")
+
+
+@lru_cache(maxsize=8)
+def _get_opening(matrix: PatternMatrix, frequencies: Tuple[float, ...]) -> Tuple[Suggestion, ...]:
+
+    """
+    Get the best `OPENING_SIZE` guesses before any attempt, reading them from their file when it was written for the
+    same dictionary version and frequencies, and ranking and writing them otherwise.
+
+    Args:
+        matrix: The pattern matrix.
+        frequencies: The frequency of every word in the matrix, in the same order.
+
+    Returns:
+        The best guesses, the best first.
+    """
+
+    path = _get_opening_path(matrix)
+    digest = hashlib.sha1(array("d", frequencies).tobytes()).hexdigest()
+
+    if path is not None:
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            if data["version"] == matrix.version and data["frequencies"] == digest:
+                return tuple(Suggestion(*values) for values in data["suggestions"])
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+    suggestions = _rank(matrix, get_full_mask(matrix), frequencies, OPENING_SIZE, None)
+
+    if path is not None:
+        data = {
+            "version": matrix.version,
+            "frequencies": digest,
+            "suggestions": [[s.word, s.entropy, s.candidate, s.chance] for s in suggestions],
+        }
+        # Written aside and then renamed, so concurrent processes never read it half-written
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(data), encoding="utf-8")
+        os.replace(tmp_path, path)
+
+    return suggestions
+
+
+def rank_guesses(
+    matrix: PatternMatrix,
+    mask: int,
+    frequencies: Dict[str, float],
+    limit: int = 5,
+    allowed: Optional[int] = None,
+) -> List[Suggestion]:
+
+    """
+    Rank the dictionary words as the next guess, by the expected information gained over the candidates left.
+
+    The expected information of a guess is the entropy of the patterns it would get against every candidate, which is
+    computed bucketing the candidates by pattern. Up to `MAX_SAMPLE` candidates, every one of them is bucketed; beyond
+    that, an even sample of `MAX_SAMPLE` candidates is. The chance of guessing right, weighted by word frequency, is
+    added to favour candidates; and word frequency breaks the ties. The opening ranking, before any guess, is stored
+    next to the database, so just the first run for a dictionary version pays for it.
+
+    Args:
+        matrix: The pattern matrix.
+        mask: The candidate set bitmask.
+        frequencies: The frequency of every word.
+        limit: The number of guesses to return.
+        allowed: An optional bitmask of the words which can be guessed, such as the ones allowed in hard mode. The
+            candidates are always allowed.
+
+    Returns:
+        The best guesses, the best first.
+    """
+
+    if not mask:
+        return []
+
+    weights = tuple(frequencies.get(word, 0.0) for word in matrix.words)
+    full = get_full_mask(matrix)
+    allowed = allowed | mask if allowed is not None and allowed | mask != full else None
+
+    if mask == full and allowed is None and limit <= OPENING_SIZE:
+        return list(_get_opening(matrix, weights)[:limit])
+
+    return list(_rank(matrix, mask, weights, limit, allowed))
@@ -0,0 +1,147 @@
+import sqlite3
+from datetime import datetime, timedelta
+from typing import Dict
+
+from palabros.queries import Query
+from palabros.schemas import DEFAULT_PLAYER, Stats
+
+
+def _get_previous_date(date: str) -> str:
+
+    """
+    Get the day before the given date.
+
+    Args:
+        date: The date, given in YYYYMMDD format.
+
+    Returns:
+        The previous date, given in YYYYMMDD format.
+    """
+
+    return (datetime.strptime(date, "%Y%m%d") - timedelta(days=1)).strftime("%Y%m%d")
+
+
+def apply(stats: Stats, date: str, won: bool, attempts: int) -> None:
+
+    """
+    Update the statistics with a finished game.
+
+    Every word length has its own game of the day, so a game won on the same date as the last one won keeps the
+    streak as it is, and the distribution counts the attempts of every variant alike.
+
+    Args:
+        stats: The statistics to update.
+        date: The game date.
+        won: Whether the game was won.
+        attempts: The number of attempts played.
+    """
+
+    stats.played += 1
+
+    if not won:
+        stats.current_streak = 0
+        return
+
+    if not stats.current_streak:
+        stats.current_streak = 1
+    elif stats.last_won_date == _get_previous_date(date):
+        stats.current_streak += 1
+    elif stats.last_won_date != date:
+        stats.current_streak = 1
+
+    stats.won += 1
+    stats.max_streak = max(stats.max_streak, stats.current_streak)
+    stats.last_won_date = date
+    stats.distribution[attempts] = stats.distribution.get(attempts, 0) + 1
+
+
+def read(cur: sqlite3.Cursor, player_id: str = DEFAULT_PLAYER) -> Stats:
+
+    """
+    Read the statistics of a player from the summary tables.
+
+    Args:
+        cur: The cursor to use.
+        player_id: The player id.
+
+    Returns:
+        An instance of `Stats`.
+    """
+
+    cur.execute(Query.GetStats, (player_id,))
+    row = cur.fetchone()
+    stats = Stats() if row is None else Stats(*row)
+
+    cur.execute(Query.GetStatsDistribution, (player_id,))
+    stats.distribution = {row["attempts"]: row["total"] for row in cur.fetchall()}
+
+    return stats
+
+
+def _save(cur: sqlite3.Cursor, stats: Stats, player_id: str) -> None:
+
+    """
+    Save the statistics totals of a player, but not the distribution, to the summary table.
+
+    Args:
+        cur: The cursor to use.
+        stats: The statistics to save.
+        player_id: The player id.
+    """
+
+    cur.execute(
+        Query.SaveStats,
+        (player_id, stats.played, stats.won, stats.current_streak, stats.max_streak, stats.last_won_date),
+    )
+
+
+def record(cur: sqlite3.Cursor, date: str, won: bool, attempts: int, player_id: str = DEFAULT_PLAYER) -> None:
+
+    """
+    Record a finished game in the summary tables, which are updated incrementally.
+
+    It should run in the same transaction as the attempt finishing the game.
+
+    Args:
+        cur: The cursor to use.
+        date: The game date.
+        won: Whether the game was won.
+        attempts: The number of attempts played.
+        player_id: The player id.
+    """
+
+    cur.execute(Query.GetStats, (player_id,))
+    row = cur.fetchone()
+    stats = Stats() if row is None else Stats(*row)
+    apply(stats, date, won, attempts)
+    _save(cur, stats, player_id)
+
+    if won:
+        cur.execute(Query.IncrementStatsDistribution, (player_id, attempts))
+
+
+def rebuild(cur: sqlite3.Cursor) -> None:
+
+    """
+    Rebuild the summary tables of every player from the whole game history.
+
+    Args:
+        cur: The cursor to use.
+    """
+
+    players: Dict[str, Stats] = {DEFAULT_PLAYER: Stats()}
+    # The history is streamed, so its size doesn't matter, just the number of players
+    for row in cur.execute(Query.GetGamesSummary):
+        stats = players.setdefault(row["player_id"], Stats())
+        if row["won"] or row["attempts"] >= row["max_attempts"]:
+            apply(stats, row["date"], bool(row["won"]), row["attempts"])
+
+    cur.execute(Query.ClearStats)
+    cur.execute(Query.ClearStatsDistribution)
+
+    for player_id, stats in players.items():
+        _save(cur, stats, player_id)
+        cur.executemany(
+            Query.SaveStatsDistribution,
+            ((player_id, attempts, total) for attempts, total in stats.distribution.items()),
+        )
@@ -0,0 +1,659 @@
+import os
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from dataclasses import replace
+from functools import lru_cache
+from itertools import groupby
+from typing import (
+    Callable,
+    ContextManager,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from palabros import database, stats, writer
+from palabros.errors import DatabaseError
+from palabros.normalization import normalize
+from palabros.queries import Query
+from palabros.schemas import MAX_ATTEMPTS, Attempt, Game, Stats
+from palabros.scoring import score
+
+# The storage backends, selected with the `PALABROS_STORAGE` environment variable
+ENV_VAR = "PALABROS_STORAGE"
+BACKENDS = ("sqlite", "memory")
+
+# The most (seed, word) pairs memoized when loading attempts stored without their pattern
+SCORE_CACHE_SIZE = 4096
+
+
+class Storage(ABC):
+
+    """
+    The persistence the game relies on: games, attempts, words and versions.
+
+    Every operation is atomic on its own, and `transaction` groups several of them into a single one.
+    """
+
+    @abstractmethod
+    def init(self, progress: Optional[Callable[[int, int], None]] = None) -> None:
+
+        """
+        Set the storage up, creating it or bringing it up to date.
+
+        Args:
+            progress: An optional callback, called after every migration step with the number of steps run so far
+                and the total.
+        """
+
+    @abstractmethod
+    def close(self) -> None:
+
+        """
+        Release every resource held by the storage.
+        """
+
+    @abstractmethod
+    def transaction(self) -> ContextManager[None]:
+
+        """
+        Group the operations run within a block into a single write transaction, so no other writer gets in between.
+
+        Returns:
+            A context manager wrapping the block.
+        """
+
+    @abstractmethod
+    def get_versions(self) -> Set[str]:
+
+        """
+        Get the versions whose migrations were already applied to the storage.
+
+        Returns:
+            The applied versions.
+        """
+
+    @abstractmethod
+    def get_words(self, length: Optional[int] = None) -> List[Tuple[str, float]]:
+
+        """
+        Get the dictionary words, the most frequent first.
+
+        Args:
+            length: The word length, or None to get every word.
+
+        Returns:
+            Every word along with its frequency.
+        """
+
+    @abstractmethod
+    def get_words_revision(self) -> int:
+
+        """
+        Get the revision of the dictionary, which changes whenever words are added or updated.
+
+        Returns:
+            The dictionary revision.
+        """
+
+    @abstractmethod
+    def get_word_lengths(self) -> List[int]:
+
+        """
+        Get the lengths of the dictionary words.
+
+        Returns:
+            The word lengths, in ascending order.
+        """
+
+    @abstractmethod
+    def add_words(
+        self,
+        words: Iterable[Tuple[str, float]],
+        chunk_size: int = 1000,
+        progress: Optional[Callable[[int], None]] = None,
+    ) -> int:
+
+        """
+        Add the given words to the dictionary, or update their frequency if they already exist.
+
+        Args:
+            words: The words to add, already normalized, along with their frequency.
+            chunk_size: The number of words added at once.
+            progress: An optional callback, called after every chunk with the number of words added so far.
+
+        Returns:
+            The number of words added.
+        """
+
+    @abstractmethod
+    def set_difficulties(self, difficulties: Iterable[Tuple[str, int]]) -> None:
+
+        """
+        Rate the difficulty of the given words.
+
+        Args:
+            difficulties: Every word along with its difficulty.
+        """
+
+    @abstractmethod
+    def get_seed_candidates(
+        self,
+        length: int,
+        limit: int,
+        difficulty: Optional[Tuple[int, int]] = None,
+    ) -> List[str]:
+
+        """
+        Get the words with the given length which haven't been played yet, the most frequent first.
+
+        Args:
+            length: The word length.
+            limit: The most words returned.
+            difficulty: An optional band of difficulty, given as its lowest and highest values. Just the rated words
+                within it are returned, the easiest and then the most frequent first.
+
+        Returns:
+            The candidate words.
+        """
+
+    @abstractmethod
+    def get_word_by_date(self, date: str, length: int) -> Optional[str]:
+
+        """
+        Get the word of the games of the given date and word length.
+
+        Args:
+            date: The date, given in YYYYMMDD format.
+            length: The word length.
+
+        Returns:
+            The word, or None if there are no games that date.
+        """
+
+    @abstractmethod
+    def get_game(self, player_id: str, date: str, length: int) -> Optional[Game]:
+
+        """
+        Get the game of a player in the given date, along with its attempts.
+
+        Args:
+            player_id: The player id.
+            date: The date, given in YYYYMMDD format.
+            length: The word length.
+
+        Returns:
+            An instance of `Game`, or None if the player had no game that date.
+        """
+
+    @abstractmethod
+    def create_game(
+        self,
+        player_id: str,
+        date: str,
+        word: str,
+        max_attempts: int = MAX_ATTEMPTS,
+        hard: bool = False,
+    ) -> Game:
+
+        """
+        Create the game of a player in the given date, unless it already exists.
+
+        Args:
+            player_id: The player id.
+            date: The date, given in YYYYMMDD format.
+            word: The seed word, whose length is the word length of the game.
+            max_attempts: The number of attempts of the game.
+            hard: Whether the game is played in hard mode.
+
+        Returns:
+            An instance of `Game`, either the new one or the existing one, along with its attempts.
+        """
+
+    @abstractmethod
+    def add_attempt(self, game: Game, word: str, match: bool, pattern: int, finished: bool) -> int:
+
+        """
+        Add an attempt to a game.
+
+        Args:
+            game: The game the attempt belongs to, along with its previous attempts.
+            word: The word given by the player.
+            match: Whether the word is the seed word.
+            pattern: The packed pattern of the attempt.
+            finished: Whether the attempt finishes the game, so it has to be recorded in the statistics.
+
+        Returns:
+            The id of the new attempt.
+
+        Raises:
+            DatabaseError: if the attempt could not be added.
+        """
+
+    @abstractmethod
+    def get_stats(self, player_id: str) -> Stats:
+
+        """
+        Get the lifetime statistics of a player, as recorded when their games finished.
+
+        Args:
+            player_id: The player id.
+
+        Returns:
+            An instance of `Stats`, which the caller is free to change.
+        """
+
+    @abstractmethod
+    def get_games(self) -> Iterator[Game]:
+
+        """
+        Get the whole game history, streaming it.
+
+        Yields:
+            Every game along with its attempts, ordered by player and date.
+        """
+
+    @abstractmethod
+    def add_games(self, games: Iterable[Game]) -> List[Game]:
+
+        """
+        Add the given games along with their attempts, in a single transaction, skipping the ones already existing for
+        the same player, date and word length.
+
+        The statistics are left as they are, so `rebuild_stats` has to be called once every game is added.
+
+        Args:
+            games: The games to add, whose ids are ignored.
+
+        Returns:
+            The games added, along with their new ids.
+        """
+
+    @abstractmethod
+    def rebuild_stats(self) -> None:
+
+        """
+        Rebuild the statistics of every player from the whole game history.
+        """
+
+
+@lru_cache(maxsize=SCORE_CACHE_SIZE)
+def _score_stored_attempt(seed: str, word: str) -> int:
+
+    """
+    Score an attempt stored before attempts kept their pattern, memoizing the result.
+
+    Args:
+        seed: The seed word, which the player tries to guess.
+        word: The word given by the player.
+
+    Returns:
+        The packed pattern of the attempt.
+    """
+
+    return score(normalize(seed), normalize(word))
+
+
+def _hydrate_game(rows: List[sqlite3.Row]) -> Optional[Game]:
+
+    """
+    Build a game, along with its attempts, from the rows of a joined games/attempts query.
+
+    Args:
+        rows: The rows retrieved from the database, ordered by attempt.
+
+    Returns:
+        An instance of `Game`, or None if there are no rows.
+    """
+
+    if not rows:
+        return None
+
+    game = rows[0]
+
+    return Game(
+        game["id"],
+        game["word"],
+        game["date"],
+        [
+            Attempt(
+                row["attempt_id"],
+                row["attempt_word"],
+                bool(row["attempt_match"]),
+                pattern=row["attempt_pattern"]
+                if row["attempt_pattern"] is not None
+                else _score_stored_attempt(game["word"], row["attempt_word"]),
+            )
+            for row in rows
+            if row["attempt_id"] is not None
+        ],
+        max_attempts=game["max_attempts"],
+        player_id=game["player_id"],
+        hard=bool(game["hard"]),
+    )
+
+
+class SQLiteStorage(Storage):
+
+    """
+    The storage of the SQLite database in `PALABROS_DB_PATH`.
+
+    Every thread works through its own long-lived connection, and attempts go through the write-behind queue, which
+    groups the attempts of concurrent players in a single transaction.
+    """
+
+    def init(self, progress: Optional[Callable[[int, int], None]] = None) -> None:
+
+        """
+        Create the database, or apply its pending migrations. See `Storage.init`.
+        """
+
+        database.init(progress)
+
+    def close(self) -> None:
+
+        """
+        Write the attempts still queued, and close every connection.
+        """
+
+        writer.close()
+        database.close()
+
+    @contextmanager
+    def transaction(self) -> Generator[None, None, None]:
+
+        """
+        Run the operations within the block in a single transaction, committed on exit or rolled back if any error is
+        raised. See `Storage.transaction`.
+
+        Every statement of the current thread runs through the same connection, and so within the transaction.
+        """
+
+        with database.db_transaction():
+            yield
+
+    def get_versions(self) -> Set[str]:
+
+        """
+        Get the versions recorded in the `versions` table. See `Storage.get_versions`.
+        """
+
+        from palabros import migrations
+
+        with database.db_cursor() as cur:
+            return migrations.get_applied(cur)
+
+    def get_words(self, length: Optional[int] = None) -> List[Tuple[str, float]]:
+
+        """
+        Get the dictionary words, through the `words.length` index when a length is given. See `Storage.get_words`.
+        """
+
+        with database.db_cursor() as cur:
+            if length is None:
+                cur.execute(Query.GetWords)
+            else:
+                cur.execute(Query.GetWordsByLength, (length,))
+            return [(row["word"], row["frequency"]) for row in cur.fetchall()]
+
+    def get_words_revision(self) -> int:
+
+        """
+        Get the dictionary revision from the `words_revision` table, shared by every process using the database. See
+        `Storage.get_words_revision`.
+        """
+
+        with database.db_cursor() as cur:
+            cur.execute(Query.GetWordsRevision)
+            row = cur.fetchone()
+            return row["revision"] if row is not None else 0
+
+    def get_word_lengths(self) -> List[int]:
+
+        """
+        Get the lengths of the dictionary words. See `Storage.get_word_lengths`.
+        """
+
+        with database.db_cursor() as cur:
+            cur.execute(Query.GetWordLengths)
+            return [row["length"] for row in cur.fetchall()]
+
+    def add_words(
+        self,
+        words: Iterable[Tuple[str, float]],
+        chunk_size: int = 1000,
+        progress: Optional[Callable[[int], None]] = None,
+    ) -> int:
+
+        """
+        Upsert the given words, a transaction per chunk bumping the dictionary revision. See `Storage.add_words`.
+        """
+
+        return database.populate_words(words, chunk_size, progress)
+
+    def set_difficulties(self, difficulties: Iterable[Tuple[str, int]]) -> None:
+
+        """
+        Rate the difficulty of the given words in a single transaction. See `Storage.set_difficulties`.
+        """
+
+        with database.db_transaction() as cur:
+            cur.executemany(Query.UpdateWordDifficulty, ((value, word) for word, value in difficulties))
+
+    def get_seed_candidates(
+        self,
+        length: int,
+        limit: int,
+        difficulty: Optional[Tuple[int, int]] = None,
+    ) -> List[str]:
+
+        """
+        Get the words not played yet, walking the `words` indexes. See `Storage.get_seed_candidates`.
+        """
+
+        with database.db_cursor() as cur:
+            if difficulty is None:
+                cur.execute(Query.GetSeedCandidates, (length, limit))
+            else:
+                cur.execute(Query.GetSeedCandidatesByDifficulty, (length, *difficulty, limit))
+            return [row["word"] for row in cur.fetchall()]
+
+    def get_word_by_date(self, date: str, length: int) -> Optional[str]:
+
+        """
+        Get the word of the games of a date. See `Storage.get_word_by_date`.
+        """
+
+        with database.db_cursor() as cur:
+            cur.execute(Query.GetWordByDate, (date, length))
+            row = cur.fetchone()
+            return row["word"] if row is not None else None
+
+    def get_game(self, player_id: str, date: str, length: int) -> Optional[Game]:
+
+        """
+        Get a game along with its attempts, in a single query. See `Storage.get_game`.
+        """
+
+        with database.db_cursor() as cur:
+            cur.execute(Query.GetGameWithAttemptsByDate, (player_id, date, length))
+            return _hydrate_game(cur.fetchall())
+
+    def create_game(
+        self,
+        player_id: str,
+        date: str,
+        word: str,
+        max_attempts: int = MAX_ATTEMPTS,
+        hard: bool = False,
+    ) -> Game:
+
+        """
+        Create a game unless it already exists, and read it back. See `Storage.create_game`.
+        """
+
+        with database.db_cursor() as cur:
+            cur.execute(Query.CreateGameIfNotExists, (player_id, word, date, max_attempts, hard))
+            cur.execute(Query.GetGameWithAttemptsByDate, (player_id, date, len(word)))
+            game = _hydrate_game(cur.fetchall())
+
+        assert game is not None
+        return game
+
+    def add_attempt(self, game: Game, word: str, match: bool, pattern: int, finished: bool) -> int:
+
+        """
+        Add an attempt through the write-behind queue, waiting for it to be committed. See `Storage.add_attempt`.
+        """
+
+        return writer.get_writer().write(game, word, match, pattern, finished)
+
+    def get_stats(self, player_id: str) -> Stats:
+
+        """
+        Get the statistics of a player from the summary tables. See `Storage.get_stats`.
+        """
+
+        with database.db_cursor() as cur:
+            return stats.read(cur, player_id)
+
+    def get_games(self) -> Iterator[Game]:
+
+        """
+        Stream the game history through a single query, a game at a time. See `Storage.get_games`.
+        """
+
+        with database.db_cursor() as cur:
+            cur.execute(Query.GetGamesWithAttempts)
+            for _, rows in groupby(cur, key=lambda row: row["id"]):
+                game = _hydrate_game(list(rows))
+                assert game is not None
+                yield game
+
+    def add_games(self, games: Iterable[Game]) -> List[Game]:
+
+        """
+        Add the games which don't exist yet, along with their attempts. See `Storage.add_games`.
+        """
+
+        added = []
+
+        with database.db_transaction() as cur:
+            for game in games:
+                cur.execute(
+                    Query.CreateGameIfNotExists, (game.player_id, game.word, game.date, game.max_attempts, game.hard)
+                )
+                if not cur.rowcount:
+                    continue
+                cur.executemany(
+                    Query.CreateAttempt,
+                    ((cur.lastrowid, attempt.word, attempt.match, attempt.pattern) for attempt in game.attempts),
+                )
+                added.append(replace(game, id=cur.lastrowid))
+
+        return added
+
+    def rebuild_stats(self) -> None:
+
+        """
+        Rebuild the summary tables, streaming the game history. See `Storage.rebuild_stats`.
+        """
+
+        with database.db_transaction() as cur:
+            stats.rebuild(cur)
+
+
+_storages: Dict[Tuple[str, str], Storage] = {}
+_storages_lock = threading.Lock()
+
+
+def get_backend() -> str:
+
+    """
+    Get the storage backend in use.
+
+    Returns:
+        The backend set in the `PALABROS_STORAGE` environment variable. When it's not set, the in-memory backend is
+        used if `PALABROS_DB_PATH` is `:memory:`, and the SQLite one otherwise.
+
+    Raises:
+        DatabaseError: if the backend is unknown.
+    """
+
+    backend = os.getenv(ENV_VAR)
+
+    if backend is None:
+        return "memory" if database.get_db_path() == ":memory:" else "sqlite"
+
+    if backend not in BACKENDS:
+        raise DatabaseError(f"El almacenamiento tiene que ser uno de estos: [bold]{', '.join(BACKENDS)}[/]")
+
+    return backend
+
+
+def get_storage() -> Storage:
+
+    """
+    Get the storage in use, creating it the first time.
+
+    There's a single storage per backend and database path, so every in-memory storage lives as long as the process,
+    or until `close` is called.
+
+    Returns:
+        An instance of `Storage`.
+
+    Raises:
+        DatabaseError: if the backend is unknown.
+    """
+
+    key = (get_backend(), database.get_db_path())
+    storage = _storages.get(key)
+
+    if storage is None:
+        with _storages_lock:
+            storage = _storages.get(key)
+            if storage is None:
+                if key[0] == "memory":
+                    # Imported here, since it's not needed unless it's chosen
+                    from palabros.memory import MemoryStorage
+
+                    storage = MemoryStorage()
+                else:
+                    storage = SQLiteStorage()
+                _storages[key] = storage
+
+    return storage
+
+
+def init(progress: Optional[Callable[[int, int], None]] = None) -> None:
+
+    """
+    Set the storage in use up, creating it or bringing it up to date.
+
+    Args:
+        progress: An optional callback, called after every migration step with the number of steps run so far and
+            the total.
+    """
+
+    get_storage().init(progress)
+
+
+def close() -> None:
+
+    """
+    Close every storage, dropping the in-memory ones altogether.
+    """
+
+    with _storages_lock:
+        storages = list(_storages.values())
+        _storages.clear()
+
+    for storage in storages:
+        storage.close()
@@ -0,0 +1,191 @@
+import atexit
+import queue
+import sqlite3
+import threading
+from concurrent.futures import Future
+from typing import List, NamedTuple, Optional
+
+from palabros import profiling, stats
+from palabros.database import db_transaction
+from palabros.errors import DatabaseError
+from palabros.queries import Query
+from palabros.schemas import Game
+
+# The most attempts written in a single transaction
+MAX_BATCH_SIZE = 256
+
+
+class _PendingAttempt(NamedTuple):
+
+    """
+    An attempt waiting to be written, along with the future receiving its id.
+    """
+
+    game: Game
+    word: str
+    match: bool
+    pattern: int
+    finished: bool
+    future: "Future[int]"
+
+
+class AttemptWriter:
+
+    """
+    A write-behind queue for attempts, which coalesces concurrent inserts into grouped transactions.
+
+    A single thread writes every attempt queued while the previous transaction was running in one transaction, so
+    concurrent players don't take turns on the database write lock for every attempt. Every attempt runs in its own
+    savepoint, so a failing one doesn't take the rest of its group down with it.
+    """
+
+    def __init__(self, max_batch_size: int = MAX_BATCH_SIZE) -> None:
+
+        """
+        Class constructor.
+
+        Args:
+            max_batch_size: The most attempts written in a single transaction.
+        """
+
+        self._max_batch_size = max_batch_size
+        self._queue: "queue.Queue[Optional[_PendingAttempt]]" = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="palabros-writer", daemon=True)
+        self._thread.start()
+
+    def write(self, game: Game, word: str, match: bool, pattern: int, finished: bool) -> int:
+
+        """
+        Write a new attempt, waiting for it to be committed.
+
+        Args:
+            game: The game the attempt belongs to.
+            word: The word given by the player.
+            match: Whether the word is the seed word.
+            pattern: The packed pattern of the attempt.
+            finished: Whether the attempt finishes the game, so it has to be recorded in the statistics.
+
+        Returns:
+            The id of the new attempt.
+
+        Raises:
+            DatabaseError: if the attempt could not be written.
+        """
+
+        future: "Future[int]" = Future()
+        self._queue.put(_PendingAttempt(game, word, match, pattern, finished, future))
+        return future.result()
+
+    def _run(self) -> None:
+
+        """
+        Write the queued attempts, a group per transaction, until the writer is closed.
+        """
+
+        while True:
+            pending = self._queue.get()
+            if pending is None:
+                return
+
+            batch = [pending]
+            while len(batch) < self._max_batch_size:
+                try:
+                    pending = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if pending is None:
+                    self._write(batch)
+                    return
+                batch.append(pending)
+
+            self._write(batch)
+
+    @staticmethod
+    @profiling.timed("call")
+    def _write(batch: List[_PendingAttempt]) -> None:
+
+        """
+        Write a group of attempts in a single transaction, and resolve their futures once it's committed.
+
+        Args:
+            batch: The attempts to write.
+        """
+
+        results = []
+
+        try:
+            with db_transaction() as cur:
+                for pending in batch:
+                    cur.execute(Query.Savepoint)
+                    try:
+                        game = pending.game
+                        cur.execute(Query.CreateAttempt, (game.id, pending.word, pending.match, pending.pattern))
+                        attempt_id = cur.lastrowid
+                        if pending.finished:
+                            stats.record(cur, game.date, pending.match, len(game.attempts) + 1, game.player_id)
+                    except sqlite3.DatabaseError as err:
+                        cur.execute(Query.RollbackToSavepoint)
+                        results.append(DatabaseError(str(err)))
+                    else:
+                        results.append(attempt_id)
+                    cur.execute(Query.ReleaseSavepoint)
+        except Exception as err:
+            for pending in batch:
+                pending.future.set_exception(err)
+            return
+
+        for pending, result in zip(batch, results):
+            if isinstance(result, Exception):
+                pending.future.set_exception(result)
+            else:
+                pending.future.set_result(result)
+
+    def close(self) -> None:
+
+        """
+        Write the attempts still queued and stop the writer thread.
+        """
+
+        self._queue.put(None)
+        self._thread.join()
+
+
+_writer: Optional[AttemptWriter] = None
+_writer_lock = threading.Lock()
+
+
+def get_writer() -> AttemptWriter:
+
+    """
+    Get the attempt writer, starting it the first time.
+
+    Returns:
+        An instance of `AttemptWriter`.
+    """
+
+    global _writer
+
+    if _writer is None:
+        with _writer_lock:
+            if _writer is None:
+                _writer = AttemptWriter()
+
+    return _writer
+
+
+def close() -> None:
+
+    """
+    Stop the attempt writer, if it was started, after writing the attempts still queued.
+    """
+
+    global _writer
+
+    with _writer_lock:
+        writer, _writer = _writer, None
+
+    if writer is not None:
+        writer.close()
+
+
+atexit.register(close)
@@ -1,12 +1,14 @@
 import random
+from datetime import datetime, timedelta
 
 import pytest
 
-from palabros import business
+from palabros import business, dictionary, storage
 from palabros.database import db_cursor
 from palabros.errors import DatabaseError, GameError
 from palabros.queries import Query
-from palabros.schemas import CharInspection
+from palabros.schemas import DEFAULT_PLAYER, CharInspection
+from palabros.storage import get_storage
 from tests.base import WORDS, BaseTestCase
 
 
@@ -14,28 +16,52 @@ from tests.base import WORDS, BaseTestCase
 class BusinessTestCase(BaseTestCase):
 
     """
-    Test case for the `palabros.business` module.
+    Test case for the `palabros.business` module, against the SQLite storage.
     """
 
-    def test_normalize_word(self) -> None:
-        text = "ánfora murciélago níscalo camión baúl zarigüeya"
-        expected = "anfora murcielago niscalo camion baul zarigueya"
-        self.assertNotEqual(text, business._normalize_word(text))
-        self.assertEqual(expected, business._normalize_word(text))
+    backend = "sqlite"
 
     def test_get_random_word__no_word_found(self) -> None:
-        with db_cursor() as cur:
-            cur.execute("DELETE FROM words;")
+        # Every word was already played
+        for i, word in enumerate(WORDS):
+            get_storage().create_game(DEFAULT_PLAYER, f"2022021{i}", word)
         self.assertRaises(DatabaseError, business._get_random_word)
 
     def test_get_random_word(self) -> None:
         word = WORDS[random.randint(0, len(WORDS) - 1)]
         words = [w for w in WORDS if w != word]
-        with db_cursor() as cur:
-            cur.execute(Query.CreateGame, (word, ""))
+        get_storage().create_game(DEFAULT_PLAYER, "20220214", word)
         result = business._get_random_word()
         self.assertIn(result, words)
 
+    def test_get_random_word__seeded(self) -> None:
+        result = business._get_random_word("20220214")
+        self.assertIn(result, WORDS)
+        for _ in range(10):
+            self.assertEqual(result, business._get_random_word("20220214"))
+
+    def test_get_random_word__difficulty(self) -> None:
+        get_storage().set_difficulties((word, i + 1) for i, word in enumerate(WORDS))
+        get_storage().create_game(DEFAULT_PLAYER, "20220214", WORDS[1])
+        if self.backend == "sqlite":
+            with db_cursor() as cur:
+                cur.execute("EXPLAIN QUERY PLAN " + Query.GetSeedCandidatesByDifficulty, (5, 2, 4, 50))
+                plan = " ".join(row["detail"] for row in cur.fetchall())
+            self.assertIn("idx_words_length_difficulty", plan)
+            self.assertNotIn("TEMP B-TREE", plan)
+        for _ in range(10):
+            self.assertIn(business._get_random_word(difficulty=(2, 4)), WORDS[2:4])
+        self.assertRaises(DatabaseError, business._get_random_word, difficulty=(2, 2))
+        self.assertRaises(DatabaseError, business._get_random_word, length=6, difficulty=(1, 5))
+        game = business.get_current_game(seeded=True, difficulty=(5, 5))
+        self.assertEqual(WORDS[4], game.word)
+
+    def test_parse_difficulty(self) -> None:
+        self.assertEqual((4, 4), business.parse_difficulty("4"))
+        self.assertEqual((3, 5), business.parse_difficulty("3-5"))
+        for text in ("", "x", "0", "5-3", "-5", "3-x"):
+            self.assertRaises(GameError, business.parse_difficulty, text)
+
     def test_inspect_attempt__wrong_seed_word_length(self) -> None:
         self.assertRaises(
             GameError,
@@ -104,3 +130,154 @@ class BusinessTestCase(BaseTestCase):
         word = "movil"
         result = business.word_exists(word)
         self.assertFalse(result)
+
+        self.assertTrue(business.word_exists("LÉCHE"))
+        business.check_word("MUNDO")
+
+    def test_get_current_game__new_game(self) -> None:
+        game = business.get_current_game()
+        self.assertIn(game.word, WORDS)
+        self.assertEqual(game.attempts, [])
+        self.assertEqual(game, business.get_current_game())
+
+    def test_get_current_game__ongoing_game(self) -> None:
+        game = business.get_current_game()
+        first = business.play_game(game, "leche")
+        second = business.play_game(game, game.word)
+        result = business.get_current_game()
+        self.assertEqual(game.id, result.id)
+        self.assertEqual([first, second], result.attempts)
+        self.assertTrue(result.any_match())
+
+    def test_get_candidates(self) -> None:
+        game = business.get_current_game()
+        self.assertEqual(sorted(WORDS), sorted(business.get_candidates(game)))
+        game.attempts.append(business.play_game(game, game.word))
+        self.assertEqual([game.word], business.get_candidates(game))
+
+    def test_suggest_guesses(self) -> None:
+        game = business.get_current_game()
+        result = business.suggest_guesses(game, limit=2)
+        self.assertEqual(2, len(result))
+        for suggestion in result:
+            self.assertIn(suggestion.word, WORDS)
+        game.attempts.append(business.play_game(game, game.word))
+        result = business.suggest_guesses(game)
+        self.assertEqual([game.word], [suggestion.word for suggestion in result])
+        self.assertTrue(result[0].candidate)
+
+    def test_hard_mode(self) -> None:
+        today = datetime.now().strftime("%Y%m%d")
+        get_storage().create_game("bob", today, "leche", 6, True)
+        game = business.get_current_game(player_id="bob")
+        self.assertTrue(game.hard)
+        self.assertEqual(len(WORDS), len(business.suggest_guesses(game, limit=10)))
+        game.attempts.append(business.play_game(game, "coche"))
+        # H and E are valid, and C is missplaced
+        for word in ("mundo", "huevo"):
+            self.assertRaises(GameError, business.play_game, game, word)
+        self.assertEqual(1, len(business.get_current_game(player_id="bob").attempts))
+        result = business.suggest_guesses(game, limit=10)
+        self.assertTrue(all(word in ("coche", "leche") for word in (suggestion.word for suggestion in result)))
+        self.assertTrue(business.play_game(game, "LECHE").match)
+        # The mode is kept by an ongoing game, and chosen by a new one
+        self.assertTrue(business.get_current_game(player_id="bob", hard=False).hard)
+        self.assertFalse(business.get_current_game(player_id="alice").hard)
+        self.assertTrue(business.get_current_game(player_id="carol", hard=True).hard)
+
+    def test_get_game(self) -> None:
+        self.assertIsNone(business.get_game("20220214"))
+        game = business.get_current_game()
+        self.assertEqual(game, business.get_game(game.date))
+
+    def test_get_stats(self) -> None:
+        self.assertEqual(0, business.get_stats().played)
+        game = business.get_current_game()
+        business.play_game(game, game.word)
+        result = business.get_stats()
+        self.assertEqual(1, result.played)
+        self.assertEqual(1, result.won)
+        self.assertEqual(1, result.current_streak)
+        self.assertEqual({1: 1}, result.distribution)
+
+    def test_get_stats__variants(self) -> None:
+        # The games of every word length on the same date keep the streak started the day before
+        get_storage().add_words([("perros", 1.0), ("gatito", 0.5)])
+        dictionary.invalidate()
+        yesterday = (datetime.now() - timedelta(days=1)).strftime("%Y%m%d")
+        game = get_storage().create_game(DEFAULT_PLAYER, yesterday, "mayor")
+        business.play_game(game, game.word)
+        for length, max_attempts in ((5, 6), (6, 8)):
+            game = business.get_current_game(length=length, max_attempts=max_attempts)
+            business.play_game(game, game.word)
+        result = business.get_stats()
+        self.assertEqual(3, result.won)
+        self.assertEqual(2, result.current_streak)
+        self.assertEqual(2, result.max_streak)
+        self.assertEqual({1: 3}, result.distribution)
+
+    def test_get_current_game__per_player(self) -> None:
+        game = business.get_current_game()
+        other = business.get_current_game(player_id="alice")
+        self.assertNotEqual(game.id, other.id)
+        self.assertEqual(game.word, other.word)
+        self.assertEqual("alice", other.player_id)
+        business.play_game(other, other.word)
+        self.assertEqual([], business.get_current_game().attempts)
+        self.assertEqual(0, business.get_stats().played)
+        self.assertEqual(1, business.get_stats("alice").won)
+
+    def test_get_game__stored_patterns(self) -> None:
+        if self.backend != "sqlite":
+            self.skipTest("Just SQLite databases have attempts stored before patterns were")
+        game = business.get_current_game()
+        attempt = business.play_game(game, "leche")
+        with db_cursor() as cur:
+            cur.execute("SELECT pattern FROM attempts WHERE id = ?;", (attempt.id,))
+            self.assertEqual(attempt.pattern, cur.fetchone()["pattern"])
+            # An attempt stored before patterns were is scored when loaded
+            cur.execute("UPDATE attempts SET pattern = NULL;")
+        storage._score_stored_attempt.cache_clear()
+        self.assertEqual([attempt], business.get_game(game.date).attempts)
+        self.assertEqual([attempt], business.get_game(game.date).attempts)
+        self.assertEqual(1, storage._score_stored_attempt.cache_info().hits)
+
+    def test_get_current_game__variant(self) -> None:
+        get_storage().add_words([("perros", 1.0), ("gatito", 0.5)])
+        dictionary.invalidate()
+        game = business.get_current_game(length=6, max_attempts=8)
+        self.assertIn(game.word, ["perros", "gatito"])
+        self.assertEqual(8, game.get_attempts_left())
+        self.assertNotEqual(game.id, business.get_current_game().id)
+        self.assertRaises(GameError, business.check_word, "leche", 6)
+        business.check_word("gatito", 6)
+        attempt = business.play_game(game, game.word)
+        self.assertTrue(attempt.match)
+        result = business.get_current_game(length=6)
+        self.assertEqual(8, result.max_attempts)
+        self.assertEqual([attempt], result.attempts)
+        self.assertEqual([game.word], business.get_candidates(result))
+
+    def test_check_variant(self) -> None:
+        business.check_variant(5, 1)
+        business.check_variant(5, 10)
+        # Lengths within bounds can be played just once their words are loaded
+        self.assertRaises(GameError, business.check_variant, 8)
+        self.assertRaises(GameError, business.get_current_game, length=4)
+        get_storage().add_words([("casa", 1.0)])
+        dictionary.invalidate()
+        business.check_variant(4, 1)
+        self.assertRaises(GameError, business.check_variant, 3)
+        self.assertRaises(GameError, business.check_variant, 9)
+        self.assertRaises(GameError, business.check_variant, 5, 0)
+        self.assertRaises(GameError, business.check_variant, 5, 11)
+        self.assertRaises(GameError, business.get_current_game, length=9)
+
+
+class MemoryBusinessTestCase(BusinessTestCase):
+
+    """
+    Test case for the `palabros.business` module, against the in-memory storage.
+    """
+
+    backend = "memory"
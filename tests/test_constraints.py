@@ -0,0 +1,63 @@
+from itertools import product
+
+from palabros import constraints
+from palabros.constraints import Violation
+from palabros.schemas import Attempt
+from palabros.scoring import score
+from tests.base import WORDS, BaseTestCase
+
+# The test dictionary, along with some words repeating letters
+DICTIONARY = WORDS + ["cocer", "lecho", "huele", "mamut"]
+
+
+def _compile(seed: str, *guesses: str) -> constraints.Constraints:
+    return constraints.from_attempts(
+        [Attempt(i, guess, False, pattern=score(seed, guess)) for i, guess in enumerate(guesses)], 5
+    )
+
+
+class ConstraintsTestCase(BaseTestCase):
+
+    """
+    Test case for the `palabros.constraints` module.
+    """
+
+    def test_from_attempts(self) -> None:
+        # C is missplaced, its second occurrence and O are absent, and H and E are valid
+        result = _compile("leche", "coche")
+        self.assertEqual((None, None, None, "h", "e"), result.fixed)
+        self.assertEqual((("c", 1), ("e", 1), ("h", 1)), result.min_counts)
+        self.assertEqual((("c", 1), ("o", 0)), result.max_counts)
+        self.assertEqual(("o",), result.excluded)
+        self.assertTrue(result.matches("leche"))
+        self.assertFalse(result.matches("coche"))
+        self.assertFalse(result.matches("lecho"))
+
+    def test_find_violation(self) -> None:
+        result = _compile("leche", "coche")
+        self.assertIsNone(result.find_violation("leche"))
+        self.assertIsNone(result.find_violation("coche"))
+        self.assertEqual(Violation("h", position=3), result.find_violation("mundo"))
+        self.assertEqual(Violation("c"), result.find_violation("huehe"))
+        result = _compile("cocer", "acaca")
+        self.assertEqual(Violation("c", count=2), result.find_violation("cobre"))
+
+    def test_filter_words(self) -> None:
+        # The compiled constraints keep exactly the words which would have got the same patterns
+        for seed, first, second in product(DICTIONARY, repeat=3):
+            result = _compile(seed, first, second)
+            expected = [
+                w
+                for w in DICTIONARY
+                if score(w, first) == score(seed, first) and score(w, second) == score(seed, second)
+            ]
+            self.assertEqual(expected, constraints.filter_words(DICTIONARY, result))
+            self.assertEqual(expected, [word for word in DICTIONARY if result.matches(word)])
+            hard = constraints.filter_words(DICTIONARY, result, hard=True)
+            self.assertEqual([word for word in DICTIONARY if result.find_violation(word) is None], hard)
+            self.assertTrue(set(expected).issubset(hard))
+
+    def test_filter_words__no_attempts(self) -> None:
+        result = constraints.from_attempts([], 5)
+        self.assertEqual(DICTIONARY, constraints.filter_words(DICTIONARY + ["mesa"], result))
+        self.assertEqual(DICTIONARY, constraints.filter_words(DICTIONARY + ["mesa"], result, hard=True))
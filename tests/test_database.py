@@ -0,0 +1,101 @@
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from palabros import database
+from palabros.database import db_cursor
+from palabros.errors import DatabaseError
+from tests.base import WORDS, BaseTestCase
+
+
+@pytest.mark.usefixtures("init_database")
+class DatabaseTestCase(BaseTestCase):
+
+    """
+    Test case for the `palabros.database` module.
+    """
+
+    def test_get_connection__reused(self) -> None:
+        conn = database.get_connection()
+        self.assertIs(conn, database.get_connection())
+        with db_cursor() as cur:
+            self.assertIs(conn, cur.connection)
+
+    def test_get_connection__per_thread(self) -> None:
+        conns = []
+        thread = threading.Thread(target=lambda: conns.append(database.get_connection()))
+        thread.start()
+        thread.join()
+        self.assertIsNot(database.get_connection(), conns[0])
+
+    def test_close(self) -> None:
+        conn = database.get_connection()
+        with db_cursor() as cur:
+            cur.execute("SELECT COUNT(*) AS total FROM words;")
+            self.assertEqual(len(WORDS), cur.fetchone()["total"])
+        database.close()
+        self.assertIsNot(conn, database.get_connection())
+
+    def test_read_words(self) -> None:
+        words = {"coche": 1.5, "o'xyz": 2, "caña": 3.25}
+        with tempfile.TemporaryDirectory() as path:
+            file = Path(path).joinpath("words.json")
+            file.write_text(json.dumps(words, indent=4), encoding="utf-8")
+            for buffer_size in (1, 3, 1024):
+                result = list(database.read_words(file, buffer_size=buffer_size))
+                self.assertEqual([(k, float(v)) for k, v in words.items()], result)
+
+    def test_read_words__wrong_format(self) -> None:
+        with tempfile.TemporaryDirectory() as path:
+            file = Path(path).joinpath("words.json")
+            for content in [
+                '{"coche": [1]}',
+                '{"coche": true}',
+                '{"coche": 1',
+                '{"coche": 1,',
+                '{"coche" 1}',
+                '{"coche": 1 "leche": 2}',
+                '{"coche": 1,}',
+                '{"coche": 1} {}',
+                "[1, 2]",
+                '"coche": 1}',
+                "",
+            ]:
+                file.write_text(content, encoding="utf-8")
+                for buffer_size in (1, 1024):
+                    with self.subTest(content=content, buffer_size=buffer_size):
+                        self.assertRaises(DatabaseError, list, database.read_words(file, buffer_size=buffer_size))
+            file.write_text(" {} ", encoding="utf-8")
+            self.assertEqual([], list(database.read_words(file)))
+
+    def test_populate_words(self) -> None:
+        progress = []
+        words = [(WORDS[0], 100.0), ("o'xyz", 0.5), ("nuevo", 1.0)]
+        total = database.populate_words(words, chunk_size=2, progress=progress.append)
+        self.assertEqual(3, total)
+        self.assertEqual([2, 3], progress)
+        with db_cursor() as cur:
+            cur.execute("SELECT word, frequency FROM words;")
+            result = {row["word"]: row["frequency"] for row in cur.fetchall()}
+        self.assertEqual(len(WORDS) + 2, len(result))
+        for word, frequency in words:
+            self.assertEqual(frequency, result[word])
+
+    def test_init(self) -> None:
+        with tempfile.TemporaryDirectory() as path:
+            db_path = Path(path).joinpath("games.db")
+            with mock.patch.dict(os.environ, {"PALABROS_DB_PATH": str(db_path)}):
+                database.init()
+                self.assertTrue(db_path.exists())
+                self.assertTrue(Path(f"{db_path}.init").exists())
+                with mock.patch("palabros.migrations.migrate") as migrate:
+                    database.init()
+                    database._initialized.clear()
+                    database.init()
+                    migrate.assert_not_called()
+                database.close()
@@ -0,0 +1,93 @@
+import tempfile
+import threading
+from pathlib import Path
+
+import pytest
+
+from palabros import business, database, dictionary
+from palabros.database import db_cursor, populate_words
+from tests.base import WORDS, BaseTestCase
+
+
+@pytest.mark.usefixtures("init_database")
+class DictionaryTestCase(BaseTestCase):
+
+    """
+    Test case for the `palabros.dictionary` module.
+    """
+
+    def test_get_dictionary(self) -> None:
+        result = dictionary.get_dictionary()
+        self.assertEqual(len(WORDS), len(result))
+        self.assertEqual(tuple(reversed(WORDS)), result.words)
+        for word in WORDS:
+            self.assertIn(word, result)
+            self.assertEqual(word, result.words[result.index[word]])
+        self.assertNotIn("movil", result)
+
+    def test_get_dictionary__cached(self) -> None:
+        result = dictionary.get_dictionary()
+        with db_cursor() as cur:
+            cur.execute("DELETE FROM words;")
+        self.assertIs(result, dictionary.get_dictionary())
+
+    def test_invalidate(self) -> None:
+        result = dictionary.get_dictionary()
+        with db_cursor() as cur:
+            cur.execute("UPDATE words SET frequency = frequency + 1 WHERE word = ?;", (WORDS[0],))
+        dictionary.invalidate()
+        self.assertNotEqual(result.version, dictionary.get_dictionary().version)
+
+    def test_get_dictionary__revision(self) -> None:
+        result = dictionary.get_dictionary(6)
+        # Words loaded by another thread, through its own connection, as another process would
+        thread = threading.Thread(target=populate_words, args=([("perros", 1.0)],))
+        thread.start()
+        thread.join()
+        self.assertIs(result, dictionary.get_dictionary(6))
+        dictionary.refresh()
+        self.assertEqual(("perros",), dictionary.get_dictionary(6).words)
+        self.assertNotEqual(result.revision, dictionary.get_dictionary(6).revision)
+        self.assertIs(dictionary.get_dictionary(6), dictionary.get_dictionary(6))
+
+    def test_get_dictionary__partition(self) -> None:
+        populate_words([("perros", 1.0)])
+        dictionary.invalidate()
+        self.assertEqual(len(WORDS) + 1, len(dictionary.get_dictionary()))
+        self.assertEqual(tuple(reversed(WORDS)), dictionary.get_dictionary(5).words)
+        self.assertEqual(("perros",), dictionary.get_dictionary(6).words)
+        self.assertEqual(0, len(dictionary.get_dictionary(7)))
+        self.assertNotEqual(dictionary.get_dictionary(5).version, dictionary.get_dictionary().version)
+
+    def test_import_words__normalized(self) -> None:
+        with tempfile.TemporaryDirectory() as path:
+            file_path = Path(path).joinpath("words.json")
+            file_path.write_text('{"ÁRBOL": 1.0, "señal": 0.5}', encoding="utf-8")
+            self.assertEqual(2, dictionary.import_words(file_path))
+        self.assertIn("arbol", dictionary.get_dictionary(5))
+        self.assertIn("señal", dictionary.get_dictionary(5))
+        self.assertNotIn("ÁRBOL", dictionary.get_dictionary())
+
+    def test_word_exists__no_queries(self) -> None:
+        # Once loaded, checking words never hits the database, not even to check the revision
+        business.word_exists("coche")
+        statements = []
+        database.get_connection().set_trace_callback(statements.append)
+        try:
+            for word in WORDS * 10:
+                self.assertTrue(business.word_exists(word))
+            self.assertFalse(business.word_exists("movil"))
+        finally:
+            database.get_connection().set_trace_callback(None)
+        self.assertEqual([], statements)
+
+    def test_refresh__single_query(self) -> None:
+        result = dictionary.get_dictionary(5)
+        statements = []
+        database.get_connection().set_trace_callback(statements.append)
+        try:
+            dictionary.refresh()
+        finally:
+            database.get_connection().set_trace_callback(None)
+        self.assertEqual(1, len(statements))
+        self.assertIs(result, dictionary.get_dictionary(5))
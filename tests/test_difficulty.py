@@ -0,0 +1,33 @@
+import pytest
+
+from palabros import difficulty, simulation
+from palabros.database import db_cursor
+from palabros.errors import GameError
+from tests.base import WORDS, BaseTestCase
+
+
+@pytest.mark.usefixtures("init_database")
+class DifficultyTestCase(BaseTestCase):
+
+    """
+    Test case for the `palabros.difficulty` module.
+    """
+
+    def _get_difficulties(self) -> dict:
+        with db_cursor() as cur:
+            cur.execute("SELECT word, difficulty FROM words;")
+            return {row["word"]: row["difficulty"] for row in cur.fetchall()}
+
+    def test_rate_words(self) -> None:
+        self.assertEqual({word: None for word in WORDS}, self._get_difficulties())
+        progress = []
+        self.assertEqual([(5, len(WORDS))], difficulty.rate_words(workers=1, progress=progress.append))
+        self.assertEqual(len(WORDS), progress[-1])
+        expected = simulation.get_guesses(5, difficulty.REFERENCE_STRATEGY, workers=1)
+        self.assertEqual(expected, self._get_difficulties())
+        # The most frequent word is the first guess of the reference solver
+        self.assertEqual(1, expected[WORDS[-1]])
+
+    def test_rate_words__length(self) -> None:
+        self.assertEqual([(5, len(WORDS))], difficulty.rate_words(5, workers=2))
+        self.assertRaises(GameError, difficulty.rate_words, 6, workers=1)
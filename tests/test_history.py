@@ -0,0 +1,137 @@
+import io
+import os
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from palabros import business, history
+from palabros.history import HistoryGame
+from palabros.schemas import Stats
+from palabros.storage import get_storage
+from tests.base import BaseTestCase
+
+LINES = [
+    '{"player": "alice", "date": "20220201", "word": "leche", "attempts": ["coché", "leche"]}',
+    '{"player": "alice", "date": "20220202", "word": "mundo", "attempts": ["mayor"]}',
+    '{"date": "20220201", "word": "huevo", "attempts": ["mundo", "mayor", "coche", "leche", "mundo", "mayor"]}',
+    "",
+    "not json",
+    '{"player": "alice", "date": "20220203", "word": "leche", "attempts": ["perro"]}',
+    '{"player": "alice", "date": "20220204", "word": "leche", "attempts": ["leche", "mundo"]}',
+    '{"player": "alice", "date": "2022-02-05", "word": "leche", "attempts": []}',
+]
+
+
+@pytest.mark.usefixtures("init_database")
+class HistoryTestCase(BaseTestCase):
+
+    """
+    Test case for the `palabros.history` module, against the SQLite storage.
+    """
+
+    backend = "sqlite"
+
+    def _import(self, chunk_size: int = 2) -> history.ImportReport:
+        return history.import_games(history.read_games(io.StringIO("\n".join(LINES))), chunk_size=chunk_size)
+
+    def test_read_games(self) -> None:
+        games = list(history.read_games(io.StringIO("\n".join(LINES))))
+        self.assertEqual(7, len(games))
+        self.assertEqual(HistoryGame("alice", "20220201", "leche", ("coché", "leche")), games[0])
+        self.assertEqual("", games[2].player_id)
+        self.assertIsNone(games[3])
+        self.assertIsNone(games[6])
+
+    def test_import_games(self) -> None:
+        progress = []
+        report = history.import_games(
+            history.read_games(io.StringIO("\n".join(LINES))), chunk_size=2, progress=progress.append
+        )
+        self.assertEqual((3, 9, 0, 4), report[:4])
+        self.assertEqual([2, 4, 6, 7], progress)
+
+        game = business.get_game("20220201", "alice")
+        self.assertEqual(["coché", "leche"], [attempt.word for attempt in game.attempts])
+        self.assertEqual([False, True], [attempt.match for attempt in game.attempts])
+        self.assertEqual("COCHE", "".join(char.char for char in game.attempts[0].chars))
+        self.assertEqual(business._inspect_attempt("leche", "coché"), game.attempts[0].chars)
+        self.assertIsNone(business.get_game("20220203", "alice"))
+
+        self.assertEqual(1, business.get_stats("alice").won)
+        self.assertEqual(Stats(1, 0, 0, 0, None, {}), business.get_stats())
+
+    def test_import_games__dictionary_per_length(self) -> None:
+        with mock.patch.object(history, "get_dictionary", wraps=history.get_dictionary) as get_dictionary:
+            self._import(chunk_size=100)
+        get_dictionary.assert_called_once_with(5)
+
+    def test_import_games__skip_existing(self) -> None:
+        self._import()
+        report = self._import(chunk_size=100)
+        self.assertEqual((0, 0, 3, 4), report[:4])
+        self.assertEqual(9, sum(len(game.attempts) for game in history.export_games()))
+
+    def test_export_games(self) -> None:
+        self._import()
+        self.assertEqual(
+            [
+                HistoryGame("", "20220201", "huevo", ("mundo", "mayor", "coche", "leche", "mundo", "mayor")),
+                HistoryGame("alice", "20220201", "leche", ("coché", "leche")),
+                HistoryGame("alice", "20220202", "mundo", ("mayor",)),
+            ],
+            list(history.export_games()),
+        )
+
+    def test_export_file(self) -> None:
+        self._import()
+        business.get_current_game(player_id="bob")
+        with tempfile.TemporaryDirectory() as path:
+            file_path = Path(os.path.join(path, "history.jsonl"))
+            self.assertEqual(4, history.export_file(file_path))
+            with open(file_path, encoding="utf-8") as f:
+                games = list(history.read_games(f))
+        self.assertEqual(list(history.export_games()), games)
+        self.assertEqual((), games[-1].attempts)
+
+    def test_import_games__normalized_seed(self) -> None:
+        lines = ['{"player": "bob", "date": "20220201", "word": "LECHE\u0301", "attempts": ["coche"]}']
+        self.assertEqual(1, history.import_games(history.read_games(io.StringIO("\n".join(lines)))).games)
+        game = business.get_game("20220201", "bob")
+        self.assertEqual("leche", game.word)
+        self.assertEqual(["leche"], [game.word for game in history.export_games()])
+
+    def test_import_games__hard(self) -> None:
+        lines = [
+            '{"player": "bob", "date": "20220201", "word": "leche", "attempts": ["coche", "leche"], "hard": true}',
+            '{"player": "bob", "date": "20220202", "word": "leche", "attempts": ["coche", "mundo"], "hard": true}',
+            '{"player": "bob", "date": "20220203", "word": "leche", "attempts": ["coche", "mundo"]}',
+            '{"player": "bob", "date": "20220204", "word": "leche", "attempts": [], "hard": "yes"}',
+        ]
+        report = history.import_games(history.read_games(io.StringIO("\n".join(lines))))
+        self.assertEqual((2, 4, 0, 2), report[:4])
+        self.assertTrue(business.get_game("20220201", "bob").hard)
+        self.assertFalse(business.get_game("20220203", "bob").hard)
+        self.assertEqual([True, False], [game.hard for game in history.export_games()])
+
+    def test_export_games__lengths(self) -> None:
+        # The attempts of the games of every word length played the same date are interleaved
+        self._import()
+        get_storage().add_words([("perros", 1.0), ("gatito", 0.5)])
+        business.play_game(business.get_current_game(player_id="alice"), "leche")
+        business.play_game(business.get_current_game(player_id="alice", length=6), "perros")
+        business.play_game(business.get_current_game(player_id="alice"), "huevo")
+        games = [game for game in history.export_games() if game.player_id == "alice"]
+        self.assertEqual(4, len(games))
+        self.assertEqual(("leche", "huevo"), games[2].attempts)
+        self.assertEqual(("perros",), games[3].attempts)
+
+
+class MemoryHistoryTestCase(HistoryTestCase):
+
+    """
+    Test case for the `palabros.history` module, against the in-memory storage.
+    """
+
+    backend = "memory"
@@ -0,0 +1,66 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+from tests.base import BaseTestCase
+
+
+class MainTestCase(BaseTestCase):
+
+    """
+    Test case for the `palabros.main` module.
+    """
+
+    def test_import(self) -> None:
+        with tempfile.TemporaryDirectory() as path:
+            db_path = os.path.join(path, "games.db")
+            result = subprocess.run(
+                [sys.executable, "-c", "import sys, palabros.main; print('rich' in sys.modules)"],
+                env={**os.environ, "PALABROS_DB_PATH": db_path},
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            self.assertEqual("False", result.stdout.strip())
+            self.assertFalse(os.path.exists(db_path))
+
+    def test_profile(self) -> None:
+        with tempfile.TemporaryDirectory() as path:
+            result = subprocess.run(
+                [sys.executable, "-m", "palabros.main", "--profile", "results", "20220214"],
+                env={**os.environ, "PALABROS_DB_PATH": os.path.join(path, "games.db"), "PALABROS_PROFILE": "json"},
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+        entries = [json.loads(line) for line in result.stderr.splitlines()]
+        names = {(entry["kind"], entry["name"]) for entry in entries}
+        self.assertIn(("query", "GetGameWithAttemptsByDate"), names)
+        self.assertIn(("call", "business.get_stats"), names)
+        self.assertIn(("connect", "database._connect"), names)
+
+    def test_simulate(self) -> None:
+        with tempfile.TemporaryDirectory() as path:
+            result = subprocess.run(
+                [sys.executable, "-m", "palabros.main", "simulate", "--limit", "50", "--workers", "2"],
+                env={**os.environ, "PALABROS_DB_PATH": os.path.join(path, "games.db")},
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+        self.assertIn("ha jugado 50 palabras con 2 procesos", result.stdout)
+
+    def test_storage_error(self) -> None:
+        # Errors setting the storage up are reported like any other, instead of as a traceback
+        with tempfile.TemporaryDirectory() as path:
+            env = {**os.environ, "PALABROS_DB_PATH": os.path.join(path, "games.db"), "PALABROS_STORAGE": "missing"}
+            history_path = os.path.join(path, "history.jsonl")
+            for args in (["export", history_path], ["import", history_path], ["play", "coche"], ["serve"]):
+                result = subprocess.run(
+                    [sys.executable, "-m", "palabros.main", *args], env=env, capture_output=True, text=True
+                )
+                self.assertEqual(0, result.returncode, args)
+                self.assertNotIn("Traceback", result.stderr)
+                self.assertIn("El almacenamiento tiene que ser uno de estos", result.stdout)
@@ -0,0 +1,147 @@
+import os
+import sqlite3
+import tempfile
+import threading
+from pathlib import Path
+from typing import Generator
+from unittest import mock
+
+import pytest
+
+from palabros import __version__, business, database, migrations
+from palabros.database import db_cursor
+from palabros.errors import DatabaseError
+from palabros.queries import Query
+from tests.base import BaseTestCase
+
+LEGACY_SCHEMA = """
+    CREATE TABLE versions (version TEXT PRIMARY KEY);
+    CREATE TABLE words (id INTEGER PRIMARY KEY AUTOINCREMENT, word TEXT NOT NULL UNIQUE, frequency REAL NOT NULL);
+    CREATE TABLE games (id INTEGER PRIMARY KEY AUTOINCREMENT, word TEXT NOT NULL, date TEXT NOT NULL);
+    CREATE TABLE attempts (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, game_id INTEGER NOT NULL, word TEXT NOT NULL, match INTEGER NOT NULL
+    );
+    CREATE UNIQUE INDEX idx_games_date ON games (date);
+    INSERT INTO versions VALUES ('0.0.5');
+    INSERT INTO words (word, frequency) VALUES ('coche', 1.0), ('leche', 0.5);
+    INSERT INTO games (word, date) VALUES ('coche', '20220214');
+    INSERT INTO attempts (game_id, word, match) VALUES (1, 'leche', 0), (1, 'coche', 1);
+"""
+
+
+class MigrationsTestCase(BaseTestCase):
+
+    """
+    Test case for the `palabros.migrations` module.
+    """
+
+    @pytest.fixture(autouse=True)
+    def temp_database(self) -> Generator[None, None, None]:
+        with tempfile.TemporaryDirectory() as path:
+            self.db_path = Path(path).joinpath("games.db")
+            with mock.patch.dict(os.environ, {"PALABROS_DB_PATH": str(self.db_path)}):
+                yield
+                database.close()
+
+    def _get_applied(self) -> set:
+        with db_cursor() as cur:
+            return migrations.get_applied(cur)
+
+    def test_migrate__new_database(self) -> None:
+        progress = []
+        self.assertEqual([], migrations.migrate(lambda done, total: progress.append((done, total))))
+        expected = {migration.version for migration in migrations.MIGRATIONS} | {__version__}
+        self.assertEqual(expected, self._get_applied())
+        self.assertEqual((len(migrations._CREATE), len(migrations._CREATE)), progress[-1])
+        with db_cursor() as cur:
+            cur.execute("SELECT COUNT(*) AS total FROM words;")
+            self.assertGreater(cur.fetchone()["total"], 0)
+        self.assertEqual([], migrations.migrate())
+
+    def test_migrate__legacy_database(self) -> None:
+        conn = sqlite3.connect(self.db_path)
+        conn.executescript(LEGACY_SCHEMA)
+        conn.close()
+        progress = []
+        self.assertEqual(
+            ["0.1.0", "0.1.1", "0.1.2", "0.1.3", "0.1.4", "0.1.5"],
+            migrations.migrate(lambda done, total: progress.append(done)),
+        )
+        steps = sum(len(migration.steps) for migration in migrations.MIGRATIONS[1:])
+        self.assertEqual(list(range(1, steps + 1)), progress)
+        self.assertEqual(
+            {"0.0.5", "0.1.0", "0.1.1", "0.1.2", "0.1.3", "0.1.4", "0.1.5", __version__}, self._get_applied()
+        )
+        with db_cursor() as cur:
+            cur.execute("SELECT player_id, word, date, length, max_attempts, hard FROM games;")
+            self.assertEqual(("", "coche", "20220214", 5, 6, 0), tuple(cur.fetchone()))
+            cur.execute("SELECT COUNT(*) AS total FROM words WHERE length != LENGTH(word);")
+            self.assertEqual(0, cur.fetchone()["total"])
+            cur.execute("SELECT COUNT(*) AS total FROM words WHERE difficulty IS NOT NULL;")
+            self.assertEqual(0, cur.fetchone()["total"])
+            cur.execute("SELECT pattern FROM attempts;")
+            self.assertEqual([None, None], [row["pattern"] for row in cur.fetchall()])
+            cur.execute("SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'games';")
+            indexes = {row["name"] for row in cur.fetchall()}
+        self.assertIn("idx_games_player_id_date_length", indexes)
+        self.assertNotIn("idx_games_player_id_date", indexes)
+        self.assertNotIn("idx_games_date", indexes)
+        self.assertEqual(1, business.get_stats().won)
+
+    def test_migrate__unversioned_database(self) -> None:
+        conn = sqlite3.connect(self.db_path)
+        conn.executescript(LEGACY_SCHEMA.replace("INSERT INTO versions VALUES ('0.0.5');", ""))
+        conn.execute("DROP TABLE versions;")
+        conn.close()
+        self.assertEqual(["0.0.5", "0.1.0", "0.1.1", "0.1.2", "0.1.3", "0.1.4", "0.1.5"], migrations.migrate())
+        with db_cursor() as cur:
+            cur.execute("SELECT COUNT(*) AS total FROM words;")
+            self.assertGreater(cur.fetchone()["total"], 2)
+        self.assertEqual(1, business.get_stats().played)
+
+    def test_migrate__baseline_database(self) -> None:
+        # The very first databases had just games and attempts until the dictionary was loaded
+        conn = sqlite3.connect(self.db_path)
+        conn.executescript(
+            """
+            CREATE TABLE games (id INTEGER PRIMARY KEY AUTOINCREMENT, word TEXT NOT NULL, date TEXT NOT NULL);
+            CREATE TABLE attempts (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                game_id INTEGER NOT NULL,
+                word TEXT NOT NULL,
+                match INTEGER NOT NULL
+            );
+            INSERT INTO games (word, date) VALUES ('coche', '20220214');
+            INSERT INTO attempts (game_id, word, match) VALUES (1, 'coche', 1);
+            """
+        )
+        conn.close()
+        self.assertEqual(["0.0.5", "0.1.0", "0.1.1", "0.1.2", "0.1.3", "0.1.4", "0.1.5"], migrations.migrate())
+        with db_cursor() as cur:
+            cur.execute("SELECT COUNT(*) AS total FROM words WHERE length = 5;")
+            self.assertGreater(cur.fetchone()["total"], 0)
+            cur.execute("SELECT pattern FROM attempts;")
+            self.assertIsNone(cur.fetchone()["pattern"])
+        self.assertEqual(1, business.get_stats().won)
+
+    def test_migrate__failing_migration(self) -> None:
+        conn = sqlite3.connect(self.db_path)
+        conn.executescript(LEGACY_SCHEMA)
+        conn.close()
+        broken = migrations.Migration("9.9.9", (Query.CreateStatsTable, "SELECT * FROM missing;"))
+        with mock.patch.object(migrations, "MIGRATIONS", migrations.MIGRATIONS + (broken,)):
+            self.assertRaises(DatabaseError, migrations.migrate)
+        self.assertEqual({"0.0.5"}, self._get_applied())
+        with db_cursor() as cur:
+            cur.execute(Query.TableExists, ("stats",))
+            self.assertEqual(0, cur.fetchone()["total"])
+
+    def test_migrate__concurrent(self) -> None:
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(migrations.migrate())) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual([[]] * 4, results)
+        self.assertTrue(Path(f"{self.db_path}.lock").exists())
@@ -0,0 +1,38 @@
+import unicodedata
+
+from palabros import normalization
+from tests.base import BaseTestCase
+
+
+class NormalizationTestCase(BaseTestCase):
+
+    """
+    Test case for the `palabros.normalization` module.
+    """
+
+    def test_normalize(self) -> None:
+        text = "ánfora murciélago níscalo camión baúl zarigüeya"
+        expected = "anfora murcielago niscalo camion baul zarigueya"
+        self.assertNotEqual(text, normalization.normalize(text))
+        self.assertEqual(expected, normalization.normalize(text))
+
+    def test_normalize__uppercase(self) -> None:
+        self.assertEqual("arbol", normalization.normalize("ÁRBOL"))
+        self.assertEqual("pinguino", normalization.normalize("PINGÜINO"))
+        self.assertEqual("leche", normalization.normalize("Leche"))
+
+    def test_normalize__keep_enye(self) -> None:
+        self.assertEqual("señor", normalization.normalize("señor"))
+        self.assertEqual("ñandu", normalization.normalize("ÑANDÚ"))
+
+    def test_normalize__decomposed(self) -> None:
+        self.assertEqual("ñandu", normalization.normalize(unicodedata.normalize("NFD", "Ñandú")))
+        self.assertEqual("arbol", normalization.normalize("ＡＲＢＯＬ"))
+        self.assertEqual("fiesta", normalization.normalize("ﬁesta"))
+        self.assertEqual("cafe", normalization.normalize("cafè"))
+
+    def test_normalize_batch(self) -> None:
+        words = ["ÁRBOL", "leche", unicodedata.normalize("NFD", "señal"), "PINGÜINO", "ＡＲＢＯＬ"]
+        self.assertEqual([normalization.normalize(word) for word in words], normalization.normalize_batch(words))
+        self.assertEqual(["arbol", "leche"], normalization.normalize_batch(iter(["árbol", "leche"])))
+        self.assertEqual([], normalization.normalize_batch([]))
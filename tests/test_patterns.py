@@ -0,0 +1,69 @@
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from palabros import database, dictionary, patterns, scoring
+from tests.base import WORDS, BaseTestCase
+
+
+@pytest.mark.usefixtures("init_database")
+class PatternsTestCase(BaseTestCase):
+
+    """
+    Test case for the `palabros.patterns` module.
+    """
+
+    def test_get_matrix(self) -> None:
+        matrix = patterns.get_matrix(5)
+        self.assertEqual(len(WORDS), len(matrix))
+        for i, guess in enumerate(matrix.words):
+            row = matrix.row(i)
+            for j, answer in enumerate(matrix.words):
+                self.assertEqual(scoring.score(answer, guess), matrix.get(guess, answer))
+                self.assertEqual(scoring.score(answer, guess), row[j])
+        self.assertIs(matrix, patterns.get_matrix(5))
+        copy = pickle.loads(pickle.dumps(matrix))
+        self.assertIsNone(copy.path)
+        self.assertEqual(matrix.words, copy.words)
+        self.assertEqual(bytes(matrix.row(0)), bytes(copy.row(0)))
+
+    def test_get_matrix__file(self) -> None:
+        with tempfile.TemporaryDirectory() as path:
+            db_path = Path(path).joinpath("games.db")
+            with mock.patch.dict(os.environ, {"PALABROS_DB_PATH": str(db_path)}):
+                try:
+                    database.init()
+                    matrix = patterns.get_matrix(5)
+                    self.assertTrue(Path(f"{db_path}.patterns-5.bin").exists())
+                    self.assertEqual(len(matrix) ** 2, Path(f"{db_path}.patterns-5.bin").stat().st_size)
+
+                    # A new word is appended, reusing the patterns of the existing ones
+                    database.populate_words([("zzzzz", 0.0)])
+                    dictionary.invalidate()
+                    with mock.patch.object(patterns, "SeedLanes", wraps=scoring.SeedLanes) as lanes:
+                        updated = patterns.get_matrix(5)
+                        self.assertEqual(["zzzzz"], list(lanes.call_args_list[-1].args[0]))
+                    self.assertEqual(matrix.words + ("zzzzz",), updated.words)
+                    for guess in ("sobre", "zzzzz"):
+                        for answer in ("sobre", "entre", "zzzzz"):
+                            self.assertEqual(scoring.score(answer, guess), updated.get(guess, answer))
+
+                    # A fresh process maps the stored matrix instead of building it again
+                    patterns._cache.clear()
+                    with mock.patch.object(patterns, "_build") as build:
+                        self.assertEqual(updated.words, patterns.get_matrix(5).words)
+                        build.assert_not_called()
+
+                    # Sent to another process, it's mapped again from the very same file
+                    copy = pickle.loads(pickle.dumps(updated))
+                    self.assertEqual(updated.path, copy.path)
+                    self.assertEqual(updated.get("zzzzz", "sobre"), copy.get("zzzzz", "sobre"))
+                    copy.close()
+                finally:
+                    database.close()
+                    dictionary.invalidate()
+                    patterns._cache.clear()
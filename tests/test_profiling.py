@@ -0,0 +1,82 @@
+import io
+import json
+import sqlite3
+from typing import List
+
+import pytest
+
+from palabros import business, profiling
+from palabros.database import db_cursor
+from palabros.profiling import Event
+from palabros.queries import Query
+from palabros.schemas import DEFAULT_PLAYER, MAX_ATTEMPTS
+from tests.base import WORDS, BaseTestCase
+
+
+@pytest.mark.usefixtures("init_database")
+class ProfilingTestCase(BaseTestCase):
+
+    """
+    Test case for the `palabros.profiling` module.
+    """
+
+    def setUp(self) -> None:
+        self.events: List[Event] = []
+        self.unsubscribe = profiling.subscribe(self.events.append)
+
+    def tearDown(self) -> None:
+        self.unsubscribe()
+
+    def test_subscribe(self) -> None:
+        self.assertTrue(profiling.is_enabled())
+        self.unsubscribe()
+        self.assertFalse(profiling.is_enabled())
+        with db_cursor() as cur:
+            self.assertIsInstance(cur, sqlite3.Cursor)
+            cur.execute(Query.GetWords)
+        self.assertEqual([], self.events)
+
+    def test_db_cursor(self) -> None:
+        with db_cursor() as cur:
+            self.assertIsInstance(cur, profiling.ProfiledCursor)
+            cur.execute(Query.GetWords)
+            rows = cur.fetchall()
+            cur.execute(Query.CreateGameIfNotExists, (DEFAULT_PLAYER, WORDS[0], "20220214", MAX_ATTEMPTS, False))
+            self.assertGreater(cur.lastrowid, 0)
+            self.assertEqual(len(WORDS), len(list(cur.execute(Query.GetWords))))
+            cur.execute("SELECT 1;")
+        self.assertEqual(len(WORDS), len(rows))
+        self.assertEqual(
+            [
+                ("query", "GetWords", None),
+                ("fetch", "GetWords", len(WORDS)),
+                ("query", "CreateGameIfNotExists", 1),
+                ("query", "GetWords", None),
+                ("fetch", "GetWords", len(WORDS)),
+                ("query", "sql", None),
+            ],
+            [(event.kind, event.name, event.rows) for event in self.events],
+        )
+
+    def test_timed(self) -> None:
+        business.check_word(WORDS[0])
+        self.assertIn(("call", "business.check_word"), [(event.kind, event.name) for event in self.events])
+        self.assertTrue(all(event.elapsed >= 0 for event in self.events))
+
+    def test_summary(self) -> None:
+        summary = profiling.Summary()
+        summary(Event("query", "GetWords", 0.002, None))
+        summary(Event("fetch", "GetWords", 0.001, 5))
+        summary(Event("fetch", "GetWords", 0.003, 5))
+        entries = summary.get_entries()
+        self.assertEqual(
+            {"kind": "fetch", "name": "GetWords", "calls": 2, "total_ms": 4.0, "mean_ms": 2.0, "rows": 10},
+            entries[0],
+        )
+        f = io.StringIO()
+        summary.write(f, "json")
+        self.assertEqual(entries, [json.loads(line) for line in f.getvalue().splitlines()])
+        f = io.StringIO()
+        summary.write(f)
+        self.assertIn("GetWords", f.getvalue())
+        self.assertEqual(3, len(f.getvalue().strip().splitlines()))
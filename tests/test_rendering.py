@@ -0,0 +1,53 @@
+import io
+
+from rich.console import Console
+
+from palabros import rendering
+from palabros.schemas import Attempt, Game
+from palabros.scoring import ABSENT, MISSPLACED, VALID, encode
+from tests.base import BaseTestCase
+
+
+class RenderingTestCase(BaseTestCase):
+
+    """
+    Test case for the `palabros.rendering` module.
+    """
+
+    def setUp(self) -> None:
+        self.console = rendering._console
+        rendering._console = Console(file=io.StringIO(), force_terminal=True, width=80)
+        rendering._render.cache_clear()
+        pattern = encode([VALID, MISSPLACED, ABSENT, ABSENT, ABSENT])
+        self.game = Game(1, "lecho", "20220214", [Attempt(1, "léche", False, pattern=pattern)])
+
+    def tearDown(self) -> None:
+        rendering._console = self.console
+
+    def test_get_cell(self) -> None:
+        self.assertIs(rendering.get_cell("A", VALID), rendering.get_cell("A", VALID))
+        self.assertIsNot(rendering.get_cell("A", VALID), rendering.get_cell("A", ABSENT))
+
+    def test_print_board(self) -> None:
+        rendering.print_board(self.game)
+        rendering.print_board(Game(2, "mundo", "20220215", list(self.game.attempts)))
+        output = rendering.get_console().file.getvalue()
+        self.assertEqual(2, output.count("┏"))
+        self.assertEqual(output[: len(output) // 2], output[len(output) // 2 :])
+        self.assertEqual(1, rendering._render.cache_info().hits)
+
+    def test_render_plain(self) -> None:
+        expected = "[L] (E)  C   H   E \n" + "\n".join([" ·   ·   ·   ·   · "] * 5)
+        self.assertEqual(expected, rendering.render_plain(self.game))
+
+    def test_render_plain__ansi(self) -> None:
+        result = rendering.render_plain(self.game, ansi=True).splitlines()
+        self.assertEqual(6, len(result))
+        self.assertTrue(result[0].startswith("\x1b[1;30;42m L \x1b[0m \x1b[1;30;43m E \x1b[0m"))
+
+    def test_render_plain__variant(self) -> None:
+        game = Game(3, "perros", "20220214", [], max_attempts=8)
+        result = rendering.render_plain(game).splitlines()
+        self.assertEqual(8, len(result))
+        self.assertEqual(6, result[0].count("·"))
+        self.assertNotEqual(rendering.get_board_key(game), rendering.get_board_key(Game(4, "mundo", "20220214", [])))
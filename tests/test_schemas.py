@@ -1,4 +1,5 @@
 from palabros import schemas
+from palabros.scoring import ABSENT, MISSPLACED, VALID, encode
 from tests.base import BaseTestCase
 
 
@@ -29,3 +30,38 @@ class GameSchemaTestCase(BaseTestCase):
             game.attempts.append(schemas.Attempt(i, "", False))
             expected = game.max_attempts - i - 1
             self.assertEqual(expected, game.get_attempts_left())
+
+    def test_slots(self) -> None:
+        game = schemas.Game(1, "", "")
+        self.assertFalse(hasattr(game, "__dict__"))
+        self.assertRaises(AttributeError, setattr, game, "unknown", 1)
+        self.assertEqual(schemas.Game(1, "", ""), game)
+
+
+class AttemptSchemaTestCase(BaseTestCase):
+
+    """
+    Test case for the `palabros.schemas.Attempt` class.
+    """
+
+    def test_chars(self) -> None:
+        attempt = schemas.Attempt(1, "léche", False, pattern=encode([VALID, MISSPLACED, ABSENT, ABSENT, ABSENT]))
+        expected = [
+            schemas.CharInspection("L", 0, True, False),
+            schemas.CharInspection("E", 1, False, True),
+            schemas.CharInspection("C", 2),
+            schemas.CharInspection("H", 3),
+            schemas.CharInspection("E", 4),
+        ]
+        self.assertEqual(expected, attempt.chars)
+        self.assertFalse(hasattr(attempt, "__dict__"))
+
+    def test_chars__given(self) -> None:
+        pattern = encode([VALID, MISSPLACED, ABSENT, ABSENT, VALID])
+        chars = schemas.Attempt(1, "leche", False, pattern=pattern).chars
+        attempt = schemas.Attempt(1, "leche", False, chars=list(reversed(chars)))
+        self.assertEqual(schemas.Attempt(1, "leche", False, pattern=pattern), attempt)
+        self.assertEqual(chars, attempt.chars)
+        self.assertEqual(0, schemas.Attempt(1, "leche", False, chars=[]).pattern)
+        # The former fourth positional argument was `chars`, so nothing is taken positionally beyond `match`
+        self.assertRaises(TypeError, schemas.Attempt, 1, "leche", False, chars)
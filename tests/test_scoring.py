@@ -0,0 +1,67 @@
+import random
+from collections import Counter
+from typing import Tuple
+
+from palabros import scoring
+from tests.base import WORDS, BaseTestCase
+
+
+def _reference_states(seed: str, word: str) -> Tuple[int, ...]:
+    occurrences = Counter(seed)
+    states = []
+    for i, char in enumerate(word):
+        state = scoring.ABSENT
+        if char in seed and occurrences[char] > 0:
+            state = scoring.VALID if seed[i] == char else scoring.MISSPLACED
+            occurrences[char] -= 1
+        states.append(state)
+    return tuple(states)
+
+
+class ScoringTestCase(BaseTestCase):
+
+    """
+    Test case for the `palabros.scoring` module.
+    """
+
+    def test_score(self) -> None:
+        result = scoring.score("coche", "leche")
+        self.assertEqual(
+            (scoring.ABSENT, scoring.MISSPLACED, scoring.VALID, scoring.VALID, scoring.ABSENT),
+            scoring.decode(result, 5),
+        )
+
+    def test_score__match(self) -> None:
+        for word in WORDS:
+            self.assertEqual(scoring.get_match_pattern(5), scoring.score(word, word))
+
+    def test_score__reference(self) -> None:
+        rnd = random.Random(0)
+        for _ in range(1000):
+            seed = "".join(rnd.choices("abcde", k=5))
+            word = "".join(rnd.choices("abcde", k=5))
+            self.assertEqual(_reference_states(seed, word), scoring.decode(scoring.score(seed, word), 5))
+
+    def test_score_batch(self) -> None:
+        seeds = [seed for seed in WORDS for _ in WORDS]
+        words = [word for _ in WORDS for word in WORDS]
+        expected = [scoring.score(seed, word) for seed, word in zip(seeds, words)]
+        self.assertEqual(expected, scoring.score_batch(seeds, words))
+
+    def test_score_batch__mixed(self) -> None:
+        # Dense groups go through seed lanes, sparse ones pair by pair, and words of other lengths are scored too
+        rnd = random.Random(0)
+        dense = [("coche", word) for word in WORDS] * 4 + [("perros", "parras"), ("perros", "señora")] * 8
+        sparse = [("".join(rnd.choices("abcdefg", k=7)), "".join(rnd.choices("abcdefg", k=7))) for _ in range(50)]
+        pairs = dense + sparse + [("coche", "cochera")]
+        seeds, words = [seed for seed, _ in pairs], [word for _, word in pairs]
+        expected = [scoring.score(seed, word) for seed, word in pairs]
+        self.assertEqual(expected, scoring.score_batch(seeds, words))
+        self.assertEqual(expected[:20], scoring.score_batch(seeds[:20], words[:20]))
+
+    def test_score_batch__wrong_sizes(self) -> None:
+        self.assertRaises(ValueError, scoring.score_batch, WORDS, WORDS[1:])
+
+    def test_encode(self) -> None:
+        for pattern in range(3**5):
+            self.assertEqual(pattern, scoring.encode(scoring.decode(pattern, 5)))
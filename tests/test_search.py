@@ -0,0 +1,53 @@
+import pytest
+
+from palabros import dictionary, search
+from palabros.errors import GameError
+from palabros.storage import get_storage
+from tests.base import WORDS, BaseTestCase
+
+
+@pytest.mark.usefixtures("init_database")
+class SearchTestCase(BaseTestCase):
+
+    """
+    Test case for the `palabros.search` module.
+    """
+
+    def test_parse_pattern(self) -> None:
+        self.assertEqual(("c", None, "c", None, "e"), search.parse_pattern("C?C_É"))
+        self.assertEqual(("ñ", None), search.parse_pattern("ñ."))
+        for pattern in ("", "c1", "c c", "c*"):
+            self.assertRaises(GameError, search.parse_pattern, pattern)
+
+    def test_search(self) -> None:
+        # Ranked by frequency, the most frequent first
+        self.assertEqual(search.SearchResult(list(reversed(WORDS)), len(WORDS)), search.search("?????"))
+        self.assertEqual(["leche", "coche"], search.search("???he").words)
+        self.assertEqual(["coche"], search.search("c?c?e").words)
+        self.assertEqual(["huevo", "mundo"], search.search("????o", has="u").words)
+        self.assertEqual(["mundo"], search.search("????o", excluded="h").words)
+        self.assertEqual(["mayor", "mundo"], search.search("?????", has="o", excluded="hv").words)
+
+    def test_search__counts(self) -> None:
+        # A letter given several times must appear at least that many times
+        self.assertEqual(["leche"], search.search("?????", has="ee").words)
+        self.assertEqual(["coche"], search.search("?????", has="cc").words)
+        self.assertEqual([], search.search("?????", has="eee").words)
+        self.assertEqual(["mayor"], search.search("?????", excluded="ceu").words)
+
+    def test_search__limit(self) -> None:
+        result = search.search("?????", limit=2)
+        self.assertEqual(["huevo", "mayor"], result.words)
+        self.assertEqual(len(WORDS), result.total)
+        self.assertEqual(search.SearchResult([], 0), search.search("??????"))
+        self.assertRaises(GameError, search.search, "?????", has="1")
+
+    def test_get_index(self) -> None:
+        index = search.get_index(5)
+        self.assertIs(index, search.get_index(5))
+        self.assertEqual(len(WORDS), len(index))
+        # A new dictionary version builds the index again
+        get_storage().add_words([("perro", 10.0)])
+        dictionary.invalidate()
+        self.assertIsNot(index, search.get_index(5))
+        self.assertEqual(["perro", "mayor"], search.search("?????", has="r").words)
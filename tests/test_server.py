@@ -0,0 +1,139 @@
+import asyncio
+import json
+from http import HTTPStatus
+from typing import Any, Dict, Tuple
+from unittest import mock
+
+import pytest
+
+from palabros import business
+from palabros.server import MAX_HEADERS, MAX_HEADERS_SIZE, Server
+from palabros.storage import get_storage
+from tests.base import WORDS, BaseTestCase
+
+
+@pytest.mark.usefixtures("init_database")
+class ServerTestCase(BaseTestCase):
+
+    """
+    Test case for the `palabros.server` module.
+    """
+
+    def setUp(self) -> None:
+        self.server = Server(workers=2)
+
+    def tearDown(self) -> None:
+        self.server._executor.shutdown(wait=True)
+
+    def _dispatch(self, method: str, target: str, body: Any = None) -> Tuple[HTTPStatus, Dict[str, Any]]:
+        data = json.dumps(body).encode() if body is not None else b""
+        return asyncio.run(self.server.dispatch(method, target, data))
+
+    def test_dispatch__get_game(self) -> None:
+        status, payload = self._dispatch("GET", "/players/alice/game")
+        self.assertEqual(HTTPStatus.OK, status)
+        self.assertIsNone(payload["word"])
+        self.assertFalse(payload["finished"])
+        self.assertEqual(6, payload["attempts_left"])
+        self.assertEqual([], payload["attempts"])
+
+    def test_dispatch__play(self) -> None:
+        game = business.get_current_game(player_id="alice")
+        word = next(w for w in WORDS if w != game.word)
+        status, payload = self._dispatch("POST", "/players/alice/attempts", {"word": word})
+        self.assertEqual(HTTPStatus.CREATED, status)
+        self.assertEqual(5, payload["attempts_left"])
+        self.assertEqual(word, payload["attempts"][0]["word"])
+        self.assertEqual(5, len(payload["attempts"][0]["chars"]))
+
+    def test_dispatch__play_unknown_word(self) -> None:
+        status, payload = self._dispatch("POST", "/players/alice/attempts", {"word": "zzzzz"})
+        self.assertEqual(HTTPStatus.UNPROCESSABLE_ENTITY, status)
+        self.assertNotIn("[", payload["message"])
+
+    def test_dispatch__play_new_word(self) -> None:
+        # Words loaded while the server runs are found on the next attempt
+        self.assertEqual(
+            HTTPStatus.UNPROCESSABLE_ENTITY, self._dispatch("POST", "/players/alice/attempts", {"word": "zzzzz"})[0]
+        )
+        get_storage().add_words([("zzzzz", 0.0)])
+        self.assertEqual(HTTPStatus.CREATED, self._dispatch("POST", "/players/alice/attempts", {"word": "zzzzz"})[0])
+
+    def test_dispatch__play_bad_body(self) -> None:
+        status, _ = self._dispatch("POST", "/players/alice/attempts", ["coche"])
+        self.assertEqual(HTTPStatus.BAD_REQUEST, status)
+
+    def test_dispatch__play_finished_game(self) -> None:
+        game = business.get_current_game(player_id="alice")
+        status, payload = self._dispatch("POST", "/players/alice/attempts", {"word": game.word})
+        self.assertEqual(HTTPStatus.CREATED, status)
+        self.assertTrue(payload["won"])
+        self.assertEqual(game.word, payload["word"])
+        status, _ = self._dispatch("POST", "/players/alice/attempts", {"word": game.word})
+        self.assertEqual(HTTPStatus.CONFLICT, status)
+        status, payload = self._dispatch("GET", "/players/bob/game")
+        self.assertEqual(HTTPStatus.OK, status)
+        self.assertFalse(payload["finished"])
+
+    def test_dispatch__play_locks(self) -> None:
+        async def play() -> None:
+            await asyncio.gather(
+                *(self.server.dispatch("POST", f"/players/p{i}/attempts", b'{"word": "coche"}') for i in range(20))
+            )
+            self.assertEqual(0, len(self.server._locks))
+
+        asyncio.run(play())
+
+    def test_dispatch__results(self) -> None:
+        game = business.get_current_game(player_id="alice")
+        status, payload = self._dispatch("GET", f"/players/alice/results?date={game.date}")
+        self.assertEqual(HTTPStatus.OK, status)
+        self.assertEqual(game.date, payload["game"]["date"])
+        self.assertEqual(0, payload["stats"]["played"])
+        status, _ = self._dispatch("GET", "/players/alice/results?date=2022")
+        self.assertEqual(HTTPStatus.BAD_REQUEST, status)
+
+    def test_dispatch__unhandled_error(self) -> None:
+        with mock.patch.object(business, "get_current_game", side_effect=RuntimeError("boom")):
+            with self.assertLogs("palabros.server", level="ERROR"):
+                status, payload = self._dispatch("GET", "/players/alice/game")
+        self.assertEqual(HTTPStatus.INTERNAL_SERVER_ERROR, status)
+        self.assertEqual("palabros.internalError", payload["code"])
+
+    def _request(self, data: bytes) -> bytes:
+        async def request() -> bytes:
+            server = await asyncio.start_server(self.server.handle, "127.0.0.1", 0, limit=MAX_HEADERS_SIZE)
+            async with server:
+                port = server.sockets[0].getsockname()[1]
+                reader, writer = await asyncio.open_connection("127.0.0.1", port)
+                writer.write(data)
+                response = await reader.read()
+                writer.close()
+                return response
+
+        return asyncio.run(request())
+
+    def test_handle__bad_content_length(self) -> None:
+        response = self._request(b"POST /players/alice/attempts HTTP/1.1\r\nContent-Length: abc\r\n\r\n")
+        self.assertTrue(response.startswith(b"HTTP/1.1 400 Bad Request\r\n"))
+        self.assertIn(b"Connection: close", response)
+
+    def test_handle__headers_too_large(self) -> None:
+        request_line = b"GET /players/alice/game HTTP/1.1\r\n"
+        too_many = b"".join(b"X-%d: 1\r\n" % i for i in range(MAX_HEADERS + 1))
+        too_big = b"".join(b"X-%d: %s\r\n" % (i, b"a" * 1000) for i in range(MAX_HEADERS_SIZE // 1000 + 1))
+        too_long = b"X-Long: %s\r\n" % (b"a" * MAX_HEADERS_SIZE)
+        for headers in (too_many, too_big, too_long):
+            response = self._request(request_line + headers + b"\r\n")
+            self.assertTrue(response.startswith(b"HTTP/1.1 431 Request Header Fields Too Large\r\n"))
+            self.assertIn(b"Connection: close", response)
+        response = self._request(request_line + b"X-1: 1\r\n" * MAX_HEADERS + b"Connection: close\r\n\r\n")
+        self.assertEqual(b"HTTP/1.1 431", response[:12])
+        response = self._request(request_line + b"X-1: 1\r\n" * (MAX_HEADERS - 1) + b"Connection: close\r\n\r\n")
+        self.assertTrue(response.startswith(b"HTTP/1.1 200 OK\r\n"))
+
+    def test_dispatch__not_found(self) -> None:
+        status, _ = self._dispatch("GET", "/games")
+        self.assertEqual(HTTPStatus.NOT_FOUND, status)
+        status, _ = self._dispatch("DELETE", "/players/alice/game")
+        self.assertEqual(HTTPStatus.METHOD_NOT_ALLOWED, status)
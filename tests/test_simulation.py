@@ -0,0 +1,55 @@
+import pytest
+
+from palabros import simulation
+from palabros.errors import GameError
+from tests.base import WORDS, BaseTestCase
+
+
+@pytest.mark.usefixtures("init_database")
+class SimulationTestCase(BaseTestCase):
+
+    """
+    Test case for the `palabros.simulation` module.
+    """
+
+    def test_simulate(self) -> None:
+        report = simulation.simulate(5, chunk_size=2, workers=1)
+        self.assertEqual("frequency", report.strategy)
+        self.assertEqual(len(WORDS), report.words)
+        self.assertEqual(len(WORDS), sum(report.distribution.values()) + len(report.failed))
+        # The most frequent word is always the first guess
+        self.assertEqual(1, report.distribution[1])
+        self.assertEqual(0.0, report.get_failure_rate())
+        self.assertGreater(report.get_mean_guesses(), 1)
+        self.assertGreater(report.get_words_per_second_per_core(), 0)
+
+    def test_simulate__workers(self) -> None:
+        for strategy in simulation.STRATEGIES:
+            expected = simulation.simulate(5, strategy, workers=1, seed=7)
+            report = simulation.simulate(5, strategy, workers=2, chunk_size=1, seed=7)
+            self.assertEqual(2, report.workers)
+            self.assertEqual(expected.distribution, report.distribution)
+            self.assertEqual(expected.failed, report.failed)
+
+    def test_simulate__attempts(self) -> None:
+        report = simulation.simulate(5, max_attempts=1, workers=1)
+        self.assertEqual({1: 1}, report.distribution)
+        self.assertEqual(tuple(sorted(WORDS[:-1])), report.failed)
+        self.assertEqual(0.8, report.get_failure_rate())
+
+    def test_simulate__limit(self) -> None:
+        report = simulation.simulate(5, workers=1, limit=2)
+        self.assertEqual(2, report.words)
+        self.assertEqual(2, sum(report.distribution.values()) + len(report.failed))
+
+    def test_simulate__errors(self) -> None:
+        with self.assertRaises(GameError):
+            simulation.simulate(5, "unknown")
+        with self.assertRaises(GameError):
+            simulation.simulate(6)
+
+    def test_get_guesses(self) -> None:
+        for strategy in simulation.STRATEGIES:
+            guesses = simulation.get_guesses(5, strategy, workers=1)
+            self.assertEqual(set(WORDS), set(guesses))
+            self.assertTrue(all(1 <= total <= len(WORDS) for total in guesses.values()))
@@ -0,0 +1,100 @@
+import math
+import tempfile
+from collections import Counter
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from palabros import dictionary, patterns, scoring, solver
+from palabros.storage import get_storage
+from tests.base import WORDS, BaseTestCase
+
+
+@pytest.mark.usefixtures("init_database")
+class SolverTestCase(BaseTestCase):
+
+    """
+    Test case for the `palabros.solver` module.
+    """
+
+    def test_get_members(self) -> None:
+        matrix = patterns.get_matrix(5)
+        mask = solver.get_full_mask(matrix)
+        self.assertEqual(list(range(len(WORDS))), solver.get_members(matrix, mask))
+        self.assertEqual(len(WORDS), solver.count_members(mask))
+
+    def test_filter_candidates(self) -> None:
+        matrix = patterns.get_matrix(5)
+        for guess in WORDS + ["movil"]:
+            for answer in WORDS:
+                pattern = scoring.score(answer, guess)
+                mask = solver.filter_candidates(matrix, solver.get_full_mask(matrix), guess, pattern)
+                expected = [w for w in matrix.words if scoring.score(w, guess) == pattern]
+                self.assertEqual(expected, [matrix.words[i] for i in solver.get_members(matrix, mask)])
+
+    def test_filter_attempts(self) -> None:
+        matrix = patterns.get_matrix(5)
+        attempts = [("mundo", scoring.score("coche", "mundo")), ("leche", scoring.score("coche", "leche"))]
+        mask = solver.filter_attempts(matrix, attempts)
+        self.assertEqual(["coche"], [matrix.words[i] for i in solver.get_members(matrix, mask)])
+
+    def test_rank_guesses(self) -> None:
+        matrix = patterns.get_matrix(5)
+        frequencies = {word: i for i, word in enumerate(WORDS)}
+        result = solver.rank_guesses(matrix, solver.get_full_mask(matrix), frequencies, limit=3)
+        self.assertEqual(3, len(result))
+        entropies = [suggestion.entropy for suggestion in result]
+        self.assertEqual(sorted(entropies, reverse=True), entropies)
+        self.assertEqual([], solver.rank_guesses(matrix, 0, frequencies))
+
+    def test_rank_guesses__exact(self) -> None:
+        # Up to the sample size, the entropy is computed over every candidate
+        matrix = patterns.get_matrix(5)
+        frequencies = {word: 1.0 for word in WORDS}
+        result = solver.rank_guesses(matrix, solver.get_full_mask(matrix), frequencies, limit=len(WORDS))
+        for suggestion in result:
+            buckets = Counter(scoring.score(answer, suggestion.word) for answer in WORDS)
+            expected = -sum(n / len(WORDS) * math.log2(n / len(WORDS)) for n in buckets.values())
+            self.assertAlmostEqual(expected, suggestion.entropy)
+
+    def test_rank_guesses__rebuilt_matrix(self) -> None:
+        matrix = patterns.get_matrix(5)
+        solver.clear_cache()
+        solver.rank_guesses(matrix, solver.get_full_mask(matrix), {})
+        self.assertEqual(1, solver._rank.cache_info().currsize)
+        get_storage().add_words([("perro", 0.5)])
+        dictionary.refresh()
+        self.assertIsNot(matrix, patterns.get_matrix(5))
+        self.assertEqual(0, solver._rank.cache_info().currsize)
+
+    def test_rank_guesses__opening(self) -> None:
+        matrix = patterns.get_matrix(5)
+        mask = solver.get_full_mask(matrix)
+        frequencies = {word: i for i, word in enumerate(WORDS)}
+        with tempfile.TemporaryDirectory() as path:
+            opening_path = Path(path).joinpath("games.db.opening-5.json")
+            with mock.patch.object(solver, "get_sidecar_path", return_value=opening_path):
+                solver.clear_cache()
+                expected = solver.rank_guesses(matrix, mask, frequencies, limit=3)
+                self.assertTrue(opening_path.exists())
+                # Later runs read the stored ranking, unless the frequencies changed
+                solver.clear_cache()
+                with mock.patch.object(solver, "_rank", side_effect=AssertionError):
+                    self.assertEqual(expected, solver.rank_guesses(matrix, mask, frequencies, limit=3))
+                    self.assertRaises(AssertionError, solver.rank_guesses, matrix, mask, {})
+                solver.clear_cache()
+                self.assertEqual(expected, solver.rank_guesses(matrix, mask, frequencies, limit=3))
+        self.assertEqual(
+            expected, list(solver._rank(matrix, mask, tuple(frequencies[w] for w in matrix.words), 3, None))
+        )
+
+    def test_rank_guesses__allowed(self) -> None:
+        matrix = patterns.get_matrix(5)
+        frequencies = {word: i for i, word in enumerate(WORDS)}
+        mask = solver.get_mask(matrix, [0, 1, 2])
+        self.assertEqual([0, 1, 2], solver.get_members(matrix, mask))
+        allowed = solver.get_mask(matrix, [4])
+        result = solver.rank_guesses(matrix, mask, frequencies, limit=10, allowed=allowed)
+        # The candidates can always be guessed
+        self.assertEqual({matrix.words[i] for i in (0, 1, 2, 4)}, {suggestion.word for suggestion in result})
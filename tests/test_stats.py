@@ -0,0 +1,94 @@
+import pytest
+
+from palabros import stats
+from palabros.database import db_cursor, db_transaction
+from palabros.queries import Query
+from palabros.schemas import DEFAULT_PLAYER, MAX_ATTEMPTS, Stats
+from tests.base import WORDS, BaseTestCase
+
+GAMES = [
+    ("20220201", True, 3),
+    ("20220202", True, 1),
+    ("20220203", False, 6),
+    ("20220204", True, 4),
+    ("20220206", True, 4),
+    ("20220207", True, 2),
+]
+
+
+@pytest.mark.usefixtures("init_database")
+class StatsTestCase(BaseTestCase):
+
+    """
+    Test case for the `palabros.stats` module.
+    """
+
+    def test_record(self) -> None:
+        with db_transaction() as cur:
+            for date, won, attempts in GAMES:
+                stats.record(cur, date, won, attempts)
+        with db_cursor() as cur:
+            result = stats.read(cur)
+        self.assertEqual(Stats(6, 5, 2, 2, "20220207", {1: 1, 2: 1, 3: 1, 4: 2}), result)
+        self.assertEqual(5 / 6, result.get_win_rate())
+
+    def test_record__same_date(self) -> None:
+        # Games of several word lengths on the same date count once in the streak
+        with db_transaction() as cur:
+            for date, attempts in [("20220201", 3), ("20220202", 7), ("20220202", 2), ("20220203", 4)]:
+                stats.record(cur, date, True, attempts)
+        with db_cursor() as cur:
+            result = stats.read(cur)
+        self.assertEqual(Stats(4, 4, 3, 3, "20220203", {2: 1, 3: 1, 4: 1, 7: 1}), result)
+
+    def test_rebuild(self) -> None:
+        with db_transaction() as cur:
+            for i, (date, won, attempts) in enumerate(GAMES):
+                cur.execute(
+                    Query.CreateGameIfNotExists, (DEFAULT_PLAYER, WORDS[i % len(WORDS)], date, MAX_ATTEMPTS, False)
+                )
+                game_id = cur.lastrowid
+                for j in range(attempts):
+                    cur.execute(Query.CreateAttempt, (game_id, "", won and j == attempts - 1, None))
+            # An ongoing game doesn't count
+            cur.execute(Query.CreateGameIfNotExists, (DEFAULT_PLAYER, WORDS[0], "20220208", MAX_ATTEMPTS, False))
+            stats.rebuild(cur)
+        with db_cursor() as cur:
+            result = stats.read(cur)
+        self.assertEqual(Stats(6, 5, 2, 2, "20220207", {1: 1, 2: 1, 3: 1, 4: 2}), result)
+
+    def test_rebuild__same_date(self) -> None:
+        # The games of a date are replayed in the order they were created: lost and then won
+        with db_transaction() as cur:
+            for word, date, won in (
+                ("coche", "20220201", True),
+                ("leche", "20220202", False),
+                ("huevos", "20220202", True),
+            ):
+                cur.execute(Query.CreateGameIfNotExists, (DEFAULT_PLAYER, word, date, 1, False))
+                cur.execute(Query.CreateAttempt, (cur.lastrowid, word, won, None))
+            stats.rebuild(cur)
+        with db_cursor() as cur:
+            result = stats.read(cur)
+        self.assertEqual((3, 2, 1, 1), (result.played, result.won, result.current_streak, result.max_streak))
+
+    def test_record__per_player(self) -> None:
+        with db_transaction() as cur:
+            stats.record(cur, "20220201", True, 3, "alice")
+            stats.record(cur, "20220201", False, 6)
+            cur.execute(Query.CreateGameIfNotExists, (DEFAULT_PLAYER, WORDS[0], "20220201", MAX_ATTEMPTS, False))
+            stats.rebuild(cur)
+        with db_cursor() as cur:
+            self.assertEqual(Stats(), stats.read(cur))
+            self.assertEqual(Stats(), stats.read(cur, "alice"))
+        with db_transaction() as cur:
+            cur.execute(Query.CreateGameIfNotExists, ("alice", WORDS[0], "20220202", 6, False))
+            cur.execute(Query.CreateAttempt, (cur.lastrowid, WORDS[0], True, None))
+            stats.rebuild(cur)
+        with db_cursor() as cur:
+            self.assertEqual(Stats(), stats.read(cur))
+            self.assertEqual(Stats(1, 1, 1, 1, "20220202", {1: 1}), stats.read(cur, "alice"))
+
+    def test_read__empty(self) -> None:
+        with db_cursor() as cur:
+            self.assertEqual(Stats(), stats.read(cur))
@@ -0,0 +1,90 @@
+import os
+from unittest import mock
+
+import pytest
+
+from palabros import __version__, storage
+from palabros.errors import DatabaseError
+from palabros.memory import MemoryStorage
+from palabros.migrations import MIGRATIONS
+from palabros.schemas import Attempt, Game
+from palabros.scoring import get_match_pattern
+from tests.base import WORDS, BaseTestCase
+
+
+@pytest.mark.usefixtures("init_database")
+class StorageTestCase(BaseTestCase):
+
+    """
+    Test case for the `palabros.storage` module.
+    """
+
+    def test_get_backend(self) -> None:
+        with mock.patch.dict(os.environ):
+            del os.environ[storage.ENV_VAR]
+            self.assertEqual("sqlite", storage.get_backend())
+            self.assertIsInstance(storage.get_storage(), storage.SQLiteStorage)
+            os.environ["PALABROS_DB_PATH"] = ":memory:"
+            self.assertEqual("memory", storage.get_backend())
+            self.assertIsInstance(storage.get_storage(), MemoryStorage)
+            self.assertIs(storage.get_storage(), storage.get_storage())
+            os.environ[storage.ENV_VAR] = "unknown"
+            self.assertRaises(DatabaseError, storage.get_backend)
+
+    def test_get_seed_candidates(self) -> None:
+        # Both backends read the same words, in the same order
+        store = MemoryStorage()
+        store.add_words((w, i) for i, w in enumerate(WORDS))
+        for backend in (storage.get_storage(), store):
+            backend.set_difficulties([("coche", 2), ("mundo", 2), ("mayor", 1)])
+            backend.create_game("", "20220214", "mayor")
+            self.assertEqual(list(reversed(WORDS)), [word for word, _ in backend.get_words(5)])
+            self.assertEqual([5], backend.get_word_lengths())
+            self.assertEqual(["huevo", "mundo"], backend.get_seed_candidates(5, 2))
+            self.assertEqual(["mundo", "coche"], backend.get_seed_candidates(5, 3, (1, 2)))
+            self.assertEqual([], backend.get_seed_candidates(5, 3, (3, 5)))
+            self.assertEqual("mayor", backend.get_word_by_date("20220214", 5))
+            self.assertIsNone(backend.get_word_by_date("20220214", 6))
+
+    def test_get_words_revision(self) -> None:
+        for backend in (storage.get_storage(), MemoryStorage()):
+            revision = backend.get_words_revision()
+            backend.set_difficulties([("coche", 2)])
+            self.assertEqual(revision, backend.get_words_revision())
+            backend.add_words([("perros", 1.0)])
+            self.assertGreater(backend.get_words_revision(), revision)
+
+    def test_rebuild_stats__same_date(self) -> None:
+        # Both backends replay the games of a date in the order they were created: lost and then won
+        games = [
+            Game(0, "coche", "20220201", [Attempt(0, "coche", True, pattern=get_match_pattern(5))], max_attempts=1),
+            Game(0, "leche", "20220202", [Attempt(0, "mundo", False)], max_attempts=1),
+            Game(0, "huevos", "20220202", [Attempt(0, "huevos", True, pattern=get_match_pattern(6))], max_attempts=1),
+        ]
+        for backend in (storage.get_storage(), MemoryStorage()):
+            self.assertEqual([1, 2, 3], [game.id for game in backend.add_games(games)])
+            self.assertEqual([], backend.add_games(games[:1]))
+            backend.rebuild_stats()
+            result = backend.get_stats("")
+            self.assertEqual((3, 2, 1, 1), (result.played, result.won, result.current_streak, result.max_streak))
+            self.assertEqual([game.word for game in games], [game.word for game in backend.get_games()])
+
+    def test_memory_storage(self) -> None:
+        store = MemoryStorage()
+        store.init()
+        self.assertEqual({migration.version for migration in MIGRATIONS} | {__version__}, store.get_versions())
+        self.assertGreater(len(store.get_words(5)), 1000)
+        game = store.create_game("alice", "20220214", "perro", hard=True)
+        self.assertEqual(game, store.create_game("alice", "20220214", "gatos"))
+        self.assertEqual(1, store.add_attempt(game, "perro", True, get_match_pattern(5), True))
+        # Games are copies, which don't change when attempts are added
+        self.assertEqual([], game.attempts)
+        result = store.get_game("alice", "20220214", 5)
+        self.assertEqual(["perro"], [attempt.word for attempt in result.attempts])
+        self.assertTrue(result.hard)
+        self.assertEqual({1: 1}, store.get_stats("alice").distribution)
+        self.assertEqual(0, store.get_stats("bob").played)
+        self.assertRaises(DatabaseError, store.add_attempt, Game(9, "perro", "20220214"), "perro", False, 0, False)
+        store.close()
+        self.assertEqual(set(), store.get_versions())
+        self.assertIsNone(store.get_game("alice", "20220214", 5))
@@ -0,0 +1,58 @@
+import threading
+
+import pytest
+
+from palabros import business
+from palabros.database import db_cursor
+from palabros.errors import DatabaseError
+from palabros.schemas import Game
+from palabros.writer import AttemptWriter
+from tests.base import WORDS, BaseTestCase
+
+
+@pytest.mark.usefixtures("init_database")
+class WriterTestCase(BaseTestCase):
+
+    """
+    Test case for the `palabros.writer` module.
+    """
+
+    def setUp(self) -> None:
+        self.writer = AttemptWriter(max_batch_size=4)
+
+    def tearDown(self) -> None:
+        self.writer.close()
+
+    def test_write(self) -> None:
+        game = business.get_current_game()
+        attempt_id = self.writer.write(game, WORDS[0], False, 0, False)
+        with db_cursor() as cur:
+            cur.execute("SELECT game_id, word FROM attempts WHERE id = ?;", (attempt_id,))
+            self.assertEqual((game.id, WORDS[0]), tuple(cur.fetchone()))
+
+    def test_write__concurrent(self) -> None:
+        games = [business.get_current_game(player_id=f"player-{i}") for i in range(10)]
+        ids = []
+        threads = [
+            threading.Thread(target=lambda game=game: ids.append(self.writer.write(game, game.word, True, 242, True)))
+            for game in games
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(10, len(set(ids)))
+        for game in games:
+            self.assertEqual(1, business.get_stats(game.player_id).won)
+
+    def test_write__failing_attempt(self) -> None:
+        game = business.get_current_game()
+        self.assertRaises(DatabaseError, self.writer.write, game, None, False, 0, False)
+        self.assertIsInstance(self.writer.write(game, WORDS[0], False, 0, False), int)
+        self.assertEqual(1, len(business.get_current_game().attempts))
+
+    def test_close(self) -> None:
+        self.writer.close()
+        self.assertFalse(self.writer._thread.is_alive())
+        self.writer = AttemptWriter()
+        self.assertIsInstance(self.writer.write(Game(1, WORDS[0], "20220214"), WORDS[1], False, 0, False), int)